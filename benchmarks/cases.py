@@ -0,0 +1,187 @@
+import os
+import struct
+import psutil
+import main
+import metrics
+import headless
+from history import History
+from collector import Collector, flatten
+from providers import LinuxProvider, smbios_memory_device
+from harness import case
+from fakes import FakeSnapshots, cpuinfo_text
+
+# Caminhos quentes medidos pelo run.py. Cada setup recebe o número de
+# chamadas e devolve a função medida; o ambiente (QApplication offscreen,
+# provider falso, NVML falso) já foi montado pelo run.py.
+
+CORES = psutil.cpu_count() or 1
+
+# nomes reais de vários fabricantes/gerações, para os ramos do detect_*
+CPU_NAMES = (
+	"Intel(R) Core(TM) i9-14900K",
+	"Intel(R) Core(TM) i7-12700H",
+	"Intel(R) Core(TM) i5-8400 CPU @ 2.80GHz",
+	"Intel(R) Core(TM) Ultra 7 155H",
+	"Intel(R) Xeon(R) Gold 6338 CPU @ 2.00GHz",
+	"Intel(R) Pentium(R) Gold G6400",
+	"AMD Ryzen 9 7950X 16-Core Processor",
+	"AMD Ryzen 5 3600 6-Core Processor",
+	"AMD Ryzen 7 5800X3D 8-Core Processor",
+	"AMD Ryzen Threadripper PRO 5995WX",
+	"AMD EPYC 7763 64-Core Processor",
+	"AMD FX(tm)-8350 Eight-Core Processor",
+	"Apple M2",
+)
+
+def snapshots(iterations):
+	# prontos antes da medição: gerar o snapshot não entra no tempo.
+	# Sobra para o aquecimento e a passada do tracemalloc
+	make = FakeSnapshots(CORES)
+	return iter([make() for _ in range(iterations + iterations // 5 + 10)])
+
+def wait_until(condition, timeout=10.0):
+	# resultados do WorkerPool chegam por sinal: precisa rodar o loop de eventos
+	import time
+	from PyQt6.QtWidgets import QApplication
+	deadline = time.monotonic() + timeout
+	while not condition():
+		if time.monotonic() > deadline:
+			raise TimeoutError("background task did not finish")
+		QApplication.processEvents()
+		time.sleep(0.005)
+
+@case("BenchTab.update_usage", 2000)
+def bench_update_usage(iterations):
+	tab = main.BenchTab()
+	tab.resize(1000, 700)
+	wait_until(lambda: tab.disk_keys)
+	snaps = snapshots(iterations)
+	return lambda: tab.update_usage(next(snaps))
+
+@case("MemoryTab.update_memory", 5000)
+def memory_update(iterations):
+	tab = main.MemoryTab()
+	wait_until(lambda: tab.ram_info is not None)
+	snaps = snapshots(iterations)
+	return lambda: tab.update_memory(next(snaps))
+
+@case("CPUTab.update_dynamic", 5000)
+def cpu_update(iterations):
+	tab = main.CPUTab()
+	snaps = snapshots(iterations)
+	return lambda: tab.update_dynamic(next(snaps))
+
+@case("detect_cpu_info", 2000)
+def detect_cpu_info(iterations):
+	def run():
+		for name in CPU_NAMES:
+			main.detect_cpu_info(name)
+	return run
+
+@case("detect_generation", 2000)
+def detect_generation(iterations):
+	def run():
+		for name in CPU_NAMES:
+			main.detect_generation(name)
+	return run
+
+@case("build_stylesheet", 5000)
+def build_stylesheet(iterations):
+	return main.build_stylesheet
+
+def painter(widget):
+	# repaint() no offscreen não chama o paintEvent (não há exposição);
+	# render() chama na hora, com o mesmo QPainter(self) redirecionado
+	from PyQt6.QtGui import QPixmap
+	target = QPixmap(widget.size())
+	return lambda: widget.render(target)
+
+def usage_graph(points, window):
+	graph = main.UsageGraph(History(), window)
+	graph.resize(800, 200)
+	now = 0.0
+	for i in range(points):
+		now += 1.0
+		graph.history.append((i * 7) % 100, now)
+	return graph, now
+
+@case("UsageGraph.paintEvent (new point)", 2000)
+def usage_graph_scroll(iterations):
+	# o caso comum: um ponto novo por tick, a imagem só desloca
+	graph, now = usage_graph(120, 60)
+	paint = painter(graph)
+	state = {"now": now}
+	def run():
+		state["now"] += 1.0
+		graph.history.append(state["now"] % 100, state["now"])
+		paint()
+	return run
+
+@case("UsageGraph.paintEvent (full, 1 h)", 600, rounds=30)
+def usage_graph_full(iterations):
+	# redesenho inteiro: troca de janela, resize, card selecionado.
+	# Superfície pequena e fixa: o custo fica nos pontos e na polyline, não em
+	# rasterizar 800x200 antialiased, que varia muito de uma execução para outra
+	graph, _ = usage_graph(3600, 3600)
+	graph.resize(400, 100)
+	paint = painter(graph)
+	def run():
+		graph.cache_key = None
+		paint()
+	return run
+
+@case("CoreHeatmap.paintEvent", 1000)
+def heatmap_paint(iterations):
+	heatmap = main.CoreHeatmap()
+	heatmap.resize(800, 200)
+	make = FakeSnapshots(CORES)
+	for _ in range(300):
+		heatmap.add_sample(make())
+	return painter(heatmap)
+
+@case("Collector.sample (host psutil)", 300, compare=False)
+def collector_sample(iterations):
+	# psutil de verdade, como no Sampler: depende da máquina e da carga dela,
+	# então só aparece no relatório
+	collector = Collector()
+	return collector.sample
+
+@case("headless jsonl row", 5000)
+def headless_row(iterations):
+	class Null:
+		header = ""
+		def write(self, text):
+			pass
+	writer = headless.JsonlFormat(Null())
+	snaps = snapshots(iterations)
+	return lambda: writer.write(flatten(next(snaps)))
+
+@case("metrics.render", 2000)
+def metrics_render(iterations):
+	gpus = main.gpu_sampler.sample()
+	slow = {"disks": {"/": 41.5, "/home": 73.2, "/boot": 12.0}}
+	snaps = snapshots(iterations)
+	return lambda: metrics.render(next(snaps), slow, gpus)
+
+@case("LinuxProvider /proc/cpuinfo (64 CPUs)", 300)
+def provider_cpuinfo(iterations):
+	import tempfile
+	root = tempfile.mkdtemp(prefix="pch-bench-")
+	os.makedirs(os.path.join(root, "proc"))
+	with open(os.path.join(root, "proc", "cpuinfo"), "w") as f:
+		f.write(cpuinfo_text(64))
+	# provider novo a cada chamada: mede leitura + parse, sem o cache
+	return lambda: LinuxProvider(root).query("processor")
+
+@case("smbios_memory_device", 5000)
+def smbios_parse(iterations):
+	raw = bytearray(0x5C)
+	raw[0] = 17
+	raw[1] = 0x5C
+	struct.pack_into("<H", raw, 0x0C, 16384)
+	raw[0x10], raw[0x11], raw[0x12], raw[0x17], raw[0x18], raw[0x1A] = 1, 2, 34, 3, 4, 5
+	struct.pack_into("<H", raw, 0x15, 6000)
+	struct.pack_into("<H", raw, 0x20, 6000)
+	raw += b"DIMM_A1\0BANK 0\0Kingston\0" b"12345678\0KF560C36-16\0\0"
+	raw = bytes(raw)
+	return lambda: smbios_memory_device(raw)
@@ -0,0 +1,151 @@
+import random
+from types import SimpleNamespace
+from collections import namedtuple
+from providers import record
+
+# Hardware falso para os benchmarks: um provider com os mesmos registros do
+# WMI/Linux, um módulo NVML com várias GPUs e snapshots no formato do Collector.
+# Tudo determinístico (seed fixa), para as medições serem comparáveis.
+
+scpufreq = namedtuple("scpufreq", "current min max")
+scpustats = namedtuple("scpustats", "ctx_switches interrupts soft_interrupts syscalls")
+svmem = namedtuple("svmem", "total available percent used free")
+snetio = namedtuple("snetio", "bytes_sent bytes_recv packets_sent packets_recv errin errout dropin dropout")
+sdiskio = namedtuple("sdiskio", "read_count write_count read_bytes write_bytes read_time write_time busy_time")
+snicstats = namedtuple("snicstats", "isup duplex speed mtu flags")
+
+class FakeProvider:
+	name = "fake"
+
+	def __init__(self, modules=4, disks=("nvme0n1", "sda"), cpu="AMD Ryzen 9 7950X 16-Core Processor"):
+		self.cpu = cpu
+		self.records = {
+			"processor": [record(
+				"processor", Name=cpu, Manufacturer="AuthenticAMD", MaxClockSpeed=4500,
+				ExtClock=100, NumberOfCores=16, NumberOfLogicalProcessors=32, SocketDesignation="AM5",
+			)],
+			"baseboard": [record("baseboard", Manufacturer="ASUSTeK", Product="ROG STRIX X670E-E", Version="Rev 1.xx")],
+			"bios": [record("bios", Manufacturer="American Megatrends", SMBIOSBIOSVersion="1813", ReleaseDate="20231120000000.000000+000")],
+			"memory": [
+				record(
+					"memory", Capacity=str(16 * 1024**3), Speed=6000, ConfiguredClockSpeed=6000,
+					SMBIOSMemoryType=34, MemoryType=0, Manufacturer="Kingston", PartNumber="KF560C36-16",
+					SerialNumber=f"{i:08X}", DeviceLocator=f"DIMM {i}", BankLabel=f"BANK {i}",
+					FormFactor=8, DataWidth=64, TotalWidth=64, ConfiguredVoltage=1350, Status="OK",
+					Tag=f"Physical Memory {i}",
+				)
+				for i in range(modules)
+			],
+			"memory_arrays": [record("memory_arrays", MemoryDevices=4, MaxCapacity=128 * 1024**2)],
+			"disks": [
+				record("disks", Index=i, DeviceID=name, Model=f"Fake Disk {i}", Size=str(2 * 10**12), InterfaceType="NVMe")
+				for i, name in enumerate(disks)
+			],
+			"video": [record("video", Name="NVIDIA GeForce RTX 4090", AdapterRAM=24 * 1024**3)],
+		}
+
+	def query(self, kind):
+		return list(self.records[kind])
+
+	def invalidate(self):
+		pass
+
+	def cpu_name(self):
+		return self.cpu
+
+	def microcode(self):
+		return 0xA601203
+
+	def disk_io_key(self, disk):
+		return disk.DeviceID
+
+def fake_nvml(count=2):
+	# só o que o GPUSampler chama
+	utilization = namedtuple("utilization", "gpu memory")
+	memory = namedtuple("memory", "total used free")
+	state = {"tick": 0}
+
+	def load(handle):
+		state["tick"] += 1
+		return (handle * 37 + state["tick"]) % 100
+
+	return SimpleNamespace(
+		NVML_TEMPERATURE_GPU=0,
+		NVML_CLOCK_GRAPHICS=0,
+		NVML_CLOCK_MEM=2,
+		nvmlInit=lambda: None,
+		nvmlShutdown=lambda: None,
+		nvmlSystemGetDriverVersion=lambda: "550.54",
+		nvmlDeviceGetCount=lambda: count,
+		nvmlDeviceGetHandleByIndex=lambda i: i,
+		nvmlDeviceGetName=lambda h: f"Fake GPU {h}",
+		nvmlDeviceGetUUID=lambda h: f"GPU-{h:08d}",
+		nvmlDeviceGetEnforcedPowerLimit=lambda h: 450000,
+		nvmlDeviceGetDisplayActive=lambda h: h == 0,
+		nvmlDeviceGetUtilizationRates=lambda h: utilization(load(h), 20),
+		nvmlDeviceGetMemoryInfo=lambda h: memory(24 * 1024**3, 6 * 1024**3, 18 * 1024**3),
+		nvmlDeviceGetTemperature=lambda h, sensor: 60 + h,
+		nvmlDeviceGetPowerUsage=lambda h: 250000,
+		nvmlDeviceGetFanSpeed=lambda h: 40,
+		nvmlDeviceGetClockInfo=lambda h, clock: 2520 if clock == 0 else 10501,
+	)
+
+class FakeSnapshots:
+	# snapshots como os do Collector.sample(), um segundo de diferença cada
+	def __init__(self, cores, disks=("nvme0n1", "sda"), nics=("eth0", "wlan0"), seed=1):
+		self.random = random.Random(seed)
+		self.cores = cores
+		self.disks = disks
+		self.nics = nics
+		self.now = 1000.0
+		self.time = 1.7e9
+		self.counters = 0
+
+	def __call__(self):
+		rnd = self.random
+		self.now += 1.0
+		self.time += 1.0
+		self.counters += 1
+		n = self.counters
+		total = 64 * 1024**3
+		used = int(total * (0.3 + rnd.random() * 0.2))
+		return {
+			"time": self.time,
+			"monotonic": self.now,
+			"cpu_percent": rnd.random() * 100,
+			"cpu_freq": scpufreq(3000 + rnd.random() * 2500, 400.0, 5700.0),
+			"cpu_stats": scpustats(n * 25000, n * 12000, n * 8000, 0),
+			"memory": svmem(total, total - used, used * 100 / total, used, total - used),
+			"net": snetio(n * 500000, n * 2000000, n * 900, n * 1800, 0, 0, 0, 0),
+			"processes": 400 + rnd.randrange(20),
+			"cpu_percpu": [rnd.random() * 100 for _ in range(self.cores)],
+			"cpu_freq_percpu": [scpufreq(3000 + rnd.random() * 2500, 400.0, 5700.0) for _ in range(self.cores)],
+			"disk_io": {
+				name: sdiskio(n * 120, n * 80, n * 4 * 1024**2, n * 2 * 1024**2, n * 3, n * 2, n * 4)
+				for name in self.disks
+			},
+			"net_io": {
+				name: snetio(n * 250000, n * 1000000, n * 450, n * 900, 0, 0, n // 100, 0)
+				for name in self.nics
+			},
+			"net_if": {name: snicstats(True, 2, 1000, 1500, "up,broadcast,running,multicast") for name in self.nics},
+		}
+
+# /proc/cpuinfo de uma máquina com muitos núcleos, para o parser do LinuxProvider
+def cpuinfo_text(cpus=64):
+	blocks = []
+	for i in range(cpus):
+		blocks.append("\n".join((
+			f"processor\t: {i}",
+			"vendor_id\t: AuthenticAMD",
+			"cpu family\t: 25",
+			"model\t\t: 97",
+			"model name\t: AMD Ryzen 9 7950X 16-Core Processor",
+			"stepping\t: 2",
+			"microcode\t: 0xa601203",
+			"cpu MHz\t\t: 4500.000",
+			f"physical id\t: {i // 32}",
+			f"core id\t\t: {i % 16}",
+			"flags\t\t: " + " ".join(f"flag{j}" for j in range(120)),
+		)))
+	return "\n\n".join(blocks) + "\n"
@@ -0,0 +1,163 @@
+import gc
+import sys
+import json
+import time
+import platform
+import tracemalloc
+
+# Medição por chamada: p50/p99 do tempo e memória alocada (tracemalloc).
+# p50 é a mediana da melhor rodada, p99 é sobre todas as chamadas.
+# O tempo é medido sem o tracemalloc ligado (ele deixa tudo bem mais lento);
+# a memória vem de uma segunda passada, mais curta, com ele ligado.
+
+CASES = []
+
+def case(name, iterations=1000, compare=True, rounds=10):
+	# setup() devolve a função medida; cada chamada dela é uma amostra.
+	# compare=False: só informa (depende do host, não entra no código de saída);
+	# rounds: mais rodadas para chamadas longas, em que a melhor varia menos
+	def register(setup):
+		CASES.append((name, setup, iterations, compare, rounds))
+		return setup
+	return register
+
+def percentile(values, fraction):
+	values = sorted(values)
+	index = min(len(values) - 1, max(0, round(fraction * (len(values) - 1))))
+	return values[index]
+
+def calibration():
+	# trabalho fixo em Python puro: mede a velocidade da máquina no momento
+	counts = {}
+	for i in range(2000):
+		counts[i % 97] = counts.get(i % 97, 0) + i * 1.5
+	return sorted(counts.values())
+
+def speed(clock, calls=15):
+	times = []
+	for _ in range(calls):
+		started = clock()
+		calibration()
+		times.append(clock() - started)
+	return percentile(times, 0.50)
+
+def measure(fn, iterations, warmup=None, alloc_iterations=None, rounds=10):
+	warmup = max(1, iterations // 10) if warmup is None else warmup
+	for _ in range(warmup):
+		fn()
+
+	# em rodadas: a mediana da melhor rodada descarta as fases em que a
+	# máquina estava ocupada com outra coisa (frequência, outro processo...).
+	# Cada rodada também mede a calibração: p50_rel = mediana / calibração
+	# quase não muda com o clock da máquina e é o que o baseline compara
+	times = []
+	medians = []
+	relative = []
+	clock = time.perf_counter_ns
+	per_round = max(1, iterations // rounds)
+	for _ in range(rounds):
+		reference = speed(clock)
+		# o coletor de lixo fica de fora do tempo de cada chamada
+		gc.collect()
+		gc.disable()
+		try:
+			round_times = []
+			for _ in range(per_round):
+				started = clock()
+				fn()
+				round_times.append(clock() - started)
+		finally:
+			gc.enable()
+		median = percentile(round_times, 0.50)
+		reference = min(reference, speed(clock))
+		medians.append(median)
+		relative.append(median / reference)
+		times += round_times
+
+	alloc_iterations = alloc_iterations or max(1, iterations // 10)
+	peaks = []
+	tracemalloc.start()
+	try:
+		start, _ = tracemalloc.get_traced_memory()
+		for _ in range(alloc_iterations):
+			before, _ = tracemalloc.get_traced_memory()
+			tracemalloc.reset_peak()
+			fn()
+			_, peak = tracemalloc.get_traced_memory()
+			peaks.append(peak - before)
+		end, _ = tracemalloc.get_traced_memory()
+	finally:
+		tracemalloc.stop()
+
+	return {
+		"p50_us": round(min(medians) / 1000, 2),
+		"p50_rel": round(min(relative), 5),
+		"p99_us": round(percentile(times, 0.99) / 1000, 2),
+		"alloc_bytes": percentile(peaks, 0.50),
+		# o que ficou vivo depois das chamadas (histórico cresce, cache enche...)
+		"retained_bytes": max(0, end - start) // alloc_iterations,
+		"iterations": per_round * rounds,
+	}
+
+# Limites de regressão: relativo ao baseline, com um mínimo absoluto para
+# números pequenos não acusarem ruído do relógio
+DEFAULT_TOLERANCE = {
+	"p50_rel": [0.35, 0.01],
+	"p99_us": [1.50, 100.0],
+	"alloc_bytes": [0.25, 1024],
+}
+
+def machine():
+	return {
+		"python": platform.python_version(),
+		"system": platform.system(),
+		"machine": platform.machine(),
+		"processor": platform.processor(),
+	}
+
+def load_baseline(path):
+	try:
+		with open(path, "r", encoding="utf-8") as f:
+			return json.load(f)
+	except (OSError, ValueError):
+		return {"tolerance": DEFAULT_TOLERANCE, "results": {}}
+
+def save_baseline(path, baseline, results):
+	data = {
+		"tolerance": baseline.get("tolerance", DEFAULT_TOLERANCE),
+		"machine": machine(),
+		"results": results,
+	}
+	with open(path, "w", encoding="utf-8") as f:
+		json.dump(data, f, indent=4, sort_keys=True)
+		f.write("\n")
+
+def compare(result, reference, tolerance):
+	# lista de (métrica, atual, baseline) acima do limite
+	regressions = []
+	if not reference:
+		return regressions
+	for metric, (relative, absolute) in tolerance.items():
+		current = result.get(metric)
+		base = reference.get(metric)
+		if current is None or base is None:
+			continue
+		if current > base * (1 + relative) and current - base > absolute:
+			regressions.append((metric, current, base))
+	return regressions
+
+def report(name, result, reference, regressions, compared=True, out=sys.stdout):
+	base = f"{reference['p50_rel']:>10.4f}" if reference and "p50_rel" in reference else f"{'-':>10}"
+	if not compared:
+		status = "report"
+	else:
+		status = "REGRESSION" if regressions else ("ok" if reference else "new")
+	out.write(
+		f"{name:<40} {result['p50_us']:>10.2f} {result['p99_us']:>10.2f} "
+		f"{result['alloc_bytes'] / 1024:>10.1f} {result['p50_rel']:>10.4f} {base}  {status}\n"
+	)
+	for metric, current, previous in regressions:
+		out.write(f"    {metric}: {current} (baseline {previous})\n")
+
+def header(out=sys.stdout):
+	out.write(f"{'case':<40} {'p50 us':>10} {'p99 us':>10} {'alloc KiB':>10} {'p50 rel':>10} {'base rel':>10}  status\n")
@@ -0,0 +1,110 @@
+import os
+import sys
+import argparse
+import tempfile
+
+# Benchmarks dos caminhos quentes (coleta, parsers, pintura), sem hardware real:
+#
+#   python benchmarks/run.py                     compara com o baseline.json
+#   python benchmarks/run.py -k UsageGraph       só os casos com "UsageGraph" no nome
+#   python benchmarks/run.py --update-baseline   grava os números atuais como referência
+#
+# Roda no Linux com Qt offscreen, provider e NVML falsos (fakes.py).
+# Sai com código 1 se algum caso passar do limite de regressão do baseline.
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+BASELINE = os.path.join(HERE, "baseline.json")
+
+def parse_args(argv):
+	parser = argparse.ArgumentParser(prog="benchmarks/run.py")
+	parser.add_argument("-k", dest="filter", default="",
+		help="only run cases whose name contains this text")
+	parser.add_argument("--iterations", type=float, default=1.0,
+		help="multiply every case's call count (default: 1.0)")
+	parser.add_argument("--baseline", default=BASELINE,
+		help="baseline file (default: benchmarks/baseline.json)")
+	parser.add_argument("--update-baseline", action="store_true",
+		help="store this run's numbers as the new baseline")
+	parser.add_argument("--json",
+		help="also write the results to this file")
+	return parser.parse_args(argv)
+
+def setup_environment():
+	# antes de qualquer import do PyQt6
+	os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+	sys.path.insert(0, ROOT)
+	# resource_path() do main.py é relativo à pasta atual
+	os.chdir(ROOT)
+
+	import main
+	import fakes
+	from gpu import GPUSampler
+	from inventory import Inventory, CpuInfoCache
+	from PyQt6.QtWidgets import QApplication
+
+	# os mesmos globais que o __main__ do main.py cria
+	app = QApplication([sys.argv[0]])
+	folder = tempfile.mkdtemp(prefix="pch-bench-")
+	provider = fakes.FakeProvider()
+	main.theme = main.ThemeManager()
+	main.sampler = main.Sampler()
+	main.workers = main.WorkerPool()
+	main.threads = main.TaskThreads()
+	main.gpu_sampler = GPUSampler(nvml=fakes.fake_nvml(2))
+	main.inventory = Inventory(provider, os.path.join(folder, "inventory.json"), refresh=True)
+	main.cpu_cache = CpuInfoCache(os.path.join(folder, "cpuinfo.json"), main.cpu_fingerprint(provider))
+	# cpuinfo.get_cpu_info() leva segundos: o cache já começa preenchido
+	main.cpu_cache.store({"brand_raw": provider.cpu, "family": 25, "model": 97, "stepping": 2})
+	return app
+
+def main(argv):
+	args = parse_args(argv)
+	app = setup_environment()
+
+	import json
+	import harness
+	import cases
+
+	baseline = harness.load_baseline(args.baseline)
+	tolerance = baseline.get("tolerance", harness.DEFAULT_TOLERANCE)
+	references = baseline.get("results", {})
+	results = dict(references) if args.update_baseline else {}
+	failed = 0
+
+	harness.header()
+	for name, setup, iterations, compare, rounds in harness.CASES:
+		if args.filter and args.filter not in name:
+			continue
+		iterations = max(10, int(iterations * args.iterations))
+		try:
+			fn = setup(iterations)
+			result = harness.measure(fn, iterations, rounds=rounds)
+		except Exception as e:
+			print(f"{name:<40} error: {e}")
+			failed += 1
+			continue
+		results[name] = result
+		reference = references.get(name)
+		regressions = []
+		if compare and not args.update_baseline:
+			regressions = harness.compare(result, reference, tolerance)
+		failed += bool(regressions)
+		harness.report(name, result, reference, regressions, compared=compare)
+
+	main_module = sys.modules["main"]
+	main_module.threads.shutdown()
+	main_module.workers.shutdown()
+	main_module.gpu_sampler.close()
+
+	if args.json:
+		with open(args.json, "w", encoding="utf-8") as f:
+			json.dump({"machine": harness.machine(), "results": results}, f, indent=4)
+	if args.update_baseline:
+		harness.save_baseline(args.baseline, baseline, results)
+		print("baseline saved:", args.baseline)
+		return 0
+	return 1 if failed else 0
+
+if __name__ == "__main__":
+	sys.exit(main(sys.argv[1:]))
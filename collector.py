@@ -0,0 +1,195 @@
+import time
+import psutil
+from collections import namedtuple
+
+# Coleta única por tick: todas as abas recebem o mesmo snapshot,
+# em vez de cada uma chamar psutil por conta própria.
+class Collector:
+	def __init__(self, process_interval=0.0, percpu=True, perdisk=True, pernic=True, nic_interval=5.0):
+		# cpu_percent(interval=None) compara com a chamada anterior,
+		# a primeira leitura sempre volta 0.0
+		psutil.cpu_percent()
+		# por núcleo (mapa de calor); o psutil guarda o estado separado do total
+		self.percpu = percpu
+		if percpu:
+			psutil.cpu_percent(percpu=True)
+		self.perdisk = perdisk
+		# por placa de rede; o estado das placas (ligada, velocidade do link)
+		# muda pouco e é relido só a cada nic_interval segundos
+		self.pernic = pernic
+		self.nic_interval = nic_interval
+		self.nic_stats = {}
+		self.nic_time = None
+		# listar os processos é a leitura mais cara do tick; em taxas
+		# altas (modo headless) a contagem pode ser refeita só a cada N segundos
+		self.process_interval = process_interval
+		self.process_count = 0
+		self.process_time = None
+
+	def processes(self, now):
+		if self.process_time is None or now - self.process_time >= self.process_interval:
+			self.process_count = len(psutil.pids())
+			self.process_time = now
+		return self.process_count
+
+	def nics(self, now):
+		if self.nic_time is None or now - self.nic_time >= self.nic_interval:
+			try:
+				self.nic_stats = psutil.net_if_stats()
+			except OSError as e:
+				print("network error:", e)
+			self.nic_time = now
+		return self.nic_stats
+
+	def sample(self):
+		now = time.monotonic()
+		snap = {
+			"time": time.time(),
+			"monotonic": now,
+			"cpu_percent": psutil.cpu_percent(),
+			"cpu_freq": psutil.cpu_freq(),
+			"cpu_stats": psutil.cpu_stats(),
+			"memory": psutil.virtual_memory(),
+			"net": psutil.net_io_counters(),
+			"processes": self.processes(now),
+		}
+		if self.percpu:
+			snap["cpu_percpu"] = psutil.cpu_percent(percpu=True)
+			snap["cpu_freq_percpu"] = psutil.cpu_freq(percpu=True)
+		if self.perdisk:
+			# chaves: PhysicalDrive0... no Windows, sda/nvme0n1... no Linux
+			snap["disk_io"] = psutil.disk_io_counters(perdisk=True) or {}
+		if self.pernic:
+			# nowrap=False: a volta dos contadores é tratada em NetRates
+			snap["net_io"] = psutil.net_io_counters(pernic=True, nowrap=False)
+			snap["net_if"] = self.nics(now)
+		return snap
+
+DiskRate = namedtuple("DiskRate", "read write iops busy")
+
+# Vazão por disco físico a partir de dois snapshots seguidos (relógio monotônico).
+# read/write em bytes/s, iops em operações/s, busy em % do intervalo.
+class DiskRates:
+	def __init__(self):
+		self.last = None
+		self.last_time = None
+
+	def update(self, counters, now):
+		rates = {}
+		if self.last is not None and now > self.last_time:
+			elapsed = now - self.last_time
+			for name, c in counters.items():
+				p = self.last.get(name)
+				if p is None:
+					continue
+				# contador zerado (disco removido e recolocado) não vira taxa negativa
+				read = max(0, c.read_bytes - p.read_bytes) / elapsed
+				write = max(0, c.write_bytes - p.write_bytes) / elapsed
+				ops = max(0, c.read_count + c.write_count - p.read_count - p.write_count) / elapsed
+				# busy_time só existe no Linux/BSD; no Windows a soma dos tempos
+				# de leitura e escrita é a melhor aproximação
+				if hasattr(c, "busy_time"):
+					busy = c.busy_time - p.busy_time
+				else:
+					busy = c.read_time + c.write_time - p.read_time - p.write_time
+				busy = min(100.0, max(0, busy) / (elapsed * 1000) * 100)
+				rates[name] = DiskRate(read, write, ops, busy)
+		self.last = counters
+		self.last_time = now
+		return rates
+
+NetRate = namedtuple("NetRate", "sent recv packets errors usage")
+
+# contadores de 32 bits (drivers antigos no Windows) voltam a zero a cada 4 GiB
+COUNTER_WRAP = 2**32
+
+def counter_delta(current, previous):
+	if current >= previous:
+		return current - previous
+	# deu a volta: só se o anterior cabia em 32 bits e o salto é plausível;
+	# senão a placa foi reiniciada e o contador recomeçou do zero
+	wrapped = current + COUNTER_WRAP - previous
+	if previous < COUNTER_WRAP and wrapped < COUNTER_WRAP // 2:
+		return wrapped
+	return current
+
+def active_nic(name, stats):
+	# ligada e sem ser loopback
+	if stats is None or not stats.isup:
+		return False
+	if "loopback" in getattr(stats, "flags", "") or name == "lo" or name.lower().startswith("loopback"):
+		return False
+	return True
+
+# Vazão por placa de rede a partir de dois snapshots seguidos (relógio monotônico).
+# sent/recv em bytes/s, packets em pacotes/s, errors = erros + descartes no intervalo,
+# usage em % da velocidade do link (None quando o driver não informa a velocidade).
+class NetRates:
+	def __init__(self):
+		self.last = None
+		self.last_time = None
+
+	def update(self, counters, stats, now):
+		rates = {}
+		if self.last is not None and now > self.last_time:
+			elapsed = now - self.last_time
+			for name, c in counters.items():
+				p = self.last.get(name)
+				st = stats.get(name)
+				# placas que nunca passaram tráfego (adaptadores virtuais) ficam de fora
+				if p is None or not active_nic(name, st) or not (c.bytes_sent or c.bytes_recv):
+					continue
+				sent = counter_delta(c.bytes_sent, p.bytes_sent) / elapsed
+				recv = counter_delta(c.bytes_recv, p.bytes_recv) / elapsed
+				packets = (
+					counter_delta(c.packets_sent, p.packets_sent)
+					+ counter_delta(c.packets_recv, p.packets_recv)
+				) / elapsed
+				errors = sum(
+					counter_delta(getattr(c, field), getattr(p, field))
+					for field in ("errin", "errout", "dropin", "dropout")
+				)
+				# speed vem em Mbit/s; conta o sentido mais carregado (full duplex)
+				usage = None
+				if st.speed:
+					usage = min(100.0, max(sent, recv) * 8 / (st.speed * 1e6) * 100)
+				rates[name] = NetRate(sent, recv, packets, errors, usage)
+		self.last = counters
+		self.last_time = now
+		return rates
+
+# Colunas fixas de um snapshot, na ordem em que são gravadas (CSV/JSONL)
+FIELDS = (
+	"time",
+	"cpu_percent",
+	"cpu_freq_mhz",
+	"ctx_switches",
+	"interrupts",
+	"mem_total",
+	"mem_used",
+	"mem_available",
+	"mem_percent",
+	"net_bytes_sent",
+	"net_bytes_recv",
+	"processes",
+)
+
+def flatten(snap):
+	freq = snap["cpu_freq"]
+	stats = snap["cpu_stats"]
+	mem = snap["memory"]
+	net = snap["net"]
+	return {
+		"time": round(snap["time"], 3),
+		"cpu_percent": snap["cpu_percent"],
+		"cpu_freq_mhz": round(freq.current) if freq else None,
+		"ctx_switches": stats.ctx_switches,
+		"interrupts": stats.interrupts,
+		"mem_total": mem.total,
+		"mem_used": mem.used,
+		"mem_available": mem.available,
+		"mem_percent": mem.percent,
+		"net_bytes_sent": net.bytes_sent if net else None,
+		"net_bytes_recv": net.bytes_recv if net else None,
+		"processes": snap["processes"],
+	}
@@ -0,0 +1,177 @@
+import os
+import math
+import time
+import hashlib
+import threading
+from concurrent.futures import ProcessPoolExecutor, wait
+
+# Benchmark de CPU do BenchTab: três kernels determinísticos (inteiros,
+# ponto flutuante, hash), primeiro um processo por vez e depois um por
+# núcleo lógico num ProcessPoolExecutor.
+#
+# Com fork (padrão no Linux) os processos herdam o app já carregado. Com
+# spawn (Windows, macOS) cada processo reimporta o main.py como __mp_main__,
+# com PyQt6 e tudo: um custo de inicialização por processo, fora do tempo
+# medido (o pool é aquecido antes). No executável empacotado o
+# freeze_support() no topo do main.py devolve o processo antes dos imports.
+#
+# O resultado de cada kernel é um checksum: todas as execuções precisam
+# dar o mesmo valor, senão a CPU errou a conta (overclock instável).
+
+def integer_kernel(n):
+	# xorshift32 + resto da divisão: ALU e divisor inteiro
+	x = 0x9E3779B9
+	total = 0
+	for i in range(n):
+		x ^= (x << 13) & 0xFFFFFFFF
+		x ^= x >> 17
+		x ^= (x << 5) & 0xFFFFFFFF
+		total = (total + x % (i | 1)) & 0xFFFFFFFF
+	return total
+
+def float_kernel(n):
+	# mapa logístico + sqrt/sin: FPU e libm
+	x = 0.5
+	total = 0.0
+	for i in range(1, n + 1):
+		x = 3.9 * x * (1.0 - x)
+		total += math.sqrt(x) / i + math.sin(x * i) * 1e-3
+	return total.hex()
+
+HASH_BLOCK = bytes(range(256)) * 256
+
+def hash_kernel(n):
+	# SHA-256 de 64 KiB por volta: extensões SHA/AVX e cache
+	digest = hashlib.sha256()
+	for i in range(n):
+		digest.update(HASH_BLOCK)
+		digest.update(i.to_bytes(4, "little"))
+	return digest.hexdigest()
+
+KERNELS = {
+	"integer": integer_kernel,
+	"float": float_kernel,
+	"hash": hash_kernel,
+}
+
+# trabalho por tarefa: ~0.3 s num núcleo da máquina de referência
+WORK = {"integer": 600_000, "float": 1_000_000, "hash": 5_000}
+
+# unidades/s de um núcleo que vale 1000 pontos (a máquina em que a
+# pontuação foi calibrada); o score é a média geométrica dos três kernels
+REFERENCE = {"integer": 2.0e6, "float": 3.4e6, "hash": 1.7e4}
+
+def run_task(kernel, work):
+	started = time.perf_counter()
+	checksum = KERNELS[kernel](work)
+	return checksum, time.perf_counter() - started
+
+def warm_up():
+	# força o executor a criar todos os processos antes de medir
+	time.sleep(0.05)
+	return os.getpid()
+
+def score(rates):
+	logs = [math.log(rates[kernel] / REFERENCE[kernel]) for kernel in KERNELS]
+	return 1000 * math.exp(sum(logs) / len(logs))
+
+class Cancelled(Exception):
+	pass
+
+class CpuBenchmark:
+	def __init__(self, workers=None, repeats=3, work=None):
+		self.workers = workers or os.cpu_count() or 1
+		self.repeats = repeats
+		self.work = dict(work or WORK)
+		self.phase = None
+		self.done = 0
+		self.total = len(KERNELS) * (repeats + self.workers)
+		self.cancelled = threading.Event()
+		# clocks vistos pelo sampler em cada fase (MHz)
+		self.clocks = {"single": [], "multi": []}
+
+	def progress(self):
+		return self.done / self.total
+
+	def observe(self, snap):
+		# chamado pela interface a cada amostra enquanto o benchmark roda
+		freq = snap.get("cpu_freq")
+		if self.phase in self.clocks and freq:
+			self.clocks[self.phase].append(freq.current)
+
+	def cancel(self):
+		self.cancelled.set()
+
+	def finished(self, future):
+		self.done += 1
+
+	def results(self, futures, kernel):
+		if self.cancelled.is_set():
+			raise Cancelled()
+		values = [future.result() for future in futures]
+		checksums = {checksum for checksum, _ in values}
+		if len(checksums) != 1:
+			raise ValueError(f"{kernel} kernel returned different results")
+		return values
+
+	def run(self):
+		started = time.perf_counter()
+		single = {}
+		multi = {}
+		pool = ProcessPoolExecutor(max_workers=self.workers)
+		try:
+			self.phase = "start"
+			wait([pool.submit(warm_up) for _ in range(self.workers)])
+
+			# um núcleo: melhor de N execuções, uma de cada vez
+			self.phase = "single"
+			for kernel, work in self.work.items():
+				futures = []
+				for _ in range(self.repeats):
+					if self.cancelled.is_set():
+						raise Cancelled()
+					future = pool.submit(run_task, kernel, work)
+					future.add_done_callback(self.finished)
+					wait([future])
+					futures.append(future)
+				values = self.results(futures, kernel)
+				single[kernel] = work / min(seconds for _, seconds in values)
+
+			# todos os núcleos: uma tarefa por processo, tempo de parede do lote
+			self.phase = "multi"
+			for kernel, work in self.work.items():
+				if self.cancelled.is_set():
+					raise Cancelled()
+				batch = time.perf_counter()
+				futures = [pool.submit(run_task, kernel, work) for _ in range(self.workers)]
+				for future in futures:
+					future.add_done_callback(self.finished)
+				wait(futures)
+				elapsed = time.perf_counter() - batch
+				self.results(futures, kernel)
+				multi[kernel] = work * self.workers / elapsed
+		except Cancelled:
+			return None
+		finally:
+			self.phase = None
+			pool.shutdown(wait=True, cancel_futures=True)
+
+		single_score = score(single)
+		multi_score = score(multi)
+
+		def clocks(values):
+			if not values:
+				return None
+			return {"min": min(values), "avg": sum(values) / len(values), "max": max(values)}
+
+		return {
+			"workers": self.workers,
+			"single_score": round(single_score),
+			"multi_score": round(multi_score),
+			# 100% = o lote com N processos rendeu N vezes um núcleo sozinho
+			"scaling": multi_score / (single_score * self.workers) * 100,
+			"single": single,
+			"multi": multi,
+			"clocks": {phase: clocks(values) for phase, values in self.clocks.items()},
+			"seconds": time.perf_counter() - started,
+		}
@@ -0,0 +1,316 @@
+import os
+import io
+import sys
+import json
+import mmap
+import time
+import random
+import tempfile
+import threading
+import psutil
+
+# Benchmark de disco do BenchTab: leitura/escrita sequencial (MB/s) e
+# leitura/escrita aleatória de 4 KiB (IOPS) em várias profundidades de fila,
+# num arquivo temporário na pasta escolhida.
+#
+# Para medir o disco e não o cache do sistema:
+#   - Linux: O_DIRECT; macOS: F_NOCACHE; Windows: FILE_FLAG_NO_BUFFERING +
+#     FILE_FLAG_WRITE_THROUGH (CreateFileW via ctypes)
+#   - buffers de mmap anônimo, alinhados na página como o O_DIRECT exige,
+#     com dados aleatórios (SSDs que comprimem não ganham de graça)
+#   - sem E/S direta (tmpfs, alguns sistemas de arquivos), fsync entra no
+#     tempo e o cache do arquivo é descartado (posix_fadvise) entre as fases
+#
+# A fila é feita com threads: cada uma tem o seu descritor e faz E/S
+# bloqueante (o GIL é liberado), então N threads = N pedidos pendentes.
+
+MiB = 1024**2
+BLOCK = MiB
+SMALL = 4096
+DEPTHS = (1, 4, 16, 32)
+
+GENERIC_READ = 0x80000000
+GENERIC_WRITE = 0x40000000
+FILE_SHARE_READ = 0x1
+FILE_SHARE_WRITE = 0x2
+CREATE_ALWAYS = 2
+OPEN_EXISTING = 3
+FILE_FLAG_NO_BUFFERING = 0x20000000
+FILE_FLAG_WRITE_THROUGH = 0x80000000
+
+def open_windows(path, create):
+	import ctypes
+	import msvcrt
+	from ctypes import wintypes
+	kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+	kernel32.CreateFileW.restype = wintypes.HANDLE
+	kernel32.CreateFileW.argtypes = (
+		wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD, wintypes.LPVOID,
+		wintypes.DWORD, wintypes.DWORD, wintypes.HANDLE,
+	)
+	handle = kernel32.CreateFileW(
+		path, GENERIC_READ | GENERIC_WRITE, FILE_SHARE_READ | FILE_SHARE_WRITE, None,
+		CREATE_ALWAYS if create else OPEN_EXISTING,
+		FILE_FLAG_NO_BUFFERING | FILE_FLAG_WRITE_THROUGH, None
+	)
+	if handle is None or handle == wintypes.HANDLE(-1).value:
+		raise ctypes.WinError(ctypes.get_last_error())
+	return msvcrt.open_osfhandle(handle, os.O_RDWR | os.O_BINARY)
+
+def open_file(path, create=False):
+	# (descritor, E/S direta?)
+	if sys.platform == "win32":
+		try:
+			return open_windows(path, create), True
+		except OSError as e:
+			print("disk benchmark error:", e)
+	flags = os.O_RDWR | getattr(os, "O_BINARY", 0)
+	if create:
+		flags |= os.O_CREAT | os.O_TRUNC
+	direct = getattr(os, "O_DIRECT", 0)
+	if direct:
+		try:
+			return os.open(path, flags | direct), True
+		except OSError:
+			pass
+	fd = os.open(path, flags)
+	if sys.platform == "darwin":
+		import fcntl
+		fcntl.fcntl(fd, getattr(fcntl, "F_NOCACHE", 48), 1)
+		return fd, True
+	return fd, False
+
+def drop_cache(fd):
+	os.fsync(fd)
+	if hasattr(os, "posix_fadvise"):
+		os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
+def aligned_buffer(size):
+	buffer = mmap.mmap(-1, size)
+	buffer.write(os.urandom(size))
+	return buffer
+
+def disk_name(device):
+	# partição -> disco (chave do disk_io_counters). Só no Linux, pelo /sys; senão None
+	if not sys.platform.startswith("linux"):
+		return None
+	path = os.path.realpath(os.path.join("/sys/class/block", os.path.basename(device)))
+	if not os.path.exists(path):
+		return None
+	if os.path.exists(os.path.join(path, "partition")):
+		path = os.path.dirname(path)
+	return os.path.basename(path)
+
+def folder_partition(folder):
+	# partição da pasta: o ponto de montagem mais longo que a contém
+	# (all=True para achar tmpfs e afins, senão /tmp cairia na raiz)
+	folder = os.path.normcase(os.path.realpath(folder))
+	best = None
+	for part in psutil.disk_partitions(all=True):
+		mount = os.path.normcase(part.mountpoint)
+		try:
+			inside = os.path.commonpath([folder, mount]) == mount
+		except ValueError:
+			# outra unidade no Windows
+			inside = False
+		if inside and (best is None or len(mount) > len(best.mountpoint)):
+			best = part
+	return best
+
+def disk_folder(key):
+	# pasta gravável num ponto de montagem do disco; sem achar, a pasta temporária
+	if key:
+		for part in psutil.disk_partitions():
+			if disk_name(part.device) == key and os.access(part.mountpoint, os.W_OK):
+				return part.mountpoint
+	return tempfile.gettempdir()
+
+class Cancelled(Exception):
+	pass
+
+class DiskBenchmark:
+	def __init__(self, folder, size=1024 * MiB, depths=DEPTHS, duration=3.0):
+		self.folder = folder
+		# onde o arquivo vai parar de verdade: é a chave para comparar execuções.
+		# disk: o disco da partição, quando dá para saber (Linux)
+		part = folder_partition(folder)
+		self.mountpoint = part.mountpoint if part else folder
+		self.device = part.device if part and part.device else self.mountpoint
+		self.disk = disk_name(self.device)
+		# até 1/4 do espaço livre, em blocos inteiros
+		free = psutil.disk_usage(folder).free
+		self.size = min(size, free // 4) // BLOCK * BLOCK
+		if self.size < 64 * MiB:
+			raise OSError(f"not enough free space in {folder}")
+		self.depths = tuple(depths)
+		self.duration = duration
+		self.direct = None
+		self.path = None
+		# fases em ordem; progress() = fases prontas + fração da atual
+		self.phases = ["seq_write", "seq_read"]
+		for depth in self.depths:
+			self.phases += [f"rand_read:{depth}", f"rand_write:{depth}"]
+		self.phase = None
+		self.done = 0
+		self.fraction = 0.0
+		# MB/s ou IOPS da fase atual, para a interface
+		self.rate = 0.0
+		self.cancelled = threading.Event()
+
+	def progress(self):
+		return (self.done + self.fraction) / len(self.phases)
+
+	def cancel(self):
+		self.cancelled.set()
+
+	def check(self):
+		if self.cancelled.is_set():
+			raise Cancelled()
+
+	def begin(self, phase):
+		self.check()
+		self.phase = phase
+		self.fraction = 0.0
+		self.rate = 0.0
+
+	def end(self):
+		self.done += 1
+		self.fraction = 0.0
+
+	def sequential(self, write):
+		self.begin("seq_write" if write else "seq_read")
+		fd, self.direct = open_file(self.path, create=write)
+		buffer = aligned_buffer(BLOCK)
+		blocks = self.size // BLOCK
+		try:
+			f = io.FileIO(fd, "r+", closefd=False)
+			started = time.perf_counter()
+			for i in range(blocks):
+				if write:
+					f.write(buffer)
+				else:
+					f.readinto(buffer)
+				if i % 16 == 0:
+					self.check()
+					self.fraction = i / blocks
+					self.rate = i * BLOCK / max(1e-9, time.perf_counter() - started)
+			if write:
+				os.fsync(fd)
+			elapsed = time.perf_counter() - started
+			if not self.direct:
+				drop_cache(fd)
+		finally:
+			buffer.close()
+			os.close(fd)
+		self.end()
+		return self.size / elapsed
+
+	def random_io(self, write, depth):
+		self.begin(f"rand_{'write' if write else 'read'}:{depth}")
+		counts = [0] * depth
+		errors = []
+		slots = self.size // SMALL
+		started = time.perf_counter()
+		deadline = started + self.duration
+
+		def worker(index):
+			try:
+				fd, _ = open_file(self.path)
+			except OSError as e:
+				errors.append(e)
+				return
+			buffer = aligned_buffer(mmap.PAGESIZE)
+			view = memoryview(buffer)[:SMALL]
+			rnd = random.Random(index)
+			try:
+				f = io.FileIO(fd, "r+", closefd=False)
+				while time.perf_counter() < deadline and not self.cancelled.is_set():
+					for _ in range(32):
+						f.seek(rnd.randrange(slots) * SMALL)
+						if write:
+							f.write(view)
+						else:
+							f.readinto(view)
+					counts[index] += 32
+				if write:
+					os.fsync(fd)
+			except Exception as e:
+				errors.append(e)
+			finally:
+				view.release()
+				buffer.close()
+				os.close(fd)
+
+		threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(depth)]
+		for thread in threads:
+			thread.start()
+		while any(thread.is_alive() for thread in threads):
+			time.sleep(0.1)
+			elapsed = time.perf_counter() - started
+			self.fraction = min(1.0, elapsed / self.duration)
+			self.rate = sum(counts) / max(1e-9, elapsed)
+		elapsed = time.perf_counter() - started
+		self.check()
+		if errors:
+			raise errors[0]
+		if write and not self.direct:
+			fd, _ = open_file(self.path)
+			try:
+				drop_cache(fd)
+			finally:
+				os.close(fd)
+		self.end()
+		return sum(counts) / elapsed
+
+	def run(self):
+		started = time.perf_counter()
+		fd, self.path = tempfile.mkstemp(prefix="pchealth-", suffix=".bench", dir=self.folder)
+		os.close(fd)
+		result = {
+			"folder": self.folder,
+			"device": self.device,
+			"mountpoint": self.mountpoint,
+			"size": self.size,
+			"random_read": {},
+			"random_write": {},
+		}
+		try:
+			result["seq_write"] = self.sequential(True)
+			result["seq_read"] = self.sequential(False)
+			for depth in self.depths:
+				result["random_read"][str(depth)] = self.random_io(False, depth)
+				result["random_write"][str(depth)] = self.random_io(True, depth)
+		except Cancelled:
+			return None
+		finally:
+			self.phase = None
+			try:
+				os.remove(self.path)
+			except OSError as e:
+				print("disk benchmark error:", e)
+		result["direct"] = self.direct
+		result["time"] = time.time()
+		result["seconds"] = time.perf_counter() - started
+		return result
+
+# Resultados ficam num JSON Lines (um por execução) para comparar com as anteriores
+def save_result(path, result):
+	os.makedirs(os.path.dirname(path), exist_ok=True)
+	with open(path, "a", encoding="utf-8") as f:
+		f.write(json.dumps(result) + "\n")
+
+def previous_result(path, device, mountpoint):
+	# mesma partição no mesmo lugar (vários tmpfs têm o mesmo "device")
+	last = None
+	try:
+		with open(path, "r", encoding="utf-8") as f:
+			for line in f:
+				try:
+					result = json.loads(line)
+				except ValueError:
+					continue
+				if result.get("device") == device and result.get("mountpoint") == mountpoint:
+					last = result
+	except OSError:
+		pass
+	return last
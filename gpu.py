@@ -0,0 +1,185 @@
+import time
+import threading
+from collections import namedtuple
+
+# Leitura das GPUs com a sessão NVML aberta o tempo todo:
+# os handles são resolvidos uma vez e cada tick lê tudo de todas as GPUs numa passada.
+# Sem NVML (AMD/Intel, driver sem a DLL) cai para o GPUtil, que chama o
+# nvidia-smi num subprocesso, no máximo a cada fallback_interval segundos.
+#
+# O módulo nvml pode ser trocado (GPUSampler(nvml=...)) para rodar sem placa de vídeo.
+
+GpuSample = namedtuple(
+	"GpuSample",
+	"index name uuid driver display_active load memory_load memory_used memory_total "
+	"temperature power power_limit fan clock_graphics clock_memory"
+)
+
+# métricas lidas a cada tick: (campo, função(nvml, handle))
+NVML_METRICS = (
+	("utilization", lambda nvml, h: nvml.nvmlDeviceGetUtilizationRates(h)),
+	("memory", lambda nvml, h: nvml.nvmlDeviceGetMemoryInfo(h)),
+	("temperature", lambda nvml, h: nvml.nvmlDeviceGetTemperature(h, nvml.NVML_TEMPERATURE_GPU)),
+	("power", lambda nvml, h: nvml.nvmlDeviceGetPowerUsage(h) / 1000),
+	("fan", lambda nvml, h: nvml.nvmlDeviceGetFanSpeed(h)),
+	("clock_graphics", lambda nvml, h: nvml.nvmlDeviceGetClockInfo(h, nvml.NVML_CLOCK_GRAPHICS)),
+	("clock_memory", lambda nvml, h: nvml.nvmlDeviceGetClockInfo(h, nvml.NVML_CLOCK_MEM)),
+)
+
+def text(value):
+	# versões antigas do pynvml devolvem bytes
+	if isinstance(value, bytes):
+		return value.decode("utf-8", "replace")
+	return value
+
+class GPUSampler:
+	def __init__(self, nvml=None, gputil=None, fallback_interval=10.0):
+		self.lock = threading.Lock()
+		self.nvml = None
+		self.devices = []
+		self.gputil = gputil
+		self.fallback_interval = fallback_interval
+		self.fallback_time = None
+		self.last = []
+		self.closed = False
+		self.driver = None
+
+		if nvml is None:
+			try:
+				import pynvml as nvml
+			except ImportError:
+				nvml = None
+		if nvml is not None:
+			self.open(nvml)
+
+	def open(self, nvml):
+		try:
+			nvml.nvmlInit()
+			try:
+				self.driver = text(nvml.nvmlSystemGetDriverVersion())
+			except Exception:
+				pass
+			for i in range(nvml.nvmlDeviceGetCount()):
+				handle = nvml.nvmlDeviceGetHandleByIndex(i)
+				device = {
+					"index": i,
+					"handle": handle,
+					"name": text(nvml.nvmlDeviceGetName(handle)),
+					"uuid": None,
+					"power_limit": None,
+					"display_active": None,
+					# métricas que o driver não suporta (ex.: fan em notebook) não são relidas
+					"unsupported": set(),
+				}
+				try:
+					device["uuid"] = text(nvml.nvmlDeviceGetUUID(handle))
+				except Exception:
+					pass
+				try:
+					device["power_limit"] = nvml.nvmlDeviceGetEnforcedPowerLimit(handle) / 1000
+				except Exception:
+					pass
+				try:
+					device["display_active"] = bool(nvml.nvmlDeviceGetDisplayActive(handle))
+				except Exception:
+					pass
+				self.devices.append(device)
+			self.nvml = nvml
+		except Exception as e:
+			print("nvml error:", e)
+			self.devices = []
+
+	def available(self):
+		return self.nvml is not None
+
+	def sample(self):
+		with self.lock:
+			if self.closed:
+				return []
+			if self.nvml is not None:
+				self.last = [self.read_device(device) for device in self.devices]
+			else:
+				self.sample_gputil()
+			return self.last
+
+	def read_device(self, device):
+		values = {}
+		for name, read in NVML_METRICS:
+			if name in device["unsupported"]:
+				continue
+			try:
+				values[name] = read(self.nvml, device["handle"])
+			except Exception as e:
+				if type(e).__name__ == "NVMLError_NotSupported":
+					device["unsupported"].add(name)
+
+		util = values.get("utilization")
+		mem = values.get("memory")
+		return GpuSample(
+			index=device["index"],
+			name=device["name"],
+			uuid=device["uuid"],
+			driver=self.driver,
+			display_active=device["display_active"],
+			load=util.gpu if util is not None else None,
+			memory_load=util.memory if util is not None else None,
+			memory_used=mem.used / 1024**2 if mem is not None else None,
+			memory_total=mem.total / 1024**2 if mem is not None else None,
+			temperature=values.get("temperature"),
+			power=values.get("power"),
+			power_limit=device["power_limit"],
+			fan=values.get("fan"),
+			clock_graphics=values.get("clock_graphics"),
+			clock_memory=values.get("clock_memory"),
+		)
+
+	def sample_gputil(self):
+		now = time.monotonic()
+		if self.fallback_time is not None and now - self.fallback_time < self.fallback_interval:
+			return
+		self.fallback_time = now
+
+		gputil = self.gputil
+		if gputil is None:
+			try:
+				import GPUtil as gputil
+			except ImportError:
+				return
+			self.gputil = gputil
+
+		try:
+			gpus = gputil.getGPUs()
+		except Exception as e:
+			print("GPUtil error:", e)
+			return
+
+		self.last = [
+			GpuSample(
+				index=i,
+				name=gpu.name,
+				uuid=gpu.uuid,
+				driver=getattr(gpu, "driver", None),
+				display_active=getattr(gpu, "display_active", None),
+				load=gpu.load * 100,
+				memory_load=None,
+				memory_used=gpu.memoryUsed,
+				memory_total=gpu.memoryTotal,
+				temperature=gpu.temperature,
+				power=None,
+				power_limit=None,
+				fan=None,
+				clock_graphics=None,
+				clock_memory=None,
+			)
+			for i, gpu in enumerate(gpus)
+		]
+
+	def close(self):
+		with self.lock:
+			self.closed = True
+			if self.nvml is not None:
+				try:
+					self.nvml.nvmlShutdown()
+				except Exception:
+					pass
+				self.nvml = None
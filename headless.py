@@ -0,0 +1,208 @@
+import os
+import sys
+import csv
+import json
+import time
+import signal
+import argparse
+from collector import Collector, FIELDS, flatten
+
+# Modo sem interface (servidores): mesma coleta das abas, sem PyQt6 nem WMI.
+# As amostras vão para stdout ou para um arquivo com rotação por tamanho.
+
+class RotatingFile:
+	def __init__(self, path, max_bytes, backups, buffering=1 << 16):
+		self.path = path
+		# escrito no começo de cada arquivo novo (cabeçalho do CSV)
+		self.header = ""
+		self.max_bytes = max_bytes
+		self.backups = backups
+		self.buffering = buffering
+		self.file = None
+		self.size = 0
+		self.open()
+
+	def open(self):
+		self.file = open(self.path, "a", encoding="utf-8", newline="", buffering=self.buffering)
+		self.size = self.file.tell()
+
+	def rotate(self):
+		self.file.close()
+		for i in range(self.backups - 1, 0, -1):
+			src = f"{self.path}.{i}"
+			if os.path.exists(src):
+				os.replace(src, f"{self.path}.{i + 1}")
+		if self.backups > 0:
+			os.replace(self.path, f"{self.path}.1")
+		else:
+			os.remove(self.path)
+		self.open()
+
+	def write(self, text):
+		if self.max_bytes and self.size and self.size + len(text) > self.max_bytes:
+			self.rotate()
+		if not self.size and self.header:
+			self.file.write(self.header)
+			self.size += len(self.header)
+		self.file.write(text)
+		self.size += len(text)
+
+	def flush(self):
+		self.file.flush()
+
+	def close(self):
+		self.file.close()
+
+class StdoutFile:
+	def __init__(self):
+		self.file = sys.stdout
+		self.header = ""
+		self.written = False
+
+	def write(self, text):
+		if not self.written:
+			self.written = True
+			self.file.write(self.header)
+		self.file.write(text)
+
+	def flush(self):
+		self.file.flush()
+
+	def close(self):
+		self.flush()
+
+class JsonlFormat:
+	def __init__(self, out):
+		self.out = out
+
+	def write(self, row):
+		self.out.write(json.dumps(row, separators=(",", ":")) + "\n")
+
+class Line:
+	# csv.writer precisa de um arquivo; guardamos a linha para medir o tamanho
+	def __init__(self):
+		self.text = ""
+
+	def write(self, text):
+		self.text += text
+
+	def take(self):
+		text, self.text = self.text, ""
+		return text
+
+class CsvFormat:
+	def __init__(self, out):
+		self.out = out
+		self.line = Line()
+		self.writer = csv.writer(self.line, lineterminator="\n")
+		# cabeçalho no começo de cada arquivo, inclusive depois da rotação
+		self.writer.writerow(FIELDS)
+		out.header = self.line.take()
+
+	def write(self, row):
+		self.writer.writerow(["" if row[name] is None else row[name] for name in FIELDS])
+		self.out.write(self.line.take())
+
+class NoFormat:
+	# só o endpoint de métricas, sem gravar nada
+	def __init__(self, out):
+		pass
+
+	def write(self, row):
+		pass
+
+FORMATS = {"jsonl": JsonlFormat, "csv": CsvFormat, "none": NoFormat}
+
+def parse_args(argv):
+	parser = argparse.ArgumentParser(prog="main.py --headless")
+	parser.add_argument("--headless", action="store_true",
+		help="collect without the GUI")
+	parser.add_argument("--interval", type=float, default=1.0,
+		help="seconds between samples (default: 1.0)")
+	parser.add_argument("--format", choices=sorted(FORMATS), default="jsonl",
+		help="output format (default: jsonl)")
+	parser.add_argument("--output",
+		help="write to this file instead of stdout")
+	parser.add_argument("--max-bytes", type=int, default=10 * 1024 * 1024,
+		help="rotate the output file after this size, 0 disables (default: 10 MiB)")
+	parser.add_argument("--backups", type=int, default=5,
+		help="rotated files to keep (default: 5)")
+	parser.add_argument("--flush", type=float, default=1.0,
+		help="seconds between flushes of the write buffer (default: 1.0)")
+	parser.add_argument("--count", type=int, default=0,
+		help="stop after this many samples, 0 runs until interrupted")
+	parser.add_argument("--metrics-port", type=int,
+		help="serve OpenMetrics on this port")
+	parser.add_argument("--metrics-host", default="127.0.0.1",
+		help="address for --metrics-port (default: 127.0.0.1)")
+	args = parser.parse_args(argv)
+	if args.interval <= 0:
+		parser.error("--interval must be greater than 0")
+	return args
+
+def run(args, collector, writer, out, exporter=None):
+	interval = args.interval
+	samples = 0
+	last_flush = time.monotonic()
+	deadline = last_flush
+
+	while not args.count or samples < args.count:
+		snap = collector.sample()
+		writer.write(flatten(snap))
+		if exporter is not None:
+			exporter.update(snap)
+		samples += 1
+
+		now = time.monotonic()
+		if now - last_flush >= args.flush:
+			out.flush()
+			last_flush = now
+
+		# prazo fixo em relação ao início: o tempo de coleta não se acumula.
+		# Se atrasar mais que um intervalo, pula os ticks perdidos.
+		deadline += interval
+		if deadline < now:
+			deadline = now + interval - (now - deadline) % interval
+		if not args.count or samples < args.count:
+			time.sleep(max(0.0, deadline - time.monotonic()))
+
+	return samples
+
+def stop(signum, frame):
+	raise KeyboardInterrupt
+
+def main(argv):
+	args = parse_args(argv)
+	signal.signal(signal.SIGTERM, stop)
+
+	# por núcleo / disco / placa de rede não entram nas colunas do arquivo
+	collector = Collector(
+		process_interval=max(1.0, args.interval), percpu=False, perdisk=False, pernic=False
+	)
+	if args.output:
+		out = RotatingFile(args.output, args.max_bytes, args.backups)
+	else:
+		out = StdoutFile()
+	writer = FORMATS[args.format](out)
+
+	exporter = None
+	if args.metrics_port is not None:
+		import metrics
+		try:
+			exporter = metrics.MetricsExporter(args.metrics_port, args.metrics_host)
+		except OSError as e:
+			print("metrics error:", e, file=sys.stderr)
+			return 1
+
+	try:
+		run(args, collector, writer, out, exporter)
+	except KeyboardInterrupt:
+		pass
+	except BrokenPipeError:
+		# saída fechada (ex.: | head): o resto vai para devnull
+		os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+	finally:
+		out.close()
+		if exporter is not None:
+			exporter.close()
+	return 0
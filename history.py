@@ -0,0 +1,174 @@
+import math
+import time
+from array import array
+
+# Histórico dos gráficos em buffers circulares de float32.
+# Nada é deslocado a cada amostra e a memória usada é fixa.
+
+class RingBuffer:
+	def __init__(self, size):
+		self.size = size
+		self.data = array("f", bytes(4 * size))
+		self.view = memoryview(self.data)
+		self.head = 0  # próxima posição de escrita
+		self.count = 0
+		self.total = 0  # quantos valores já entraram (nunca volta)
+
+	def __len__(self):
+		return self.count
+
+	def append(self, value):
+		self.data[self.head] = value
+		self.head = (self.head + 1) % self.size
+		self.total += 1
+		if self.count < self.size:
+			self.count += 1
+
+	def last(self, default=0.0):
+		if not self.count:
+			return default
+		return self.data[self.head - 1]
+
+	def segments(self, n=None):
+		# últimos n valores, do mais antigo ao mais novo, em até duas
+		# fatias de memoryview (sem cópia)
+		n = self.count if n is None else min(n, self.count)
+		if n <= 0:
+			return ()
+		start = (self.head - n) % self.size
+		end = start + n
+		if end <= self.size:
+			return (self.view[start:end],)
+		return (self.view[start:], self.view[:end - self.size])
+
+	def clear(self):
+		self.head = 0
+		self.count = 0
+
+# (segundos por ponto, quantidade de pontos)
+TIERS = (
+	(1, 600),      # 1 s por 10 minutos
+	(10, 2160),    # 10 s por 6 horas
+	(60, 10080),   # 1 min por 7 dias
+)
+
+class History:
+	def __init__(self, tiers=TIERS):
+		self.steps = [step for step, size in tiers]
+		self.tiers = [RingBuffer(size) for step, size in tiers]
+		# média parcial do intervalo em aberto de cada nível
+		self.buckets = [None] * len(tiers)
+		self.sums = [0.0] * len(tiers)
+		self.counts = [0] * len(tiers)
+		# muda a cada append/clear, para quem desenha saber se precisa redesenhar
+		self.version = 0
+
+	def __len__(self):
+		return len(self.tiers[0])
+
+	def append(self, value, now=None):
+		if now is None:
+			now = time.monotonic()
+		self.version += 1
+
+		for i, step in enumerate(self.steps):
+			bucket = int(now // step)
+			current = self.buckets[i]
+
+			if current is not None and bucket != current:
+				ring = self.tiers[i]
+				average = self.sums[i] / self.counts[i]
+				ring.append(average)
+				# amostras atrasadas (aba pausada, janela minimizada):
+				# repete o valor para manter um ponto por intervalo
+				gap = min(bucket - current - 1, ring.size)
+				for _ in range(max(0, gap)):
+					ring.append(average)
+				self.sums[i] = 0.0
+				self.counts[i] = 0
+
+			self.buckets[i] = bucket
+			self.sums[i] += value
+			self.counts[i] += 1
+
+	def last(self, default=0.0):
+		if self.counts[0]:
+			return self.sums[0] / self.counts[0]
+		return self.tiers[0].last(default)
+
+	def tier(self, seconds):
+		# nível mais fino que ainda cobre a janela pedida
+		for i, (step, ring) in enumerate(zip(self.steps, self.tiers)):
+			if step * ring.size >= seconds:
+				return i
+		return len(self.tiers) - 1
+
+	def window(self, seconds):
+		# retorna (fatias, segundos por ponto, pontos na janela)
+		i = self.tier(seconds)
+		step, ring = self.steps[i], self.tiers[i]
+		points = max(2, math.ceil(seconds / step))
+		# o intervalo em aberto entra como o ponto mais recente
+		segments = ring.segments(points - 1)
+		if self.counts[i]:
+			tail = array("f", [self.sums[i] / self.counts[i]])
+			segments = segments + (memoryview(tail),)
+		return segments, step, points
+
+	def clear(self):
+		self.version += 1
+		for i, ring in enumerate(self.tiers):
+			ring.clear()
+			self.buckets[i] = None
+			self.sums[i] = 0.0
+			self.counts[i] = 0
+
+# Histórico por núcleo (núcleos × tempo) para o mapa de calor, em uint8 (0-100).
+# Cada amostra é uma linha de bytes gravada com uma única atribuição de fatia,
+# duas vezes (posição e posição + size): a janela fica sempre contígua e
+# vira uma imagem sem precisar juntar pedaços.
+class CoreHistory:
+	def __init__(self, cores, size=300):
+		self.cores = cores
+		self.size = size
+		self.data = bytearray(2 * size * cores)
+		self.view = memoryview(self.data)
+		self.head = 0
+		self.count = 0
+		self.version = 0
+
+	def __len__(self):
+		return self.count
+
+	def append(self, values):
+		row = bytes(min(100, max(0, int(v + 0.5))) for v in values[:self.cores])
+		if len(row) < self.cores:
+			# ex.: Windows devolve uma frequência só para todos os núcleos
+			row = (row or b"\0") * self.cores
+			row = row[:self.cores]
+
+		start = self.head * self.cores
+		mirror = start + self.size * self.cores
+		self.data[start:start + self.cores] = row
+		self.data[mirror:mirror + self.cores] = row
+
+		self.head = (self.head + 1) % self.size
+		if self.count < self.size:
+			self.count += 1
+		self.version += 1
+
+	def window(self):
+		# count linhas, da mais antiga para a mais nova, sem cópia
+		start = (self.head - self.count) % self.size
+		return self.view[start * self.cores:(start + self.count) * self.cores]
+
+	def last(self):
+		if not self.count:
+			return b""
+		start = (self.head - 1) % self.size * self.cores
+		return bytes(self.view[start:start + self.cores])
+
+	def clear(self):
+		self.head = 0
+		self.count = 0
+		self.version += 1
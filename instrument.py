@@ -0,0 +1,208 @@
+import os
+import json
+import time
+import functools
+import threading
+from array import array
+
+# Instrumentação do próprio app: quanto custa cada coleta (WMI, psutil,
+# GPU), cada pintura e cada troca de stylesheet.
+#
+#   @instrument.timed(category="paint")          decorador
+#   with instrument.span("Collector.sample"):    trecho de código
+#
+# Desligada (o normal), timed() devolve a própria função e span() um
+# contexto vazio compartilhado: nada é medido nem alocado. Por isso o
+# main.py liga a instrumentação (--trace) antes de definir as classes.
+#
+# Cada nome tem um histograma pré-alocado (buckets de potência de 2 em ns)
+# e cada chamada vira um evento num buffer circular de tamanho fixo, que
+# é salvo no formato do Chrome (chrome://tracing, Perfetto).
+
+BUCKETS = 42
+CAPACITY = 200_000
+
+tracer = None
+
+class Histogram:
+	__slots__ = ("name", "category", "buckets", "count", "total", "max")
+
+	def __init__(self, name, category):
+		self.name = name
+		self.category = category
+		# bucket i: durações com i bits em ns, ou seja, menores que 2^i ns
+		self.buckets = array("Q", bytes(8 * BUCKETS))
+		self.count = 0
+		self.total = 0
+		self.max = 0
+
+	def add(self, ns):
+		self.buckets[min(BUCKETS - 1, ns.bit_length())] += 1
+		self.count += 1
+		self.total += ns
+		if ns > self.max:
+			self.max = ns
+
+	def percentile(self, fraction):
+		# limite superior do bucket: erro de no máximo 2x, suficiente para achar o caro
+		target = fraction * self.count
+		seen = 0
+		for i, n in enumerate(self.buckets):
+			seen += n
+			if n and seen >= target:
+				return min(self.max, 1 << i)
+		return self.max
+
+class Tracer:
+	def __init__(self, capacity=CAPACITY):
+		self.capacity = capacity
+		self.events = [None] * capacity
+		self.position = 0
+		self.histograms = {}
+		self.threads = {}
+		self.origin = time.perf_counter_ns()
+		# custo por amostra do sampler: o que foi gasto desde o último frame()
+		self.current = {}
+		self.last_tick = {}
+		self.last_tick_ns = 0
+		self.tick_started = self.origin
+		self.ticks = 0
+
+	def histogram(self, key):
+		hist = self.histograms.get(key)
+		if hist is None:
+			hist = self.histograms[key] = Histogram(*key)
+		return hist
+
+	def record(self, hist, key, started, ns):
+		# várias threads gravam aqui; com o GIL, no pior caso se perde uma contagem
+		hist.add(ns)
+		self.current[key] = self.current.get(key, 0) + ns
+		tid = threading.get_ident()
+		if tid not in self.threads:
+			self.threads[tid] = threading.current_thread().name
+		self.events[self.position % self.capacity] = (key, tid, started, ns)
+		self.position += 1
+
+	def frame(self):
+		now = time.perf_counter_ns()
+		self.last_tick = self.current
+		self.last_tick_ns = now - self.tick_started
+		self.current = {}
+		self.tick_started = now
+		self.ticks += 1
+		self.events[self.position % self.capacity] = (("tick", "sampler"), threading.get_ident(), now, None)
+		self.position += 1
+
+	def summary(self):
+		rows = []
+		# cópia: outras threads podem criar histogramas durante a leitura
+		for key, hist in list(self.histograms.items()):
+			if not hist.count:
+				continue
+			rows.append({
+				"name": hist.name,
+				"category": hist.category,
+				"tick": self.last_tick.get(key, 0),
+				"count": hist.count,
+				"p50": hist.percentile(0.50),
+				"p99": hist.percentile(0.99),
+				"max": hist.max,
+				"total": hist.total,
+			})
+		rows.sort(key=lambda row: row["total"], reverse=True)
+		return rows
+
+	def chrome_trace(self):
+		pid = os.getpid()
+		events = [
+			{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+			for tid, name in list(self.threads.items())
+		]
+		# as threads continuam gravando; o trace vai até a posição de agora
+		position = self.position
+		for i in range(max(0, position - self.capacity), position):
+			event = self.events[i % self.capacity]
+			if event is None:
+				continue
+			(name, category), tid, started, ns = event
+			ts = (started - self.origin) / 1000
+			if ns is None:
+				events.append({"name": name, "cat": category, "ph": "i", "s": "p", "ts": ts, "pid": pid, "tid": tid})
+			else:
+				events.append({"name": name, "cat": category, "ph": "X", "ts": ts, "dur": ns / 1000, "pid": pid, "tid": tid})
+		return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+	def dump(self, path):
+		os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+		with open(path, "w", encoding="utf-8") as f:
+			json.dump(self.chrome_trace(), f)
+
+def enable(capacity=CAPACITY):
+	global tracer
+	if tracer is None:
+		tracer = Tracer(capacity)
+	return tracer
+
+def timed(name=None, category="app"):
+	def decorate(fn):
+		if tracer is None:
+			return fn
+		key = (name or getattr(fn, "__qualname__", repr(fn)), category)
+		hist = tracer.histogram(key)
+		record = tracer.record
+		clock = time.perf_counter_ns
+
+		@functools.wraps(fn)
+		def wrapper(*args, **kwargs):
+			started = clock()
+			try:
+				return fn(*args, **kwargs)
+			finally:
+				record(hist, key, started, clock() - started)
+		return wrapper
+	return decorate
+
+def wrap(fn, category="app", name=None):
+	# para callbacks criados em tempo de execução (slots do sampler, on_done...)
+	return timed(name, category)(fn)
+
+class Span:
+	__slots__ = ("hist", "key", "started")
+
+	def __init__(self, key):
+		self.hist = tracer.histogram(key)
+		self.key = key
+
+	def __enter__(self):
+		self.started = time.perf_counter_ns()
+		return self
+
+	def __exit__(self, *exc):
+		tracer.record(self.hist, self.key, self.started, time.perf_counter_ns() - self.started)
+		return False
+
+class NullSpan:
+	__slots__ = ()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *exc):
+		return False
+
+NULL_SPAN = NullSpan()
+
+def span(name, category="app"):
+	if tracer is None:
+		return NULL_SPAN
+	return Span((name, category))
+
+def frame():
+	# início de uma amostra do sampler: fecha o custo por tick da anterior
+	if tracer is not None:
+		tracer.frame()
+
+def dump(path):
+	if tracer is not None:
+		tracer.dump(path)
@@ -0,0 +1,121 @@
+import os
+import json
+import threading
+import hashlib
+import platform
+import psutil
+from types import SimpleNamespace
+
+# Inventário de hardware estático (provider WMI ou Linux, ver providers.py).
+# Cada tipo é consultado uma única vez, guardado em memória e salvo em disco.
+# O cache em disco só vale para o mesmo boot, o mesmo hardware e o mesmo provider.
+
+def boot_id():
+	return str(int(psutil.boot_time()))
+
+def hardware_fingerprint():
+	parts = [
+		platform.node(),
+		platform.machine(),
+		platform.processor(),
+		str(psutil.cpu_count()),
+		str(psutil.virtual_memory().total),
+	]
+	return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+
+class Inventory:
+	def __init__(self, provider, path, refresh=False):
+		self.provider = provider
+		# lock: self.classes e o arquivo; kind_locks: uma consulta em andamento por tipo
+		self.lock = threading.Lock()
+		self.kind_locks = {}
+		self.path = path
+		self.key = {"boot": boot_id(), "fingerprint": hardware_fingerprint(), "provider": provider.name}
+		self.classes = {}
+		# refresh: ignora o cache em disco e consulta tudo de novo
+		if not refresh:
+			self.load()
+
+	def load(self):
+		if not os.path.exists(self.path):
+			return
+		try:
+			with open(self.path, "r", encoding="utf-8") as f:
+				data = json.load(f)
+		except Exception:
+			return
+
+		if data.get("key") != self.key:
+			return
+
+		for name, items in data.get("classes", {}).items():
+			self.classes[name] = tuple(SimpleNamespace(**item) for item in items)
+
+	def save(self):
+		data = {
+			"key": self.key,
+			"classes": {
+				name: [vars(item) for item in items]
+				for name, items in self.classes.items()
+			}
+		}
+		try:
+			with open(self.path, "w", encoding="utf-8") as f:
+				json.dump(data, f, default=str)
+		except Exception as e:
+			print("inventory cache error:", e)
+
+	def query(self, kind):
+		# kind: "processor", "memory", "disks"... (providers.KINDS)
+		# falhas não ficam em cache: o chamador trata a exceção como antes.
+		# O resultado é compartilhado entre as abas, por isso é uma tupla.
+		# Tipos diferentes são consultados em paralelo; o mesmo tipo, uma vez só.
+		items = self.classes.get(kind)
+		if items is not None:
+			return items
+		with self.lock:
+			kind_lock = self.kind_locks.setdefault(kind, threading.Lock())
+		with kind_lock:
+			# outra thread pode ter feito a mesma consulta enquanto esta esperava
+			items = self.classes.get(kind)
+			if items is None:
+				items = tuple(self.provider.query(kind))
+				with self.lock:
+					self.classes[kind] = items
+					self.save()
+		return items
+
+	def invalidate(self, *kinds):
+		with self.lock:
+			self.provider.invalidate()
+			for name in kinds:
+				self.classes.pop(name, None)
+
+# Resultado do cpuinfo.get_cpu_info(), que demora segundos e abre subprocessos.
+# Só muda com outro processador ou outro microcode, então a chave é essa.
+class CpuInfoCache:
+	def __init__(self, path, fingerprint, refresh=False):
+		self.path = path
+		self.fingerprint = fingerprint
+		self.refresh = refresh
+
+	def load(self):
+		if self.refresh or not os.path.exists(self.path):
+			return None
+		try:
+			with open(self.path, "r", encoding="utf-8") as f:
+				data = json.load(f)
+		except Exception:
+			return None
+		if data.get("fingerprint") != self.fingerprint:
+			return None
+		return data.get("info")
+
+	def store(self, info):
+		# depois de uma leitura nova, as próximas podem usar o cache
+		self.refresh = False
+		try:
+			with open(self.path, "w", encoding="utf-8") as f:
+				json.dump({"fingerprint": self.fingerprint, "info": info}, f, default=str)
+		except Exception as e:
+			print("cpuinfo cache error:", e)
@@ -1,17 +1,44 @@
 import os
 import sys
-import wmi
+
+# processos do benchmark de CPU no executável empacotado: voltam daqui,
+# antes de qualquer import pesado
+if __name__ == "__main__":
+	import multiprocessing
+	multiprocessing.freeze_support()
+
+# --headless: coleta sem interface, antes de importar PyQt6
+if __name__ == "__main__" and "--headless" in sys.argv:
+	import headless
+	sys.exit(headless.main(sys.argv[1:]))
+
+# --trace: a instrumentação precisa estar ligada antes das classes abaixo
+# serem definidas (desligada, os decoradores devolvem a função original)
+import instrument
+if __name__ == "__main__" and "--trace" in sys.argv:
+	instrument.enable()
+
 import json
+import math
 import time
 import psutil
-import GPUtil
-import winreg
 import cpuinfo
 import platform
 import webbrowser
 import subprocess
+import threading
 from pprint import pprint
 import config as config_file
+from collector import Collector, DiskRates, NetRates
+from inventory import Inventory, CpuInfoCache
+from providers import PROVIDERS, select_provider
+from history import History, CoreHistory
+import recording
+import cpubench
+import membench
+import diskbench
+from gpu import GPUSampler
+from processes import ProcessTracker, SORT_KEYS
 from collections import deque
 from PyQt6.QtGui import QPixmap
 from PyQt6.QtWidgets import *
@@ -26,14 +53,7 @@ def resource_path(relative_path):
         base_path = os.path.abspath(".")
     return os.path.join(base_path, relative_path)
 
-# IF NVIDIA AVALIABLE
-try:
-	import pynvml
-	pynvml.nvmlInit()
-	NVML_AVAILABLE = True
-except Exception:
-	NVML_AVAILABLE = False
-	
+@instrument.timed(category="style")
 def build_stylesheet():
 	return f"""
 	QWidget#root {{
@@ -121,15 +141,21 @@ def build_stylesheet():
 	}}
 	"""
 
+# Instância única (lang): traduções ficam em memória, config.json só é
+# gravado quando o usuário troca o idioma
 class LanguageManager:
 	def __init__(self):
 		self.translations = {}
+		self.cache = {}
+		self.reads = 0
+		self.writes = 0
 		self.current_language = config_file.default_lang
 		self.load_config()
 
 	def load_config(self):
 		if os.path.exists(resource_path("files/config.json")):
 			try:
+				self.reads += 1
 				with open(resource_path("files/config.json"), "r", encoding="utf-8") as f:
 					config = json.load(f)
 					self.current_language = config.get("language", "pt")
@@ -138,22 +164,36 @@ class LanguageManager:
 		self.load_language(self.current_language)
 
 	def save_config(self):
+		self.writes += 1
 		with open(resource_path("files/config.json"), "w", encoding="utf-8") as f:
 			json.dump({"language": self.current_language}, f, indent=4)
 
 	def load_language(self, lang_code):
+		if lang_code in self.cache:
+			self.translations = self.cache[lang_code]
+			self.current_language = lang_code
+			return
 		try:
+			self.reads += 1
 			arq = resource_path(f"languages/{lang_code}.json")
 			with open(arq, "r", encoding="utf-8") as f:
 				self.translations = json.load(f)
+				self.cache[lang_code] = self.translations
 				self.current_language = lang_code
-				self.save_config()
 		except:
 			self.translations = {}
 
+	def set_language(self, lang_code):
+		if lang_code == self.current_language:
+			return
+		self.load_language(lang_code)
+		self.save_config()
+
 	def t(self, key):
 		return self.translations.get(key, key)
 
+lang = LanguageManager()
+
 class ThemeManager:
 	def __init__(self):
 		self.file = resource_path("theme.json")
@@ -247,8 +287,13 @@ def refresh_accent_colors(widget):
 	for child in widget.findChildren(AccentLabel):
 		child.update_color()
 
-def apply_theme(app):
+# aplicar o stylesheet no app inteiro recalcula o estilo de todos os widgets
+@instrument.timed(category="style")
+def set_stylesheet(app):
 	app.setStyleSheet(build_stylesheet())
+
+def apply_theme(app):
+	set_stylesheet(app)
 	refresh_accent_colors(app.activeWindow())
 
 class AccentLabel(QLabel):
@@ -266,9 +311,289 @@ class AccentLabel(QLabel):
 def blue_label(text=""):
 	return AccentLabel(text)
 
+# SAMPLER
+# Uma única thread coleta os contadores e publica o snapshot para todas as abas
+class SamplerWorker(QObject):
+	sampled = pyqtSignal(dict)
+
+	def __init__(self, interval):
+		super().__init__()
+		self.interval = interval
+		self.collector = Collector()
+		self.timer = None
+
+	def run(self):
+		# o timer precisa ser criado dentro da thread de coleta
+		self.timer = QTimer()
+		self.timer.timeout.connect(self.tick)
+		self.set_interval(self.interval)
+		self.tick()
+
+	def set_interval(self, interval):
+		# 0 = ninguém precisa de dados agora, a coleta fica suspensa
+		self.interval = interval
+		if self.timer is None:
+			return
+		if interval > 0:
+			self.timer.start(interval)
+		else:
+			self.timer.stop()
+
+	def tick(self):
+		instrument.frame()
+		with instrument.span("Collector.sample", "psutil"):
+			snap = self.collector.sample()
+		self.sampled.emit(snap)
+
+	def tick_now(self):
+		# amostra fora de hora recomeça a contagem do timer
+		if self.timer is not None and self.timer.isActive():
+			self.timer.start(self.interval)
+		self.tick()
+
+	def halt(self):
+		if self.timer is not None:
+			self.timer.stop()
+		self.thread().quit()
+
+class Subscription:
+	def __init__(self, slot, widget, background, keep_alive):
+		self.slot = slot
+		self.widget = widget
+		# intervalo (ms) enquanto escondido; None = suspenso
+		self.background = background
+		# keep_alive: recebe sempre no próprio intervalo (alertas, log...)
+		self.keep_alive = keep_alive
+		# fixed: intervalo (ms) que vale sempre, visível ou não (gravação)
+		self.fixed = None
+		self.last_delivery = 0.0
+
+class Sampler(QObject):
+	sampled = pyqtSignal(dict)
+	stop_requested = pyqtSignal()
+	interval_changed = pyqtSignal(int)
+	sample_now = pyqtSignal()
+
+	def __init__(self, interval=1000):
+		super().__init__()
+		self.interval = interval
+		self.last = None
+		self.subscriptions = []
+		self.minimized = False
+
+		self.worker = SamplerWorker(0)
+		self.worker_thread = QThread()
+		self.worker.moveToThread(self.worker_thread)
+		self.worker_thread.started.connect(self.worker.run)
+		self.worker.sampled.connect(self.publish)
+		self.stop_requested.connect(self.worker.halt)
+		self.interval_changed.connect(self.worker.set_interval)
+		self.sample_now.connect(self.worker.tick_now)
+
+	def start(self):
+		self.worker.interval = self.current_interval()
+		self.worker_thread.start()
+
+	def stop(self):
+		# o timer só pode ser parado pela thread que o criou
+		self.stop_requested.emit()
+		self.worker_thread.wait()
+
+	# ---------------- AGENDAMENTO ----------------
+	def is_visible(self, sub):
+		if sub.widget is None:
+			return True
+		return sub.widget.isVisible() and not self.minimized
+
+	def sub_interval(self, sub):
+		if sub.fixed:
+			return sub.fixed
+		if sub.keep_alive:
+			return sub.background
+		if self.is_visible(sub):
+			return self.interval
+		return sub.background
+
+	def current_interval(self):
+		intervals = [self.sub_interval(sub) for sub in self.subscriptions]
+		intervals = [i for i in intervals if i]
+		return min(intervals) if intervals else 0
+
+	def reschedule(self):
+		interval = self.current_interval()
+		if interval != self.worker.interval:
+			self.worker.interval = interval
+			self.interval_changed.emit(interval)
+
+	def set_fixed_interval(self, sub, interval):
+		# None volta a seguir a visibilidade do widget
+		sub.fixed = interval
+		self.reschedule()
+
+	def set_minimized(self, minimized):
+		self.minimized = minimized
+		self.reschedule()
+		if not minimized:
+			self.sample_now.emit()
+
+	def eventFilter(self, obj, event):
+		if event.type() == QEvent.Type.Show:
+			self.reschedule()
+			# a aba voltou a aparecer: atualiza na hora, sem esperar o timer
+			self.sample_now.emit()
+		elif event.type() == QEvent.Type.Hide:
+			self.reschedule()
+		return False
+
+	# ---------------- ENTREGA ----------------
+	@instrument.timed(category="sampler")
+	def publish(self, snap):
+		self.last = snap
+		now = time.monotonic()
+
+		for sub in self.subscriptions:
+			interval = self.sub_interval(sub)
+			if not interval:
+				continue
+			# folga de 10% para o jitter do timer não pular entregas
+			if (now - sub.last_delivery) * 1000 < interval * 0.9:
+				continue
+			sub.last_delivery = now
+			sub.slot(snap)
+
+		self.sampled.emit(snap)
+
+	def subscribe(self, slot, widget=None, background=None, keep_alive=False):
+		# widget: a coleta acompanha a visibilidade dele.
+		# background: intervalo (ms) enquanto escondido, None suspende.
+		sub = Subscription(instrument.wrap(slot, "ui"), widget, background, keep_alive)
+		self.subscriptions.append(sub)
+		if widget is not None:
+			widget.installEventFilter(self)
+
+		if self.last is not None:
+			sub.last_delivery = time.monotonic()
+			slot(self.last)
+
+		self.reschedule()
+		return sub
+
+# WORKERS
+# Consultas lentas (WMI, cpuinfo, GPUtil, NVML) rodam fora da thread da interface
+class TaskSignals(QObject):
+	finished = pyqtSignal(object)
+	failed = pyqtSignal(str)
+
+class Task(QRunnable):
+	def __init__(self, fn, args):
+		super().__init__()
+		self.setAutoDelete(False)
+		self.fn = fn
+		self.args = args
+		self.cancelled = False
+		self.signals = TaskSignals()
+
+	def run(self):
+		if self.cancelled:
+			return
+		try:
+			with instrument.span(getattr(self.fn, "__qualname__", repr(self.fn)), "worker"):
+				result = self.fn(*self.args)
+		except Exception as e:
+			if not self.cancelled:
+				self.signals.failed.emit(str(e))
+			return
+		if not self.cancelled:
+			self.signals.finished.emit(result)
+
+class WorkerPool(QObject):
+	def __init__(self, max_threads=4):
+		super().__init__()
+		self.pool = QThreadPool()
+		self.pool.setMaxThreadCount(max_threads)
+		self.tasks = set()
+		self.closed = False
+
+	def submit(self, fn, *args, on_done=None, on_error=None, timeout=15000):
+		task = Task(fn, args)
+		if self.closed:
+			return task
+		if on_done is not None:
+			on_done = instrument.wrap(on_done, "ui")
+
+		timer = QTimer(self)
+		timer.setSingleShot(True)
+
+		# cada tarefa termina uma vez só: resultado, erro ou timeout
+		def finish(callback, value):
+			if task not in self.tasks:
+				return
+			self.tasks.discard(task)
+			timer.stop()
+			timer.deleteLater()
+			if callback is not None:
+				callback(value)
+
+		def expire():
+			task.cancelled = True
+			finish(on_error, "timeout")
+
+		task.signals.finished.connect(lambda result: finish(on_done, result))
+		task.signals.failed.connect(lambda error: finish(on_error, error))
+		timer.timeout.connect(expire)
+
+		self.tasks.add(task)
+		timer.start(timeout)
+		self.pool.start(task)
+		return task
+
+	def shutdown(self, wait=2000):
+		self.closed = True
+		for task in self.tasks:
+			task.cancelled = True
+		self.tasks.clear()
+		self.pool.clear()
+		self.pool.waitForDone(wait)
+
+# Tarefas longas (benchmarks): uma thread própria cada, fora do WorkerPool,
+# que é das consultas curtas e conta o timeout desde o submit
+class TaskThreads(QObject):
+	def __init__(self):
+		super().__init__()
+		# Task -> (thread, cancel)
+		self.running = {}
+
+	def start(self, fn, *args, on_done=None, on_error=None, cancel=None):
+		task = Task(fn, args)
+
+		def finish(callback, value):
+			if self.running.pop(task, None) is None:
+				return
+			if callback is not None:
+				callback(value)
+
+		task.signals.finished.connect(lambda result: finish(on_done, result))
+		task.signals.failed.connect(lambda error: finish(on_error, error))
+		thread = threading.Thread(target=task.run, name=getattr(fn, "__qualname__", "task"))
+		self.running[task] = (thread, cancel)
+		thread.start()
+		return task
+
+	def shutdown(self, wait=10.0):
+		# ao fechar: avisa todas antes de esperar qualquer uma, para a limpeza
+		# de cada tarefa (processos, arquivo temporário) rodar em paralelo
+		running = list(self.running.items())
+		self.running.clear()
+		for task, (thread, cancel) in running:
+			task.cancelled = True
+			if cancel is not None:
+				cancel()
+		deadline = time.monotonic() + wait
+		for task, (thread, cancel) in running:
+			thread.join(max(0.0, deadline - time.monotonic()))
+
 # CPU TAB
 def detect_generation(cpu_name):
-	lang = LanguageManager()
 	cpu_name = cpu_name.lower()
 
 	# INTEL
@@ -304,7 +629,6 @@ def detect_generation(cpu_name):
 	return lang.t("unknown")
 
 def detect_cpu_info(cpu_name):
-	lang = LanguageManager()
 	name = cpu_name.lower()
 	# INTEL
 	if "intel" in name:
@@ -388,6 +712,55 @@ def detect_cpu_info(cpu_name):
 
 	return ("Unknown CPU", "Unknown", "Unknown")
 
+# Chave barata para o cache do cpuinfo: modelo + revisão do microcode
+def cpu_fingerprint(provider):
+	name = provider.cpu_name() or platform.processor()
+	microcode = provider.microcode()
+	microcode = hex(microcode) if microcode is not None else "N/A"
+	return f"{name}|{microcode}"
+
+# Depois de um início pelo cache: só a chave barata é lida de novo, e o
+# cpuinfo só roda outra vez se o processador ou o microcode mudaram
+@instrument.timed(category="inventory")
+def revalidate_cpu_static_info():
+	fingerprint = cpu_fingerprint(provider)
+	if fingerprint == cpu_cache.fingerprint:
+		return None
+	cpu_cache.fingerprint = fingerprint
+	return get_cpu_static_info(True)
+
+# Dados estáticos do processador (roda no WorkerPool).
+# refresh=True ignora o cache e roda o cpuinfo de novo
+@instrument.timed(category="inventory")
+def get_cpu_static_info(refresh=False):
+	cpu = None if refresh else cpu_cache.load()
+	cached = cpu is not None
+	if cpu is None:
+		cpu = cpuinfo.get_cpu_info()
+		cpu_cache.store(cpu)
+
+	try:
+		win_cpu = inventory.query("processor")[0]
+	except:
+		win_cpu = None
+
+	name = cpu.get("brand_raw", lang.t("unknown"))
+	codename, technology, socket = detect_cpu_info(name)
+	freq = psutil.cpu_freq()
+
+	return {
+		"name": name,
+		"generation": detect_generation(name),
+		"codename": codename,
+		"socket": socket,
+		"family": cpu.get("family", "N/A"),
+		"model": cpu.get("model", "N/A"),
+		"stepping": cpu.get("stepping", "N/A"),
+		"max_freq": freq.max if freq else "N/A",
+		"base_clock": win_cpu.MaxClockSpeed if win_cpu and win_cpu.MaxClockSpeed else "N/A",
+		"cached": cached,
+	}
+
 # CPU TAB
 class CPUTab(QWidget):
 	def __init__(self):
@@ -399,30 +772,17 @@ class CPUTab(QWidget):
 
 		main_layout = QVBoxLayout()
 
-		cpu = cpuinfo.get_cpu_info()
-		lang = LanguageManager()
-
-		try:
-			win_cpu = c.Win32_Processor()[0]
-		except:
-			win_cpu = None
-
 		self.cpu_data = {}
 
-		name    = cpu.get("brand_raw", lang.t("unknown"))
 		cores   = psutil.cpu_count(logical=False)
 		threads = psutil.cpu_count()
 
-		codename, technology, socket = detect_cpu_info(name)
-		generation = detect_generation(name)
-
-		family   = cpu.get("family", "N/A")
-		model    = cpu.get("model", "N/A")
-		stepping = cpu.get("stepping", "N/A")
-
-		freq       = psutil.cpu_freq()
-		max_freq   = freq.max if freq else "N/A"
-		base_clock = win_cpu.MaxClockSpeed if win_cpu else "N/A"
+		self.name_value       = blue_label("...")
+		self.generation_value = blue_label("...")
+		self.socket_value     = blue_label("...")
+		self.family_value     = blue_label("...")
+		self.model_value      = blue_label("...")
+		self.stepping_value   = blue_label("...")
 
 		# ================= PROCESSOR PROPERTIES =================
 		prop_group = QGroupBox(lang.t("tab_processor"))
@@ -432,15 +792,15 @@ class CPUTab(QWidget):
 		row = 0
 
 		prop_layout.addWidget(QLabel(lang.t("name")), row, 0)
-		prop_layout.addWidget(blue_label(name), row, 1, 1, 5)
+		prop_layout.addWidget(self.name_value, row, 1, 1, 5)
 		row += 1
 
 		prop_layout.addWidget(QLabel(lang.t("generation")), row, 0)
-		prop_layout.addWidget(blue_label(f"{generation} ({codename})"), row, 1, 1, 5)
+		prop_layout.addWidget(self.generation_value, row, 1, 1, 5)
 		row += 1
 
 		prop_layout.addWidget(QLabel(lang.t("socket")), row, 0)
-		prop_layout.addWidget(blue_label(str(socket)), row, 1, 1, 5)
+		prop_layout.addWidget(self.socket_value, row, 1, 1, 5)
 		row += 1
 
 		prop_layout.addWidget(QLabel(lang.t("cores")), row, 0)
@@ -451,13 +811,13 @@ class CPUTab(QWidget):
 		row += 1
 
 		prop_layout.addWidget(QLabel(lang.t("family")), row, 0)
-		prop_layout.addWidget(blue_label(str(family)), row, 1)
+		prop_layout.addWidget(self.family_value, row, 1)
 
 		prop_layout.addWidget(QLabel(lang.t("model")), row, 2)
-		prop_layout.addWidget(blue_label(str(model)), row, 3)
+		prop_layout.addWidget(self.model_value, row, 3)
 
 		prop_layout.addWidget(QLabel(lang.t("stepping")), row, 4)
-		prop_layout.addWidget(blue_label(str(stepping)), row, 5)
+		prop_layout.addWidget(self.stepping_value, row, 5)
 
 		prop_group.setLayout(prop_layout)
 		main_layout.addWidget(prop_group)
@@ -466,8 +826,8 @@ class CPUTab(QWidget):
 		clocks_group.setProperty("profile", True)
 		clocks_layout = QGridLayout()
 
-		self.base_clock_label = blue_label(f"{base_clock} MHz")
-		self.max_clock_label = blue_label(f"{max_freq} MHz")
+		self.base_clock_label = blue_label("...")
+		self.max_clock_label = blue_label("...")
 		self.current_clock_label = blue_label("...")
 
 		clocks_layout.addWidget(QLabel(lang.t("base_clock")), 0, 0)
@@ -490,6 +850,13 @@ class CPUTab(QWidget):
 		usage_layout.addWidget(QLabel(lang.t("cpu_in_use")), 0, 0)
 		usage_layout.addWidget(self.usage_label, 0, 1)
 
+		# uso por núcleo lógico
+		self.busiest_label = blue_label("-")
+		self.heatmap = CoreHeatmap()
+		usage_layout.addWidget(QLabel(lang.t("busiest_core")), 1, 0)
+		usage_layout.addWidget(self.busiest_label, 1, 1)
+		usage_layout.addWidget(self.heatmap, 2, 0, 1, 2)
+
 		usage_group.setLayout(usage_layout)
 
 		main_layout.addWidget(clocks_group)
@@ -524,11 +891,41 @@ class CPUTab(QWidget):
 		frame_layout = QVBoxLayout()
 		frame_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
-		logo_label = QLabel()
-		logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-		logo_label.setFixedSize(130, 130)
+		self.logo_label = QLabel()
+		self.logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+		self.logo_label.setFixedSize(130, 130)
 
-		name_lower = name.lower()
+		frame_layout.addWidget(self.logo_label)
+		frame.setLayout(frame_layout)
+
+		root_layout.addLayout(main_layout)
+		root_layout.addWidget(frame, alignment=Qt.AlignmentFlag.AlignTop)
+
+		self.setLayout(root_layout)
+
+		workers.submit(
+			get_cpu_static_info,
+			on_done=self.populate,
+			on_error=self.populate_failed,
+			timeout=30000
+		)
+		sampler.subscribe(self.update_dynamic, self)
+
+	def populate(self, info):
+		# veio do cache: confere em segundo plano, depois que a janela já abriu
+		if info["cached"]:
+			QTimer.singleShot(10000, self.revalidate)
+
+		self.name_value.setText(info["name"])
+		self.generation_value.setText(f"{info['generation']} ({info['codename']})")
+		self.socket_value.setText(str(info["socket"]))
+		self.family_value.setText(str(info["family"]))
+		self.model_value.setText(str(info["model"]))
+		self.stepping_value.setText(str(info["stepping"]))
+		self.base_clock_label.setText(f"{info['base_clock']} MHz")
+		self.max_clock_label.setText(f"{info['max_freq']} MHz")
+
+		name_lower = info["name"].lower()
 
 		if "intel" in name_lower:
 			img_path = resource_path("files/images/intel.png")
@@ -542,7 +939,7 @@ class CPUTab(QWidget):
 		pixmap = QPixmap(img_path)
 
 		if not pixmap.isNull():
-			logo_label.setPixmap(
+			self.logo_label.setPixmap(
 				pixmap.scaled(
 					120,
 					120,
@@ -551,22 +948,25 @@ class CPUTab(QWidget):
 				)
 			)
 
-		frame_layout.addWidget(logo_label)
-		frame.setLayout(frame_layout)
+	def revalidate(self):
+		workers.submit(revalidate_cpu_static_info, on_done=self.revalidated, timeout=60000)
 
-		root_layout.addLayout(main_layout)
-		root_layout.addWidget(frame, alignment=Qt.AlignmentFlag.AlignTop)
+	def revalidated(self, info):
+		# None: mesma chave, o cache continua valendo
+		if info is not None:
+			self.populate(info)
 
-		self.setLayout(root_layout)
-
-		self.timer = QTimer()
-		self.timer.timeout.connect(self.update_dynamic)
-		self.timer.start(1000)
+	def populate_failed(self, error):
+		print("cpu info error:", error)
+		for label in (self.name_value, self.generation_value, self.socket_value,
+				self.family_value, self.model_value, self.stepping_value,
+				self.base_clock_label, self.max_clock_label):
+			label.setText("N/A")
 
 	# UPDATE
-	def update_dynamic(self):
-		freq = psutil.cpu_freq()
-		usage = psutil.cpu_percent()
+	def update_dynamic(self, snap):
+		freq = snap["cpu_freq"]
+		usage = snap["cpu_percent"]
 
 		if freq:
 			speed = f"{freq.current:.2f} MHz"
@@ -588,6 +988,12 @@ class CPUTab(QWidget):
 
 		self.usage_label.setStyleSheet(f"color:{color};font-weight:bold;")
 
+		percpu = snap.get("cpu_percpu")
+		if percpu:
+			core, value = max(enumerate(percpu), key=lambda item: item[1])
+			self.busiest_label.setText(f"#{core} ({value:.0f} %)")
+		self.heatmap.add_sample(snap)
+
 	# EXPORT
 	def export_json(self):
 		file_name, _ = QFileDialog.getSaveFileName(
@@ -602,36 +1008,71 @@ class CPUTab(QWidget):
 				json.dump(self.cpu_data, f, indent=4)
 
 # MAINBOARD
+# Dados da placa mãe, BIOS e barramento de vídeo (roda no WorkerPool)
+@instrument.timed(category="inventory")
+def get_mainboard_info():
+	info = {}
+
+	try:
+		board = inventory.query("baseboard")[0]
+		info["manufacturer"] = board.Manufacturer
+		info["model"] = board.Product
+	except:
+		info["manufacturer"] = "N/A"
+		info["model"] = "N/A"
+
+	try:
+		cpu = inventory.query("processor")[0]
+		info["bus"] = f"{cpu.ExtClock} MHz" if cpu.ExtClock else "N/A"
+	except:
+		info["bus"] = "N/A"
+
+	try:
+		bios = inventory.query("bios")[0]
+		info["brand"] = bios.Manufacturer
+		info["version"] = bios.SMBIOSBIOSVersion
+		raw_date = bios.ReleaseDate[:8]
+
+		if len(raw_date) == 8:
+			info["date"] = f"{raw_date[6:8]}/{raw_date[4:6]}/{raw_date[0:4]}"
+		else:
+			info["date"] = "N/A"
+	except:
+		info["brand"] = info["version"] = info["date"] = "N/A"
+
+	microcode = inventory.provider.microcode()
+	info["microcode"] = hex(microcode) if microcode is not None else "N/A"
+
+	try:
+		gpu = inventory.query("video")[0]
+		info["gpu_bus"] = "PCI Express"
+	except:
+		info["gpu_bus"] = "N/A"
+
+	return info
+
+MAINBOARD_KEYS = (
+	"manufacturer", "model", "bus",
+	"brand", "version", "date", "microcode",
+	"gpu_bus",
+)
+
 class MainboardTab(QWidget):
 	def __init__(self):
 		super().__init__()
 
 		main_layout = QVBoxLayout()
+		self.values = {}
 
 		# MOTHERBOARD GROUP
-		lang = LanguageManager()
 		mb_group = QGroupBox(lang.t("motherboard"))
 		mb_group.setProperty("profile", True)
 		mb_layout = QGridLayout()
 
-		try:
-			board = c.Win32_BaseBoard()[0]
-			manufacturer = board.Manufacturer
-			model = board.Product
-		except:
-			manufacturer = "N/A"
-			model = "N/A"
-
-		try:
-			cpu = c.Win32_Processor()[0]
-			bus = f"{cpu.ExtClock} MHz"
-		except:
-			bus = "N/A"
-
 		mb_data = [
-			(lang.t("manufacture"), manufacturer),
-			(lang.t("model"), model),
-			(lang.t("bus_specs"), bus),
+			(lang.t("manufacture"), "manufacturer"),
+			(lang.t("model"), "model"),
+			(lang.t("bus_specs"), "bus"),
 			(lang.t("chipset"), lang.t("chipset_value")),
 			(lang.t("southbridge"), lang.t("southbridge_value")),
 			(lang.t("lpcio"), lang.t("no_access")),
@@ -639,7 +1080,7 @@ class MainboardTab(QWidget):
 
 		for i, (label, value) in enumerate(mb_data):
 			mb_layout.addWidget(QLabel(label + ":"), i, 0)
-			mb_layout.addWidget(blue_label(str(value)), i, 1)
+			mb_layout.addWidget(self.value_label(value), i, 1)
 
 		mb_group.setLayout(mb_layout)
 		main_layout.addWidget(mb_group)
@@ -653,39 +1094,16 @@ class MainboardTab(QWidget):
 		mb_group.setProperty("profile", True)
 		bios_layout = QGridLayout()
 
-		try:
-			bios = c.Win32_BIOS()[0]
-			brand = bios.Manufacturer
-			version = bios.SMBIOSBIOSVersion
-			raw_date = bios.ReleaseDate[:8]
-
-			if len(raw_date) == 8:
-				date = f"{raw_date[6:8]}/{raw_date[4:6]}/{raw_date[0:4]}"
-			else:
-				date = "N/A"
-		except:
-			brand = version = date = "N/A"
-
-		try:
-			key = winreg.OpenKey(
-				winreg.HKEY_LOCAL_MACHINE,
-				r"HARDWARE\DESCRIPTION\System\\CentralProcessor\0"
-			)
-			microcode, _ = winreg.QueryValueEx(key, "Update Revision")
-			microcode = hex(microcode)
-		except:
-			microcode = "N/A"
-
 		bios_data = [
-			(lang.t("brand"), brand),
-			(lang.t("version"), version),
-			(lang.t("date"), date),
-			(lang.t("microcode"), microcode),
+			(lang.t("brand"), "brand"),
+			(lang.t("version"), "version"),
+			(lang.t("date"), "date"),
+			(lang.t("microcode"), "microcode"),
 		]
 
 		for i, (label, value) in enumerate(bios_data):
 			bios_layout.addWidget(QLabel(label), i, 0)
-			bios_layout.addWidget(blue_label(str(value)), i, 1)
+			bios_layout.addWidget(self.value_label(value), i, 1)
 
 		bios_group.setLayout(bios_layout)
 
@@ -694,14 +1112,8 @@ class MainboardTab(QWidget):
 		graphics_group.setProperty("profile", True)
 		graphics_layout = QGridLayout()
 
-		try:
-			gpu = c.Win32_VideoController()[0]
-			bus = "PCI Express"
-		except:
-			bus = "N/A"
-
 		graphics_data = [
-			(lang.t("bus"), bus),
+			(lang.t("bus"), "gpu_bus"),
 			(lang.t("gpu_larg"), "x16 (Assumed)"),
 			(lang.t("gpu_max"), "x16"),
 			(lang.t("gpu_speed_now"), lang.t("gpu_speed_now2")),
@@ -710,7 +1122,7 @@ class MainboardTab(QWidget):
 
 		for i, (label, value) in enumerate(graphics_data):
 			graphics_layout.addWidget(QLabel(label), i, 0)
-			graphics_layout.addWidget(blue_label(str(value)), i, 1)
+			graphics_layout.addWidget(self.value_label(value), i, 1)
 
 		graphics_group.setLayout(graphics_layout)
 
@@ -720,8 +1132,26 @@ class MainboardTab(QWidget):
 
 		self.setLayout(main_layout)
 
+		workers.submit(get_mainboard_info, on_done=self.populate, on_error=self.populate_failed)
+
+	# valores fixos aparecem direto, chaves de get_mainboard_info esperam o worker
+	def value_label(self, value):
+		if value in MAINBOARD_KEYS:
+			label = blue_label("...")
+			self.values[value] = label
+			return label
+		return blue_label(str(value))
+
+	def populate(self, info):
+		for key, label in self.values.items():
+			label.setText(str(info.get(key, "N/A")))
+
+	def populate_failed(self, error):
+		print("mainboard info error:", error)
+		self.populate({})
+
+@instrument.timed(category="inventory")
 def get_real_ram_info_slots():
-	lang = LanguageManager()
 	ddr_map  = config_file.ddr_map
 	ram_data = {
 		"total_size_gb": 0,
@@ -731,7 +1161,7 @@ def get_real_ram_info_slots():
 	}
 
 	try:
-		modules = c.Win32_PhysicalMemory()
+		modules = inventory.query("memory")
 		total_size = 0
 		speeds = []
 
@@ -744,7 +1174,7 @@ def get_real_ram_info_slots():
 			speeds.append(speed)
 
 			mem_type = ddr_map.get(getattr(mem, "SMBIOSMemoryType", 0), lang.t("unknown"))
-			manufacturer = getattr(mem, "Manufacturer", lang.t("unknown"))
+			manufacturer = getattr(mem, "Manufacturer", None) or lang.t("unknown")
 
 			slot_info["manufacturer"] = manufacturer
 			slot_info["capacity_gb"] = round(capacity / (1024**3), 2)
@@ -772,9 +1202,10 @@ def get_real_ram_info_slots():
 
 	return ram_data
 
+@instrument.timed(category="inventory")
 def get_real_ram_info():
-	lang = LanguageManager()
 	modules = []
+	capacities = []
 	total_capacity = 0
 	speeds = []
 	speeds2 = []
@@ -789,14 +1220,14 @@ def get_real_ram_info():
 	}
 
 	try:
-		modules = c.Win32_PhysicalMemory()
+		modules = inventory.query("memory")
 		total_size = 0
 		manufacturers = set()
 		speeds2 = set()
 
 		for mem in modules:
 			total_size += int(mem.Capacity)
-			manufacturers.add(getattr(mem, "Manufacturer", lang.t("unknown")))
+			manufacturers.add(getattr(mem, "Manufacturer", None) or lang.t("unknown"))
 			speeds2.add(getattr(mem, "Speed", 0))
 
 		ram_info["size"] = total_size / (1024**3)  # GBytes
@@ -804,7 +1235,7 @@ def get_real_ram_info():
 		ram_info["speed"] = max(speeds2) if speeds2 else 0
 		ram_info["type"] = getattr(modules[0], "MemoryType", lang.t("unknown"))
 
-		arrays = c.Win32_PhysicalMemoryArray()
+		arrays = inventory.query("memory_arrays")
 		if arrays:
 			ram_info["channel"] = f"{getattr(arrays[0], 'MemoryDevices', 0)} Modules"
 		else:
@@ -815,7 +1246,7 @@ def get_real_ram_info():
 
 	ddr_map  = config_file.ddr_map
 
-	for mem in c.Win32_PhysicalMemory():
+	for mem in inventory.query("memory"):
 		capacity = int(mem.Capacity)
 		total_capacity += capacity
 
@@ -824,14 +1255,14 @@ def get_real_ram_info():
 		if mem.SMBIOSMemoryType in ddr_map:
 			mem_type = ddr_map[mem.SMBIOSMemoryType]
 
-		modules.append(capacity)
+		capacities.append(capacity)
 
 	total_gb = total_capacity / (1024**3)
 
 	# Detecta channel básico
 	channel = "Single"
-	if len(modules) >= 2:
-		if len(set(modules)) == 1:
+	if len(capacities) >= 2:
+		if len(set(capacities)) == 1:
 			channel = "Dual"
 		else:
 			channel = "Multi"
@@ -846,14 +1277,16 @@ def get_real_ram_info():
 		"speed": speed
 	}
 
-def get_dynamic_timings():
+# Timings são estáticos: lidos uma vez e só recarregados em MemoryTab.refresh_static
+@instrument.timed(category="inventory")
+def get_memory_timings():
 	timings = {
 		"mem_dram_freq": 0,
 		"mem_fsb_dram": "0:0",
 		"mem_command_rate": "2T"  # fixo
 	}
 	try:
-		for mem in c.Win32_PhysicalMemory():
+		for mem in inventory.query("memory"):
 			# Frequência DRAM real (MHz)
 			timings["mem_dram_freq"] = getattr(mem, "ConfiguredClockSpeed", 0)
 			# FSB:DRAM ratio aproximado
@@ -867,16 +1300,34 @@ def get_dynamic_timings():
 
 	return timings
 
+# Tudo que o MemoryTab precisa do inventário, em uma tarefa só
+def get_memory_static_info():
+	return get_real_ram_info(), get_real_ram_info_slots(), get_memory_timings()
+
+# Benchmark de memória + banda teórica dos módulos detectados (tipo e velocidade do inventário)
+def run_memory_benchmark(bench):
+	result = bench.run()
+	if result is None:
+		return None
+	try:
+		result["theoretical"] = membench.theoretical_bandwidth(inventory.query("memory"), config_file.ddr_map)
+	except Exception as e:
+		print(lang.t("error_get_ram_info"), e)
+		result["theoretical"] = None
+	return result
+
+def format_size(size):
+	for unit in ("B", "KiB", "MiB", "GiB"):
+		if size < 1024 or unit == "GiB":
+			return f"{size:g} {unit}"
+		size /= 1024
+
 # MemoryTab
 class MemoryTab(QWidget):
 	def __init__(self):
 		super().__init__()
-		lang = LanguageManager()
 		main_layout = QVBoxLayout()
 
-		self.ram_info = get_real_ram_info()
-		self.ram_info_slots = get_real_ram_info_slots()
-
 		self.general_group = QGroupBox()
 		self.general_group.setProperty("profile", True)
 
@@ -889,7 +1340,7 @@ class MemoryTab(QWidget):
 		self.size_value = blue_label()
 
 		self.channel_label = QLabel()
-		self.channel_value = blue_label(self.ram_info_slots["total_channels"])
+		self.channel_value = blue_label()
 		
 		general_grid.addWidget(self.type_label, 0, 0)
 		general_grid.addWidget(self.type_value, 0, 1)
@@ -929,48 +1380,175 @@ class MemoryTab(QWidget):
 
 		self.timing_group.setLayout(timing_grid)
 
+		self.refresh_btn = QPushButton()
+		self.refresh_btn.clicked.connect(self.refresh_static)
+
+		# benchmark de memória (membench.py), roda numa thread própria (TaskThreads)
+		self.mem_bench = None
+		self.bench_group = QGroupBox()
+		self.bench_group.setProperty("profile", True)
+		bench_grid = QGridLayout()
+
+		self.bench_labels = []
+		self.bench_values = []
+		for row in range(4):
+			label = QLabel()
+			value = blue_label()
+			value.setText("-")
+			self.bench_labels.append(label)
+			self.bench_values.append(value)
+			bench_grid.addWidget(label, row, 0)
+			bench_grid.addWidget(value, row, 1)
+
+		self.latency_label = QLabel()
+		self.latency_value = blue_label()
+		self.latency_value.setWordWrap(True)
+		self.latency_value.setText("-")
+		bench_grid.addWidget(self.latency_label, 4, 0)
+		bench_grid.addWidget(self.latency_value, 4, 1)
+
+		self.bench_status = QLabel()
+		self.bench_status.setWordWrap(True)
+		self.bench_status.hide()
+		bench_grid.addWidget(self.bench_status, 5, 0, 1, 2)
+
+		self.mem_bench_btn = QPushButton()
+		self.mem_bench_btn.clicked.connect(self.toggle_mem_bench)
+		bench_grid.addWidget(self.mem_bench_btn, 6, 0, 1, 2)
+		self.bench_group.setLayout(bench_grid)
+
 		# ADD GROUPS
 		main_layout.addWidget(self.general_group)
 		main_layout.addWidget(self.timing_group)
+		main_layout.addWidget(self.refresh_btn)
+		main_layout.addWidget(self.bench_group)
 		main_layout.addStretch()
 		self.setLayout(main_layout)
 
+		self.ram_info = None
 		self.apply_language()
-		self.update_memory()
+		self.load_static()
+		sampler.subscribe(self.update_memory, self)
 
-		# TIMER
-		self.timer = QTimer()
-		self.timer.timeout.connect(self.update_memory)
-		self.timer.start(1000)
+	# STATIC (inventário) - uma vez, ou quando o usuário pede
+	def load_static(self):
+		self.refresh_btn.setEnabled(False)
+		workers.submit(get_memory_static_info, on_done=self.populate, on_error=self.populate_failed)
+
+	def populate(self, data):
+		self.ram_info, self.ram_info_slots, self.timings = data
+		self.refresh_btn.setEnabled(True)
+
+		self.type_value.setText(f"{self.ram_info['type']} ({self.ram_info['channel']})")
+		self.channel_value.setText(self.ram_info_slots["total_channels"])
+
+		self.timing_values[0].setText(f"{self.timings['mem_dram_freq']} (MHz)")
+		self.timing_values[1].setText(self.timings['mem_fsb_dram'])
+		self.timing_values[2].setText(self.timings['mem_command_rate'])
+
+	def populate_failed(self, error):
+		print(lang.t("error_get_ram_info"), error)
+		self.refresh_btn.setEnabled(True)
+
+	def refresh_static(self):
+		inventory.invalidate("memory", "memory_arrays")
+		self.load_static()
 
-	def update_memory(self):
-		mem = psutil.virtual_memory()
-		info = self.ram_info
+	# DYNAMIC (psutil) - a cada tick do sampler
+	def update_memory(self, snap):
+		mem = snap["memory"]
 
-		total_gb = info["size"]
+		total_gb = self.ram_info["size"] if self.ram_info else mem.total / (1024**3)
 		used_gb = mem.used / (1024**3)
 		available_gb = mem.available / (1024**3)
-		ram_type = info["type"]
-		channel = info["channel"]
 
-		self.type_value.setText(f"{ram_type} ({channel})")
 		self.size_value.setText(
 			f"{total_gb:.0f} GBytes "
 			f"(Used {used_gb:.2f} GB / {mem.percent}% | Free {available_gb:.2f} GB)"
 		)
 
-		dynamic_timings = get_dynamic_timings()
-		self.timing_values[0].setText(f"{dynamic_timings['mem_dram_freq']} (MHz)")
-		self.timing_values[1].setText(dynamic_timings['mem_fsb_dram'])
-		self.timing_values[2].setText(dynamic_timings['mem_command_rate'])
+		if self.mem_bench is not None:
+			self.bench_status.setText(lang.t("membench_running").format(
+				phase=lang.t("membench_phase_" + (self.mem_bench.phase or "bandwidth")),
+				percent=round(self.mem_bench.progress() * 100)
+			))
+
+	# BENCHMARK
+	def toggle_mem_bench(self):
+		if self.mem_bench is not None:
+			self.mem_bench.cancel()
+			self.mem_bench_btn.setEnabled(False)
+			return
+		self.mem_bench = membench.MemoryBenchmark()
+		self.bench_status.setText(lang.t("membench_running").format(
+			phase=lang.t("membench_phase_bandwidth"), percent=0
+		))
+		self.bench_status.show()
+		threads.start(
+			run_memory_benchmark, self.mem_bench,
+			on_done=self.mem_bench_done,
+			on_error=self.mem_bench_failed,
+			cancel=self.mem_bench.cancel
+		)
+		self.apply_language()
+
+	def mem_bench_done(self, result):
+		self.mem_bench = None
+		self.mem_bench_btn.setEnabled(True)
+		self.apply_language()
+		if result is None:
+			self.bench_status.setText(lang.t("membench_cancelled"))
+			return
+
+		bandwidth = result["bandwidth"]
+		theoretical = result["theoretical"]
+		for value, key in zip(self.bench_values, ("read", "write", "copy")):
+			text = f"{bandwidth[key] / 1e9:.1f} GB/s"
+			if theoretical:
+				text += f" ({bandwidth[key] / theoretical['bandwidth'] * 100:.0f}%)"
+			value.setText(text)
+
+		if theoretical:
+			self.bench_values[3].setText(lang.t("membench_theoretical_value").format(
+				type=theoretical["type"] or "DDR",
+				speed=theoretical["speed"],
+				channels=theoretical["channels"],
+				bandwidth=f"{theoretical['bandwidth'] / 1e9:.1f}"
+			))
+		else:
+			self.bench_values[3].setText("N/A")
+
+		# espaço inquebrável: a quebra de linha só acontece entre os tamanhos
+		self.latency_value.setText("   ".join(
+			f"{format_size(row['size'])}: {row['ns']:.1f} ns".replace(" ", "\u00a0") for row in result["latency"]
+		))
+		self.bench_status.setText(lang.t("membench_result").format(
+			buffer=format_size(result["buffer"]),
+			backend=result["backend"],
+			overhead=f"{result['loop_overhead_ns']:.0f}"
+		))
+
+	def mem_bench_failed(self, error):
+		print("memory benchmark error:", error)
+		if self.mem_bench is not None:
+			self.mem_bench.cancel()
+		self.mem_bench = None
+		self.mem_bench_btn.setEnabled(True)
+		self.bench_status.setText(lang.t("membench_failed").format(error=error))
+		self.apply_language()
 
 	def apply_language(self):
-		lang = LanguageManager()
 		self.general_group.setTitle(lang.t("mem_general"))
 		self.timing_group.setTitle(lang.t("mem_timings"))
 		self.type_label.setText(lang.t("mem_type"))
 		self.size_label.setText(lang.t("mem_size"))
 		self.channel_label.setText(lang.t("mem_channel"))
+		self.refresh_btn.setText(lang.t("mem_refresh"))
+		self.bench_group.setTitle(lang.t("membench_title"))
+		for label, key in zip(self.bench_labels, ("membench_read", "membench_write", "membench_copy", "membench_theoretical")):
+			label.setText(lang.t(key))
+		self.latency_label.setText(lang.t("membench_latency"))
+		self.mem_bench_btn.setText(lang.t("membench_stop" if self.mem_bench else "membench_run"))
 
 		timing_keys = [
 			"mem_dram_freq",
@@ -996,260 +1574,575 @@ class SPDTab(QWidget):
 		super().__init__()
 		layout = QVBoxLayout()
 		layout.setSpacing(10)
-		lang = LanguageManager()
 		group = QGroupBox(lang.t("spd_title"))
 		group.setProperty("profile", True)
-		group_layout = QVBoxLayout()
-		group.setLayout(group_layout)
-
-		try:
-			ram_modules = c.Win32_PhysicalMemory()
-			grid_layout = QGridLayout()
-			grid_layout.setSpacing(10)
+		self.group_layout = QVBoxLayout()
+		group.setLayout(self.group_layout)
 
-			if not ram_modules:
-				group_layout.addWidget(QLabel(lang.t("no_ram_error")))
-			else:
-				for i, mem in enumerate(ram_modules):
-					card = QGroupBox(f"Slot {i+1}: {getattr(mem, 'DeviceLocator', lang.t("unknown"))}")
-					card.setProperty("profile", True)
-					card_layout = QGridLayout()
-
-					attrs = {
-						lang.t("bank_label"): getattr(mem, "BankLabel", "N/A"),
-						lang.t("device_locator"): getattr(mem, "DeviceLocator", "N/A"),
-						lang.t("manufacture"): getattr(mem, "Manufacturer", "N/A"),
-						lang.t("serial_number"): getattr(mem, "SerialNumber", "N/A"),
-						lang.t("capacity_in_gb"): round(int(getattr(mem, "Capacity", 0)) / (1024**3), 2),
-						lang.t("speed_in_hz"): getattr(mem, "Speed", "N/A"),
-						lang.t("config_clock_speed"): getattr(mem, "ConfiguredClockSpeed", "N/A"),
-						lang.t("memory_type"): getattr(mem, "MemoryType", "N/A"),
-						lang.t("smbios_type"): getattr(mem, "SMBIOSMemoryType", "N/A"),
-						lang.t("form_factor"): getattr(mem, "FormFactor", "N/A"),
-						lang.t("data_width"): getattr(mem, "DataWidth", "N/A"),
-						lang.t("total_width"): getattr(mem, "TotalWidth", "N/A"),
-						lang.t("voltage_set"): getattr(mem, "ConfiguredVoltage", "N/A"),
-						lang.t("status"): getattr(mem, "Status", "N/A"),
-						lang.t("tag"): getattr(mem, "Tag", "N/A")
-					}
-
-					row = 0
-					for key, value in attrs.items():
-						label_widget = QLabel(f"{key}:")
-						label_widget.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-						value_widget = blue_label(str(value))
-						value_widget.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-
-						card_layout.addWidget(label_widget, row, 0)
-						card_layout.addWidget(value_widget, row, 1)
-						row += 1
-
-					card.setLayout(card_layout)
-
-					grid_row = i // 2
-					grid_col = i % 2
-					grid_layout.addWidget(card, grid_row, grid_col)
-
-				group_layout.addLayout(grid_layout)
-
-		except Exception as e:
-			group_layout.addWidget(QLabel(f"SPD not available: {e}"))
+		self.loading_label = QLabel(lang.t("loading"))
+		self.group_layout.addWidget(self.loading_label)
 
 		layout.addWidget(group)
 		layout.addStretch()
 		self.setLayout(layout)
 
+		workers.submit(
+			inventory.query, "memory",
+			on_done=self.populate,
+			on_error=self.populate_failed
+		)
+
+	def populate(self, ram_modules):
+		try:
+			self.build_cards(ram_modules)
+			self.loading_label.hide()
+		except Exception as e:
+			self.populate_failed(e)
+
+	def build_cards(self, ram_modules):
+		group_layout = self.group_layout
+		grid_layout = QGridLayout()
+		grid_layout.setSpacing(10)
+
+		if not ram_modules:
+			group_layout.addWidget(QLabel(lang.t("no_ram_error")))
+		else:
+			for i, mem in enumerate(ram_modules):
+				card = QGroupBox(f"Slot {i+1}: {getattr(mem, 'DeviceLocator', lang.t('unknown'))}")
+				card.setProperty("profile", True)
+				card_layout = QGridLayout()
+
+				attrs = {
+					lang.t("bank_label"): getattr(mem, "BankLabel", "N/A"),
+					lang.t("device_locator"): getattr(mem, "DeviceLocator", "N/A"),
+					lang.t("manufacture"): getattr(mem, "Manufacturer", "N/A"),
+					lang.t("serial_number"): getattr(mem, "SerialNumber", "N/A"),
+					lang.t("capacity_in_gb"): round(int(getattr(mem, "Capacity", 0)) / (1024**3), 2),
+					lang.t("speed_in_hz"): getattr(mem, "Speed", "N/A"),
+					lang.t("config_clock_speed"): getattr(mem, "ConfiguredClockSpeed", "N/A"),
+					lang.t("memory_type"): getattr(mem, "MemoryType", "N/A"),
+					lang.t("smbios_type"): getattr(mem, "SMBIOSMemoryType", "N/A"),
+					lang.t("form_factor"): getattr(mem, "FormFactor", "N/A"),
+					lang.t("data_width"): getattr(mem, "DataWidth", "N/A"),
+					lang.t("total_width"): getattr(mem, "TotalWidth", "N/A"),
+					lang.t("voltage_set"): getattr(mem, "ConfiguredVoltage", "N/A"),
+					lang.t("status"): getattr(mem, "Status", "N/A"),
+					lang.t("tag"): getattr(mem, "Tag", "N/A")
+				}
+
+				row = 0
+				for key, value in attrs.items():
+					label_widget = QLabel(f"{key}:")
+					label_widget.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+					value_widget = blue_label(str(value))
+					value_widget.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+
+					card_layout.addWidget(label_widget, row, 0)
+					card_layout.addWidget(value_widget, row, 1)
+					row += 1
+
+				card.setLayout(card_layout)
+
+				grid_row = i // 2
+				grid_col = i % 2
+				grid_layout.addWidget(card, grid_row, grid_col)
+
+			group_layout.addLayout(grid_layout)
+
+	def populate_failed(self, error):
+		self.loading_label.setText(f"SPD not available: {error}")
+
+# Leitura das GPUs pelo GPUSampler (NVML, ou GPUtil sem NVML) - roda no WorkerPool.
+# As chaves são as de tradução: o texto sai na hora de mostrar.
+def gpu_attrs(gpu):
+	used = gpu.memory_used
+	total = gpu.memory_total
+	attrs = {
+		"gpu_name": gpu.name,
+		"UUID": gpu.uuid,
+		"GPU ID": gpu.index,
+		"gpu_load": round(gpu.load, 2) if gpu.load is not None else "N/A",
+		"gpu_memory_total": round(total) if total is not None else "N/A",
+		"gpu_memory_used": round(used) if used is not None else "N/A",
+		"gpu_memory_free": round(total - used) if total is not None and used is not None else "N/A",
+		"gpu_memory_in_use": round(
+			(used / total) * 100, 2
+		) if total else "N/A",
+		"temperature": gpu.temperature,
+		"driver": gpu.driver or "N/A",
+		"display_active": gpu.display_active if gpu.display_active is not None else "N/A",
+	}
+	# só o NVML tem estes; o GPUtil deixa None
+	extras = {
+		"gpu_utilization": gpu.load,
+		"memory_controller": gpu.memory_load,
+		"power_usage": round(gpu.power, 2) if gpu.power is not None else None,
+		"power_limit": round(gpu.power_limit, 2) if gpu.power_limit is not None else None,
+		"fan_speed": gpu.fan,
+		"graph_clock": gpu.clock_graphics,
+		"memory_type_clock": gpu.clock_memory,
+		"vram_used": round(used) if gpu_sampler.available() and used is not None else None,
+		"vram_free": round(total - used) if gpu_sampler.available() and used is not None else None,
+	}
+	attrs.update({key: value for key, value in extras.items() if value is not None})
+	return attrs
+
+# (chave de tradução da legenda, valor 0-100) dos gráficos de cada GPU
+def gpu_graph_values(gpu):
+	values = {
+		"gpu_load": gpu.load,
+		"gpu_memory_in_use": None,
+		"power_usage": None,
+		"temperature": gpu.temperature,
+	}
+	if gpu.memory_used is not None and gpu.memory_total:
+		values["gpu_memory_in_use"] = gpu.memory_used * 100 / gpu.memory_total
+	# potência em % do limite
+	if gpu.power is not None and gpu.power_limit:
+		values["power_usage"] = min(100, gpu.power * 100 / gpu.power_limit)
+	return values
+
+GPU_GRAPHS = ("gpu_load", "gpu_memory_in_use", "power_usage", "temperature")
+
+@instrument.timed(category="gpu")
+def get_gpu_info():
+	return [
+		{"name": gpu.name, "attrs": gpu_attrs(gpu), "sample": gpu}
+		for gpu in gpu_sampler.sample()
+	]
 
 class GraphicsTab(QWidget):
 	def __init__(self):
 		super().__init__()
 
+		# por GPU: chave -> label, chave -> último texto, legenda -> gráfico
+		self.value_labels = []
+		self.texts = []
+		self.graphs = []
+		self.poll_pending = False
+
 		layout = QVBoxLayout()
 		layout.setSpacing(10)
-		lang = LanguageManager()
-		BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-		IMG_DIR = os.path.join(BASE_DIR, "files/images")
 
 		group = QGroupBox(lang.t("tab_graphics"))
 		group.setProperty("profile", True)
 
-		group_layout = QVBoxLayout()
-		group.setLayout(group_layout)
+		self.group_layout = QVBoxLayout()
+		group.setLayout(self.group_layout)
+
+		self.loading_label = QLabel(lang.t("loading"))
+		self.group_layout.addWidget(self.loading_label)
+
+		# com muitas GPUs (8+) os cards passam da altura da janela
+		scroll = QScrollArea()
+		scroll.setWidgetResizable(True)
+		scroll.setFrameShape(QFrame.Shape.NoFrame)
+		scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+		content = QWidget()
+		content_layout = QVBoxLayout(content)
+		content_layout.setContentsMargins(0,0,0,0)
+		content_layout.addWidget(group)
+		content_layout.addStretch()
+		scroll.setWidget(content)
+
+		layout.addWidget(scroll)
+		self.setLayout(layout)
+
+		workers.submit(get_gpu_info, on_done=self.populate, on_error=self.populate_failed)
 
+	def populate(self, gpus):
 		try:
-			gpus = GPUtil.getGPUs()
+			self.build_cards(gpus)
+			self.loading_label.hide()
+		except Exception as e:
+			self.populate_failed(e)
+			return
+		if gpus:
+			# uma leitura de todas as GPUs por tick, enquanto a aba estiver visível
+			sampler.subscribe(self.poll, self)
 
-			grid_layout = QGridLayout()
-			grid_layout.setSpacing(10)
+	def populate_failed(self, error):
+		self.loading_label.setText(f"GPU info not available: {error}")
 
-			if not gpus:
-				group_layout.addWidget(QLabel(lang.t("tab_graphics")))
+	def build_cards(self, gpus):
+		group_layout = self.group_layout
 
-			else:
-				for i, gpu in enumerate(gpus):
-
-					card = QGroupBox(f"GPU {i}: {gpu.name}")
-					card.setProperty("profile", True)
-
-					card_layout = QHBoxLayout()
-					info_layout = QGridLayout()
-					attrs = {
-						lang.t("gpu_name"): gpu.name,
-						"UUID": gpu.uuid,
-						"GPU ID": gpu.id,
-						lang.t("gpu_load"): round(gpu.load * 100, 2),
-						lang.t("gpu_memory_total"): gpu.memoryTotal,
-						lang.t("gpu_memory_used"): gpu.memoryUsed,
-						lang.t("gpu_memory_free"): gpu.memoryFree,
-						lang.t("gpu_memory_in_use"): round(
-							(gpu.memoryUsed / gpu.memoryTotal) * 100, 2
-						) if gpu.memoryTotal else "N/A",
-						lang.t("temperature"): gpu.temperature,
-						lang.t("driver"): getattr(gpu, "driver", "N/A"),
-						lang.t("display_active"): getattr(gpu, "display_active", "N/A"),
-					}
-					if NVML_AVAILABLE:
-						try:
-							handle = pynvml.nvmlDeviceGetHandleByIndex(i)
-
-							mem = pynvml.nvmlDeviceGetMemoryInfo(handle)
-							util = pynvml.nvmlDeviceGetUtilizationRates(handle)
-							power = pynvml.nvmlDeviceGetPowerUsage(handle) / 1000
-							power_limit = (
-								pynvml.nvmlDeviceGetEnforcedPowerLimit(handle) / 1000
-							)
-							fan = pynvml.nvmlDeviceGetFanSpeed(handle)
-							clocks_graphics = pynvml.nvmlDeviceGetClockInfo(
-								handle,
-								pynvml.NVML_CLOCK_GRAPHICS
-							)
-							clocks_mem = pynvml.nvmlDeviceGetClockInfo(
-								handle,
-								pynvml.NVML_CLOCK_MEM
-							)
-
-							attrs.update({
-								lang.t("gpu_utilization"): util.gpu,
-								lang.t("memory_controller"): util.memory,
-								lang.t("power_usage"): round(power, 2),
-								lang.t("power_limit"): round(power_limit, 2),
-								lang.t("fan_speed"): fan,
-								lang.t("graph_clock"): clocks_graphics,
-								lang.t("memory_type_clock"): clocks_mem,
-								lang.t("vram_used"): round(mem.used / 1024**2),
-								lang.t("vram_free"): round(mem.free / 1024**2),
-							})
-
-						except Exception:
-							pass
-					row = 0
-					for key, value in attrs.items():
-						label_widget = QLabel(f"{key}:")
-						label_widget.setAlignment(
-							Qt.AlignmentFlag.AlignLeft |
-							Qt.AlignmentFlag.AlignVCenter
-						)
+		grid_layout = QGridLayout()
+		grid_layout.setSpacing(10)
 
-						value_widget = blue_label(str(value))
-						info_layout.addWidget(label_widget, row, 0)
-						info_layout.addWidget(value_widget, row, 1)
-						row += 1
-
-					card_layout.addLayout(info_layout)
-
-					frame = QFrame()
-					frame.setFixedSize(130, 130)
-					frame.setProperty("profile", True)
-
-					frame_layout = QVBoxLayout()
-					frame_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
-					logo_label = QLabel()
-					logo_label.setFixedSize(100, 100)
-					logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
-					name = gpu.name.lower()
-
-					if "nvidia" in name:
-						img_path = resource_path("files/images/nvidia.png")
-					elif "amd" in name or "radeon" in name:
-						img_path = resource_path("files/images/amd.jpg")
-					elif "intel" in name:
-						img_path = resource_path("files/images/intel.png")
-					else:
-						img_path = resource_path("files/images/gpu.png")
-
-					pixmap = QPixmap(img_path)
-
-					if not pixmap.isNull():
-						logo_label.setPixmap(
-							pixmap.scaled(
-								95,
-								95,
-								Qt.AspectRatioMode.KeepAspectRatio,
-								Qt.TransformationMode.SmoothTransformation
-							)
+		if not gpus:
+			group_layout.addWidget(QLabel(lang.t("tab_graphics")))
+
+		else:
+			for i, gpu in enumerate(gpus):
+
+				card = QGroupBox(f"GPU {i}: {gpu['name']}")
+				card.setProperty("profile", True)
+
+				card_layout = QHBoxLayout()
+				left_layout = QVBoxLayout()
+				info_layout = QGridLayout()
+
+				labels = {}
+				texts = {}
+				row = 0
+				for key, value in gpu["attrs"].items():
+					label_widget = QLabel(f"{lang.t(key)}:")
+					label_widget.setAlignment(
+						Qt.AlignmentFlag.AlignLeft |
+						Qt.AlignmentFlag.AlignVCenter
+					)
+
+					texts[key] = str(value)
+					value_widget = blue_label(texts[key])
+					labels[key] = value_widget
+					info_layout.addWidget(label_widget, row, 0)
+					info_layout.addWidget(value_widget, row, 1)
+					row += 1
+
+				self.value_labels.append(labels)
+				self.texts.append(texts)
+				left_layout.addLayout(info_layout)
+
+				# histórico de uso, VRAM, potência e temperatura
+				graphs = {}
+				graphs_layout = QHBoxLayout()
+				for key in GPU_GRAPHS:
+					box = QVBoxLayout()
+					caption = QLabel(lang.t(key))
+					caption.setStyleSheet("color:gray;font-size:11px;")
+					caption.setToolTip(lang.t(key))
+					# a legenda não alarga o card; corta se faltar espaço
+					caption.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Preferred)
+					graph = UsageGraph()
+					graph.setFixedHeight(50)
+					box.addWidget(caption)
+					box.addWidget(graph)
+					graphs_layout.addLayout(box)
+					graphs[key] = graph
+				self.graphs.append(graphs)
+				left_layout.addLayout(graphs_layout)
+
+				card_layout.addLayout(left_layout)
+
+				frame = QFrame()
+				frame.setFixedSize(130, 130)
+				frame.setProperty("profile", True)
+
+				frame_layout = QVBoxLayout()
+				frame_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+				logo_label = QLabel()
+				logo_label.setFixedSize(100, 100)
+				logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+				name = gpu["name"].lower()
+
+				if "nvidia" in name:
+					img_path = resource_path("files/images/nvidia.png")
+				elif "amd" in name or "radeon" in name:
+					img_path = resource_path("files/images/amd.jpg")
+				elif "intel" in name:
+					img_path = resource_path("files/images/intel.png")
+				else:
+					img_path = resource_path("files/images/gpu.png")
+
+				pixmap = QPixmap(img_path)
+
+				if not pixmap.isNull():
+					logo_label.setPixmap(
+						pixmap.scaled(
+							95,
+							95,
+							Qt.AspectRatioMode.KeepAspectRatio,
+							Qt.TransformationMode.SmoothTransformation
 						)
+					)
 
-					frame_layout.addWidget(logo_label)
-					frame.setLayout(frame_layout)
+				frame_layout.addWidget(logo_label)
+				frame.setLayout(frame_layout)
 
-					card_layout.addWidget(frame)
+				card_layout.addWidget(frame)
 
-					card.setLayout(card_layout)
+				card.setLayout(card_layout)
 
-					grid_row = i // 2
-					grid_col = i % 2
-					grid_layout.addWidget(card, grid_row, grid_col)
+				grid_row = i // 2
+				grid_col = i % 2
+				grid_layout.addWidget(card, grid_row, grid_col)
 
-				group_layout.addLayout(grid_layout)
+			group_layout.addLayout(grid_layout)
 
-		except Exception as e:
-			group_layout.addWidget(QLabel(f"GPU info not available: {e}"))
+	def poll(self, snap):
+		if self.poll_pending:
+			return
+		self.poll_pending = True
+		workers.submit(
+			gpu_sampler.sample,
+			on_done=self.update_live,
+			on_error=self.poll_failed,
+			timeout=5000
+		)
 
-		layout.addWidget(group)
-		layout.addStretch()
-		self.setLayout(layout)
+	def poll_failed(self, error):
+		self.poll_pending = False
+		print("gpu poll error:", error)
+
+	def update_live(self, samples):
+		self.poll_pending = False
+		for gpu in samples:
+			i = gpu.index
+			if i >= len(self.value_labels):
+				continue
+
+			# só repinta o label quando o texto muda
+			labels = self.value_labels[i]
+			texts = self.texts[i]
+			for key, value in gpu_attrs(gpu).items():
+				text = str(value)
+				if texts.get(key) != text and key in labels:
+					labels[key].setText(text)
+					texts[key] = text
+
+			for key, value in gpu_graph_values(gpu).items():
+				if value is not None:
+					self.graphs[i][key].add_value(value)
 
 class UsageGraph(QWidget):
+	# tempo de pintura somado de todos os gráficos (ver --render-stats)
+	render_stats = {
+		"frames": 0,
+		"full": 0,
+		"scrolled": 0,
+		"cached": 0,
+		"seconds": 0.0,
+		"max": 0.0,
+	}
 
-	def __init__(self):
+	def __init__(self, history=None, window=60):
 		super().__init__()
-		self.values = [0]*60
+		# o histórico pode ser compartilhado (ex.: card da sidebar e gráfico grande)
+		self.history = history if history is not None else History()
+		self.window = window
+		self.pen = QPen(QColor("#3daee9"), 2)
+
+		# linha já desenhada: só é refeita quando dados ou tamanho mudam
+		self.cache = None
+		self.cache_key = None
+		self.cache_version = None
+		self.cache_total = 0
+		self.cache_count = 0
+		self.cache_last = 0.0
+
+	def add_value(self, v, now=None):
+		self.history.append(v, now)
+		# escondido não pinta; showEvent redesenha com o que acumulou
+		if self.isVisible():
+			self.update()
+
+	def set_history(self, history):
+		self.history = history
+		self.cache_key = None
+		self.update()
 
-	def add_value(self, v):
-		self.values.append(v)
-		self.values.pop(0)
+	def set_window(self, seconds):
+		self.window = seconds
+		self.cache_key = None
 		self.update()
 
 	def reset(self):
-		self.values = [0]*60
+		self.history.clear()
 		self.update()
 
+	@instrument.timed(category="paint")
 	def paintEvent(self, e):
-		from PyQt6.QtGui import QPainter, QPen
-		from PyQt6.QtCore import QPointF
+		started = time.perf_counter()
+		kind = self.render_cache()
 
 		p = QPainter(self)
-		p.setRenderHint(QPainter.RenderHint.Antialiasing)
+		p.drawPixmap(0, 0, self.cache)
+		p.end()
+
+		elapsed = time.perf_counter() - started
+		stats = UsageGraph.render_stats
+		stats["frames"] += 1
+		stats[kind] += 1
+		stats["seconds"] += elapsed
+		stats["max"] = max(stats["max"], elapsed)
 
+	def y_of(self, v):
+		h = self.height()
+		return h - (v/100)*h
+
+	def render_cache(self):
 		w = self.width()
 		h = self.height()
+		ratio = self.devicePixelRatioF()
+		key = (w, h, ratio, self.window, id(self.history))
+
+		if key == self.cache_key and self.history.version == self.cache_version:
+			return "cached"
+
+		segments, _, total = self.history.window(self.window)
+		ring = self.history.tiers[self.history.tier(self.window)]
+		count = sum(len(segment) for segment in segments)
+		step = w/(total-1)
+		# passo inteiro em pixels permite só deslocar a imagem a cada ponto novo
+		if step >= 2:
+			step = math.floor(step*ratio)/ratio
+
+		last = [v for segment in segments[-2:] for v in segment[-2:]][-2:]
+
+		# só entrou um ponto novo: desloca a imagem e desenha o último segmento
+		scroll = (
+			key == self.cache_key
+			and self.cache is not None
+			and count == total
+			and self.cache_count == total
+			and ring.total == self.cache_total + 1
+			and len(last) == 2
+			and last[0] == self.cache_last
+			and (step*ratio).is_integer()
+		)
+
+		if scroll:
+			self.cache.scroll(-int(step*ratio), 0, self.cache.rect())
+			p = QPainter(self.cache)
+			p.setCompositionMode(QPainter.CompositionMode.CompositionMode_Clear)
+			p.fillRect(QRectF(w - step, 0, step, h), Qt.GlobalColor.transparent)
+			p.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
+			p.setRenderHint(QPainter.RenderHint.Antialiasing)
+			p.setPen(self.pen)
+			p.drawLine(
+				QPointF(w - step, self.y_of(last[0])),
+				QPointF(w, self.y_of(last[1]))
+			)
+			p.end()
+			kind = "scrolled"
+		else:
+			self.cache = QPixmap(max(1, int(w*ratio)), max(1, int(h*ratio)))
+			self.cache.setDevicePixelRatio(ratio)
+			self.cache.fill(Qt.GlobalColor.transparent)
+
+			# a linha sempre termina na borda direita
+			x0 = w - (count - 1)*step
+
+			points = []
+			i = 0
+			for segment in segments:
+				for v in segment:
+					points.append(QPointF(x0 + i*step, self.y_of(v)))
+					i += 1
+
+			# uma polyline por quadro em vez de um drawLine por segmento
+			p = QPainter(self.cache)
+			p.setRenderHint(QPainter.RenderHint.Antialiasing)
+			p.setPen(self.pen)
+			p.drawPolyline(QPolygonF(points))
+			p.end()
+			kind = "full"
+
+		self.cache_key = key
+		self.cache_version = self.history.version
+		self.cache_total = ring.total
+		self.cache_count = count
+		self.cache_last = last[-1] if last else 0.0
+		return kind
+
+def print_render_stats():
+	stats = UsageGraph.render_stats
+	frames = stats["frames"] or 1
+	print(
+		f"UsageGraph: {stats['frames']} frames "
+		f"({stats['full']} full, {stats['scrolled']} scrolled, {stats['cached']} cached), "
+		f"avg {stats['seconds'] / frames * 1000:.3f} ms, max {stats['max'] * 1000:.3f} ms"
+	)
+
+def heatmap_colors():
+	# 0-100: azul escuro -> azul do gráfico -> amarelo -> vermelho
+	stops = ((0, (20, 24, 32)), (40, (61, 174, 233)), (75, (255, 213, 79)), (100, (255, 82, 82)))
+	colors = []
+	for v in range(256):
+		v = min(v, 100)
+		for (a, ca), (b, cb) in zip(stops, stops[1:]):
+			if v <= b:
+				t = (v - a) / (b - a)
+				r, g, bl = (int(x + (y - x) * t) for x, y in zip(ca, cb))
+				colors.append(qRgb(r, g, bl))
+				break
+	return colors
+
+# Mapa de calor por núcleo lógico: linhas = núcleos, colunas = tempo.
+# O histórico inteiro vira uma QImage indexada e é desenhado com um drawImage só,
+# em vez de um widget/gráfico por núcleo.
+class CoreHeatmap(QWidget):
+	colors = None
+
+	def __init__(self, cores=None, size=300):
+		super().__init__()
+		cores = cores or psutil.cpu_count() or 1
+		self.usage = CoreHistory(cores, size)
+		self.freq = CoreHistory(cores, size)
+		self.max_freq = 0.0
+		self.mode = "usage"
+		self.image = None
+		self.image_data = None
+		self.image_key = None
+		self.setMinimumHeight(min(240, max(60, cores * 6)))
+		if CoreHeatmap.colors is None:
+			CoreHeatmap.colors = heatmap_colors()
+
+	def add_sample(self, snap):
+		usage = snap.get("cpu_percpu")
+		if usage is None:
+			return
+		self.usage.append(usage)
 
-		step = w/(len(self.values)-1)
+		freqs = snap.get("cpu_freq_percpu") or []
+		# frequência em % da máxima (a informada, ou a maior já vista)
+		for f in freqs:
+			self.max_freq = max(self.max_freq, f.max or 0.0, f.current)
+		if self.max_freq:
+			self.freq.append([f.current * 100 / self.max_freq for f in freqs])
 
-		points = []
+		if self.isVisible():
+			self.update()
 
-		for i,v in enumerate(self.values):
-			x = i*step
-			y = h - (v/100)*h
-			points.append(QPointF(x,y))
+	def set_mode(self, mode):
+		self.mode = mode
+		self.update()
+
+	def history(self):
+		return self.freq if self.mode == "freq" else self.usage
+
+	@instrument.timed(category="paint")
+	def paintEvent(self, e):
+		history = self.history()
+		p = QPainter(self)
+		p.fillRect(self.rect(), QColor(20, 24, 32))
+		if not len(history):
+			p.end()
+			return
 
-		pen = QPen(QColor("#3daee9"),2)
-		p.setPen(pen)
+		key = (self.mode, history.version)
+		if key != self.image_key:
+			# QImage não copia o buffer: a referência fica guardada junto
+			self.image_data = bytes(history.window())
+			self.image = QImage(
+				self.image_data, history.cores, len(history),
+				history.cores, QImage.Format.Format_Indexed8
+			)
+			self.image.setColorTable(CoreHeatmap.colors)
+			self.image_key = key
 
-		for i in range(len(points)-1):
-			p.drawLine(points[i],points[i+1])
+		# a imagem é tempo × núcleos; a transformação troca os eixos
+		# e estica as células, o mais novo fica na borda direita
+		w = self.width()
+		h = self.height()
+		step = w / history.size
+		x0 = w - len(history) * step
+		p.setTransform(QTransform(0, h / history.cores, step, 0, x0, 0))
+		p.drawImage(0, 0, self.image)
+		p.end()
 
 class DeviceCard(QWidget):
     selected = pyqtSignal(str)
@@ -1276,7 +2169,8 @@ class DeviceCard(QWidget):
         text_layout.addWidget(self.title)
         text_layout.addWidget(self.subtitle)
 
-        self.graph = UsageGraph()
+        self.history = History()
+        self.graph = UsageGraph(self.history)
         self.graph.setFixedSize(80,40)
 
         layout.addWidget(self.dot)
@@ -1304,10 +2198,61 @@ class DeviceCard(QWidget):
     def mousePressEvent(self, e):
         self.selected.emit(self.device_name)
 
-    def update_value(self, text, value):
+    def update_value(self, text, value, now=None):
         self.subtitle.setText(text)
-        self.graph.add_value(value)
-
+        self.graph.add_value(value, now)
+
+    def swap_history(self, history):
+        # replay: o card passa a mostrar outro histórico e devolve o anterior
+        previous = self.history
+        self.history = history
+        self.graph.set_history(history)
+        return previous
+
+
+# (texto, segundos) das janelas do gráfico do BenchTab
+GRAPH_WINDOWS = (
+    ("60 s", 60),
+    ("10 min", 600),
+    ("1 h", 3600),
+    ("6 h", 6 * 3600),
+    ("24 h", 24 * 3600),
+    ("7 d", 7 * 24 * 3600),
+)
+
+# canais gravados em todo tick; os discos entram com o nome do card
+BENCH_CHANNELS = (
+    "cpu", "cpu_mhz", "processes", "ctx_switches",
+    "mem_percent", "mem_used", "mem_total", "mem_available",
+)
+
+def disk_channels(name):
+    # % ocupado, bytes/s lidos e escritos, operações/s
+    return (name, f"{name}:read", f"{name}:write", f"{name}:iops")
+
+def net_channels(name):
+    # % do link, bytes/s enviados e recebidos, pacotes/s, erros + descartes no tick
+    return (name, f"{name}:sent", f"{name}:recv", f"{name}:packets", f"{name}:errors")
+
+# placa que não informa a velocidade do link: o gráfico usa 1 Gbit/s como 100%
+NET_FALLBACK_SPEED = 1000
+
+REPLAY_SPEEDS = (1, 2, 5, 10, 25, 50, 100)
+
+def format_duration(seconds):
+    seconds = int(seconds)
+    days, seconds = divmod(seconds, 86400)
+    text = f"{seconds//3600:02d}:{seconds%3600//60:02d}:{seconds%60:02d}"
+    return f"{days}d {text}" if days else text
+
+def format_rate(value):
+    if value >= 1024**2:
+        return f"{value/1024**2:.1f} MB/s"
+    return f"{value/1024:.0f} KB/s"
+
+# segundos entre leituras da tabela de processos (é a coleta mais cara da aba)
+PROCESS_INTERVAL = 2.0
+PROCESS_COLUMNS = ("proc_name", "proc_pid", "proc_cpu", "proc_memory", "proc_io")
 
 class BenchTab(QWidget):
     def __init__(self):
@@ -1315,10 +2260,13 @@ class BenchTab(QWidget):
 
         self.current_device = "CPU"
         self.cards = {}
-        self.last_net = psutil.net_io_counters()
-        self.last_disk = psutil.disk_io_counters()
-        self.last_time = time.time()
-        self.c = c
+        self.disk_rates = DiskRates()
+        # um card por placa de rede ativa, criado quando ela aparece
+        self.net_rates = NetRates()
+        self.net_cards = []
+        self.net_speeds = {}
+        self.physical_cores = psutil.cpu_count(False)
+        self.logical_cores = psutil.cpu_count()
 
         main_layout = QHBoxLayout(self)
 
@@ -1328,28 +2276,42 @@ class BenchTab(QWidget):
         self.sidebar_layout.setSpacing(6)
         self.sidebar_layout.setContentsMargins(5,5,5,5)
 
-        def add_card(name, color):
-            card = DeviceCard(name, "", color)
-            card.selected.connect(self.select_device)
-            self.sidebar_layout.addWidget(card)
-            self.cards[name] = card
+        self.sidebar_layout.addStretch()
 
         # cards fixos
-        add_card("CPU", "#00bcd4")
-        add_card("Memory", "#5c7cfa")
-        add_card("Ethernet", "#ff6ec7")
-        add_card("GPU", "#b197fc")
-
-        # detectar discos e adicionar cards
-        self.real_disks = []
-        for i, disk in enumerate(self.c.Win32_DiskDrive()):
-            name = disk.Model
-            interface = disk.InterfaceType
-            self.real_disks.append((name, interface))
-            disk_card_name = f"Disk {i} ({name})"
-            add_card(disk_card_name, "#ffa500")  # laranja para discos
-
-        self.sidebar_layout.addStretch()
+        self.add_card("CPU", "#00bcd4")
+        self.add_card("Memory", "#5c7cfa")
+        self.add_card("GPU", "#b197fc")
+
+        # discos chegam pelo WorkerPool
+        self.gpu_pending = False
+        # nome do card -> chave do disk_io_counters(perdisk=True)
+        self.disk_keys = {}
+
+        # gravação / replay (recording.py)
+        self.recorder = None
+        self.replay = None
+        self.replay_pos = 0.0
+        self.replay_index = 0
+        self.replay_clock = 0.0
+        self.replay_cards = []
+        self.live_histories = {}
+        self.replay_timer = QTimer(self)
+        self.replay_timer.setInterval(100)
+        self.replay_timer.timeout.connect(self.replay_tick)
+
+        # benchmark de CPU (cpubench.py), roda numa thread própria (TaskThreads)
+        self.cpu_bench = None
+        # benchmark do disco selecionado (diskbench.py), também numa thread própria
+        self.disk_bench = None
+        self.disk_bench_card = None
+        self.disk_bench_warning = None
+
+        workers.submit(
+            inventory.query, "disks",
+            on_done=self.add_disk_cards,
+            on_error=lambda error: print("disk info error:", error)
+        )
 
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
@@ -1360,11 +2322,88 @@ class BenchTab(QWidget):
 
         # ---------------- RIGHT PANEL ----------------
         right_layout = QVBoxLayout()
+        title_layout = QHBoxLayout()
         self.title = QLabel("CPU")
         self.title.setStyleSheet("font-size:22px;font-weight:bold;")
-        self.graph = UsageGraph()
-        right_layout.addWidget(self.title)
-        right_layout.addWidget(self.graph)
+
+        # janela de tempo do gráfico grande
+        self.window_combo = QComboBox()
+        for text, seconds in GRAPH_WINDOWS:
+            self.window_combo.addItem(text, seconds)
+        self.window_combo.currentIndexChanged.connect(
+            lambda: self.graph.set_window(self.window_combo.currentData())
+        )
+
+        self.status_label = QLabel("")
+        self.status_label.setStyleSheet("color:gray;font-size:12px;")
+
+        self.record_btn = QPushButton()
+        self.record_btn.setCheckable(True)
+        self.record_btn.toggled.connect(self.toggle_recording)
+
+        self.replay_btn = QPushButton()
+        self.replay_btn.clicked.connect(self.toggle_replay)
+
+        self.speed_combo = QComboBox()
+        for speed in REPLAY_SPEEDS:
+            self.speed_combo.addItem(f"{speed}x", speed)
+
+        self.cpu_bench_btn = QPushButton()
+        self.cpu_bench_btn.clicked.connect(self.toggle_cpu_bench)
+
+        # só aparece com um card de disco selecionado
+        self.disk_bench_btn = QPushButton()
+        self.disk_bench_btn.clicked.connect(self.toggle_disk_bench)
+        self.disk_bench_btn.hide()
+
+        title_layout.addWidget(self.title)
+        title_layout.addStretch()
+        title_layout.addWidget(self.status_label)
+        title_layout.addWidget(self.cpu_bench_btn)
+        title_layout.addWidget(self.disk_bench_btn)
+        title_layout.addWidget(self.record_btn)
+        title_layout.addWidget(self.replay_btn)
+        title_layout.addWidget(self.speed_combo)
+        title_layout.addWidget(self.window_combo)
+
+        # o gráfico grande mostra o histórico do card selecionado
+        self.graph = UsageGraph(self.cards["CPU"].history)
+        self.graph.setMinimumHeight(160)
+        # resultado do benchmark de CPU
+        self.cpu_bench_label = QLabel()
+        self.cpu_bench_label.setWordWrap(True)
+        self.cpu_bench_label.setStyleSheet("font-size:13px;")
+        self.cpu_bench_label.hide()
+        self.disk_bench_label = QLabel()
+        self.disk_bench_label.setWordWrap(True)
+        self.disk_bench_label.setStyleSheet("font-size:13px;")
+        self.disk_bench_label.hide()
+
+        right_layout.addLayout(title_layout)
+        right_layout.addWidget(self.cpu_bench_label)
+        right_layout.addWidget(self.disk_bench_label)
+        right_layout.addWidget(self.graph, 2)
+
+        # mapa de calor por núcleo, só com o card da CPU selecionado
+        self.heatmap_box = QWidget()
+        heatmap_layout = QVBoxLayout(self.heatmap_box)
+        heatmap_layout.setContentsMargins(0,0,0,0)
+        heatmap_header = QHBoxLayout()
+        self.heatmap_title = QLabel()
+        self.heatmap_title.setStyleSheet("color:gray;font-size:12px;")
+        self.heatmap_mode = QComboBox()
+        self.heatmap_mode.addItem("", "usage")
+        self.heatmap_mode.addItem("", "freq")
+        self.heatmap_mode.currentIndexChanged.connect(
+            lambda: self.heatmap.set_mode(self.heatmap_mode.currentData())
+        )
+        heatmap_header.addWidget(self.heatmap_title)
+        heatmap_header.addStretch()
+        heatmap_header.addWidget(self.heatmap_mode)
+        self.heatmap = CoreHeatmap()
+        heatmap_layout.addLayout(heatmap_header)
+        heatmap_layout.addWidget(self.heatmap)
+        right_layout.addWidget(self.heatmap_box, 1)
 
         # ===== INFO GRID =====
         self.info_grid = QGridLayout()
@@ -1388,12 +2427,69 @@ class BenchTab(QWidget):
         add_info(2,1,"Logical")
 
         right_layout.addLayout(self.info_grid)
+
+        # ===== PROCESSOS =====
+        self.process_tracker = ProcessTracker(top=15)
+        self.process_pending = False
+        self.process_time = 0.0
+
+        process_header = QHBoxLayout()
+        self.process_title = QLabel()
+        self.process_title.setStyleSheet("font-size:14px;font-weight:bold;")
+        self.process_sort_label = QLabel()
+        self.process_sort = QComboBox()
+        for key in SORT_KEYS:
+            self.process_sort.addItem("", key)
+        self.process_sort.currentIndexChanged.connect(lambda: self.refresh_processes(True))
+        process_header.addWidget(self.process_title)
+        process_header.addStretch()
+        process_header.addWidget(self.process_sort_label)
+        process_header.addWidget(self.process_sort)
+
+        self.process_table = QTableWidget(0, len(PROCESS_COLUMNS))
+        self.process_table.verticalHeader().setVisible(False)
+        self.process_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.process_table.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.process_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+
+        right_layout.addLayout(process_header)
+        right_layout.addWidget(self.process_table, 1)
         main_layout.addLayout(right_layout)
 
-        # ---------------- TIMER ----------------
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_usage)
-        self.timer.start(1000)
+        # ---------------- SAMPLER ----------------
+        # escondida continua a cada 5 s para os gráficos não ficarem vazios
+        self.subscription = sampler.subscribe(self.update_usage, self, background=5000)
+        self.apply_language()
+
+    def add_card(self, name, color):
+        card = DeviceCard(name, "", color)
+        card.selected.connect(self.select_device)
+        # antes do stretch do final da sidebar
+        self.sidebar_layout.insertWidget(self.sidebar_layout.count() - 1, card)
+        self.cards[name] = card
+
+    def add_disk_cards(self, disks):
+        # o número do card é o do disco físico (Index); o provider diz qual
+        # chave do psutil é a dele (PhysicalDriveN no Windows, sda/nvme0n1 no Linux)
+        for i, disk in enumerate(sorted(disks, key=lambda d: int(getattr(d, "Index", 0) or 0))):
+            key = inventory.provider.disk_io_key(disk)
+            number = getattr(disk, "Index", None)
+            number = i if number is None else number
+            disk_card_name = f"Disk {number} ({disk.Model})"
+            self.disk_keys[disk_card_name] = key
+            if disk_card_name in self.cards:
+                continue
+            self.add_card(disk_card_name, "#ffa500")  # laranja para discos
+            if self.replay is not None:
+                self.live_histories[disk_card_name] = self.cards[disk_card_name].swap_history(History())
+
+    def add_net_card(self, name):
+        self.net_cards.append(name)
+        if name in self.cards:
+            return
+        self.add_card(name, "#ff6ec7")
+        if self.replay is not None:
+            self.live_histories[name] = self.cards[name].swap_history(History())
 
     # =================================================
     def select_device(self, name):
@@ -1402,85 +2498,554 @@ class BenchTab(QWidget):
         self.cards[name].set_selected(True)
         self.current_device = name
         self.title.setText(name)
-        self.graph.reset()
+        self.graph.set_history(self.cards[name].history)
+        self.heatmap_box.setVisible(name == "CPU")
+        self.disk_bench_btn.setVisible(name in self.disk_keys or self.disk_bench is not None)
 
     # =================================================
-    def update_usage(self):
-        value = 0
-
-        # ---------- SIDEBAR UPDATE ----------
-        cpu = psutil.cpu_percent()
-        freq = psutil.cpu_freq()
-        self.cards["CPU"].update_value(
-            f"{cpu}% {freq.current/1000:.2f} GHz",
-            cpu
-        )
-
-        net = psutil.net_io_counters()
-        up = (net.bytes_sent - self.last_net.bytes_sent)/1024
-        down = (net.bytes_recv - self.last_net.bytes_recv)/1024
-        self.cards["Ethernet"].update_value(
-            f"S:{up:.0f} R:{down:.0f} KB/s",
-            min(100,(up+down)/50)
-        )
-        self.last_net = net
-
-        mem = psutil.virtual_memory()
-        self.cards["Memory"].update_value(
-            f"{mem.used//(1024**3)}/{mem.total//(1024**3)} GB ({mem.percent}%)",
-            mem.percent
-        )
-
-        # atualizar discos
-        partitions = psutil.disk_partitions()
-        for i, part in enumerate(partitions):
-            if i >= len(self.real_disks):
+    def bench_values(self, snap):
+        # números de um tick: os mesmos vão para a tela e para a gravação
+        freq = snap["cpu_freq"]
+        mem = snap["memory"]
+        values = {
+            "cpu": snap["cpu_percent"],
+            "cpu_mhz": freq.current if freq else 0,
+            "processes": snap["processes"],
+            "ctx_switches": snap["cpu_stats"].ctx_switches,
+            "mem_percent": mem.percent,
+            "mem_used": mem.used,
+            "mem_total": mem.total,
+            "mem_available": mem.available,
+        }
+
+        now = snap["monotonic"]
+
+        # rede por placa: % do link no gráfico, envio/recebimento no texto
+        stats = snap.get("net_if", {})
+        rates = self.net_rates.update(snap.get("net_io", {}), stats, now)
+        for name, rate in rates.items():
+            if name not in self.net_cards:
+                self.add_net_card(name)
+            if rate.usage is None:
+                values[name] = min(100.0, max(rate.sent, rate.recv) * 8 / (NET_FALLBACK_SPEED * 1e6) * 100)
+            else:
+                values[name] = rate.usage
+            values[f"{name}:sent"] = rate.sent
+            values[f"{name}:recv"] = rate.recv
+            values[f"{name}:packets"] = rate.packets
+            values[f"{name}:errors"] = rate.errors
+        # placa desligada ou desconectada: o card fica em zero
+        if rates:
+            for name in self.net_cards:
+                if name not in rates:
+                    for channel in net_channels(name):
+                        values[channel] = 0
+        self.net_speeds = {name: st.speed for name, st in stats.items() if st.speed}
+
+        # vazão dos discos: % ocupado no gráfico, leitura/escrita/IOPS no texto
+        rates = self.disk_rates.update(snap.get("disk_io", {}), now)
+        for name, key in self.disk_keys.items():
+            rate = rates.get(key)
+            if rate is None:
                 continue
-            disk_card_name = f"Disk {i} ({self.real_disks[i][0]})"
-            usage = psutil.disk_usage(part.mountpoint)
-            if disk_card_name in self.cards:
-                self.cards[disk_card_name].update_value(
-                    f"{usage.percent}%",
-                    usage.percent
-                )
+            values[name] = rate.busy
+            values[f"{name}:read"] = rate.read
+            values[f"{name}:write"] = rate.write
+            values[f"{name}:iops"] = rate.iops
+
+        return values
+
+    def graph_values(self, values):
+        # valor (0-100) do gráfico de cada card
+        graphs = {
+            "CPU": values["cpu"],
+            "Memory": values["mem_percent"],
+        }
+        for name in self.cards:
+            if name in values:
+                graphs[name] = values[name]
+        return graphs
+
+    def card_text(self, name, values):
+        if name == "CPU":
+            return f"{values['cpu']:.1f}% {values['cpu_mhz']/1000:.2f} GHz"
+        if name == "Memory":
+            used = int(values["mem_used"]//(1024**3))
+            total = int(values["mem_total"]//(1024**3))
+            return f"{used}/{total} GB ({values['mem_percent']:.1f}%)"
+        if f"{name}:sent" in values:
+            return f"S {format_rate(values[name + ':sent'])} R {format_rate(values[name + ':recv'])}"
+        if f"{name}:read" in values:
+            return f"R {format_rate(values[name + ':read'])} W {format_rate(values[name + ':write'])}"
+        return f"{values[name]:.1f}%"
+
+    def show_values(self, values, now=None):
+        for name, value in self.graph_values(values).items():
+            card = self.cards.get(name)
+            if card is not None:
+                card.update_value(self.card_text(name, values), value, now)
+
+        cpu = values["cpu"]
+        speed = values["cpu_mhz"]/1000
 
         # ================= CPU =================
         if self.current_device == "CPU":
-            value = cpu
-            speed = freq.current/1000 if freq else 0
-            self.info_labels["Usage"].setText(f"{value}%")
+            self.info_labels["Usage"].setText(f"{cpu:.1f}%")
             self.info_labels["Speed"].setText(f"{speed:.2f} GHz")
-            self.info_labels["Processes"].setText(str(len(psutil.pids())))
-            self.info_labels["Threads"].setText(str(psutil.cpu_stats().ctx_switches))
-            self.info_labels["Cores"].setText(str(psutil.cpu_count(False)))
-            self.info_labels["Logical"].setText(str(psutil.cpu_count()))
+            self.info_labels["Processes"].setText(str(int(values["processes"])))
+            self.info_labels["Threads"].setText(str(int(values["ctx_switches"])))
+            self.info_labels["Cores"].setText(str(self.physical_cores))
+            self.info_labels["Logical"].setText(str(self.logical_cores))
 
         # ================= MEMORY =================
         elif self.current_device == "Memory":
-            value = mem.percent
-            self.info_labels["Usage"].setText(f"{value}%")
+            self.info_labels["Usage"].setText(f"{values['mem_percent']:.1f}%")
             self.info_labels["Speed"].setText(
-                f"{mem.used//(1024**3)} / {mem.total//(1024**3)} GB"
+                f"{int(values['mem_used']//(1024**3))} / {int(values['mem_total']//(1024**3))} GB"
             )
             self.info_labels["Processes"].setText(
-                f"{mem.available//(1024**3)} GB free"
+                f"{int(values['mem_available']//(1024**3))} GB free"
             )
             self.info_labels["Threads"].setText("-")
             self.info_labels["Cores"].setText("-")
             self.info_labels["Logical"].setText("-")
 
+        # ================= DISK =================
+        elif f"{self.current_device}:read" in values:
+            name = self.current_device
+            self.info_labels["Usage"].setText(f"{values[name]:.1f}%")
+            self.info_labels["Speed"].setText(f"R {format_rate(values[name + ':read'])}")
+            self.info_labels["Processes"].setText(f"W {format_rate(values[name + ':write'])}")
+            self.info_labels["Threads"].setText(f"{values[name + ':iops']:.0f} IOPS")
+            self.info_labels["Cores"].setText("-")
+            self.info_labels["Logical"].setText("-")
+
+        # ================= REDE =================
+        elif f"{self.current_device}:sent" in values:
+            name = self.current_device
+            speed = self.net_speeds.get(name)
+            self.info_labels["Usage"].setText(f"{values[name]:.1f}%")
+            self.info_labels["Speed"].setText(f"{speed} Mbps" if speed else "-")
+            self.info_labels["Processes"].setText(f"S {format_rate(values[name + ':sent'])}")
+            self.info_labels["Threads"].setText(f"R {format_rate(values[name + ':recv'])}")
+            self.info_labels["Cores"].setText(f"{values[name + ':packets']:.0f} pkt/s")
+            self.info_labels["Logical"].setText(f"{values[name + ':errors']:.0f} errors")
+
+    def update_usage(self, snap):
+        values = self.bench_values(snap)
+        now = snap["monotonic"]
+        # o mapa de calor é sempre ao vivo, inclusive durante o replay
+        self.heatmap.add_sample(snap)
+
+        if self.cpu_bench is not None:
+            self.cpu_bench.observe(snap)
+            self.cpu_bench_label.setText(lang.t("cpubench_running").format(
+                phase=lang.t("cpubench_" + (self.cpu_bench.phase or "start")),
+                percent=round(self.cpu_bench.progress() * 100)
+            ))
+
+        if self.disk_bench is not None:
+            self.disk_bench_label.setText(self.disk_bench_status())
+
+        if self.recorder is not None:
+            self.recorder.append(values, now)
+            self.status_label.setText(lang.t("bench_recorded").format(count=self.recorder.count))
+
+        if self.replay is not None:
+            # os cards mostram a gravação; o histórico ao vivo continua por trás
+            for name, value in self.graph_values(values).items():
+                if name in self.live_histories:
+                    self.live_histories[name].append(value, now)
+            return
+
+        self.show_values(values)
+        self.refresh_processes()
+
         # ================= GPU =================
-        elif self.current_device == "GPU":
-            try:
-                gpu = GPUtil.getGPUs()[0]
-                load = int(gpu.load*100)
-                temp = gpu.temperature
-                self.cards["GPU"].update_value(f"{load}% ({temp}°C)", load)
-                value = load
-            except:
-                value = 0
+        # uma passada NVML por tick para todas as GPUs (sem NVML o GPUSampler
+        # só chama o GPUtil a cada 10 s); o card recebe em update_gpu
+        if not self.gpu_pending:
+            self.gpu_pending = True
+            workers.submit(
+                gpu_sampler.sample,
+                on_done=self.update_gpu,
+                on_error=lambda error: self.update_gpu([]),
+                timeout=5000
+            )
 
-        self.graph.add_value(value)
+        if self.graph.isVisible():
+            self.graph.update()
+
+    # ---------------- PROCESSOS ----------------
+    def refresh_processes(self, force=False):
+        if self.process_pending or not self.process_table.isVisible():
+            return
+        now = time.monotonic()
+        # com milhares de processos a passada fica cara: no máximo ~10% de um núcleo
+        interval = max(PROCESS_INTERVAL, self.process_tracker.elapsed * 10)
+        if not force and now - self.process_time < interval:
+            return
+        self.process_pending = True
+        self.process_time = now
+        workers.submit(
+            self.process_tracker.sample, self.process_sort.currentData(),
+            on_done=self.update_processes,
+            on_error=self.processes_failed
+        )
+
+    def update_processes(self, result):
+        self.process_pending = False
+        count, rows = result
+        self.process_title.setText(lang.t("proc_title").format(count=count))
+        self.process_table.setRowCount(len(rows))
+
+        for r, row in enumerate(rows):
+            texts = (
+                row.name,
+                str(row.pid),
+                f"{row.cpu:.1f}",
+                f"{row.memory/1024**2:.0f} MB",
+                "-" if row.io is None else format_rate(row.io),
+            )
+            for c, text in enumerate(texts):
+                # só mexe na célula quando o texto muda
+                item = self.process_table.item(r, c)
+                if item is None:
+                    self.process_table.setItem(r, c, QTableWidgetItem(text))
+                elif item.text() != text:
+                    item.setText(text)
+
+    def processes_failed(self, error):
+        self.process_pending = False
+        print("process list error:", error)
+
+    # ---------------- GRAVAÇÃO ----------------
+    def toggle_recording(self, checked):
+        if checked:
+            path = recording.new_path(resource_path("files/recordings"))
+            try:
+                channels = BENCH_CHANNELS + tuple(
+                    channel for name in self.disk_keys for channel in disk_channels(name)
+                ) + tuple(
+                    channel for name in self.net_cards for channel in net_channels(name)
+                )
+                self.recorder = recording.Recorder(path, channels)
+            except OSError as e:
+                print("recording error:", e)
+                self.record_btn.setChecked(False)
+                return
+        elif self.recorder is not None:
+            self.recorder.close()
+            print("recording saved:", self.recorder.path)
+            self.status_label.setText(os.path.basename(self.recorder.path))
+            self.recorder = None
+        self.update_fixed_interval()
+        self.apply_language()
+
+    def update_fixed_interval(self):
+        # gravando ou medindo a CPU, amostra no intervalo normal mesmo com a aba escondida
+        busy = self.recorder is not None or self.cpu_bench is not None or self.disk_bench is not None
+        sampler.set_fixed_interval(self.subscription, sampler.interval if busy else None)
+
+    # ---------------- BENCHMARK DE CPU ----------------
+    def toggle_cpu_bench(self):
+        if self.cpu_bench is not None:
+            # termina as tarefas em andamento e volta com None
+            self.cpu_bench.cancel()
+            self.cpu_bench_btn.setEnabled(False)
+            return
+        self.cpu_bench = cpubench.CpuBenchmark()
+        self.cpu_bench_label.setText(lang.t("cpubench_running").format(
+            phase=lang.t("cpubench_start"), percent=0
+        ))
+        self.cpu_bench_label.show()
+        threads.start(
+            self.cpu_bench.run,
+            on_done=self.cpu_bench_done,
+            on_error=self.cpu_bench_failed,
+            cancel=self.cpu_bench.cancel
+        )
+        self.update_fixed_interval()
+        self.apply_language()
+
+    def cpu_bench_done(self, result):
+        self.cpu_bench = None
+        self.cpu_bench_btn.setEnabled(True)
+        self.update_fixed_interval()
+        self.apply_language()
+        if result is None:
+            self.cpu_bench_label.setText(lang.t("cpubench_cancelled"))
+            return
+
+        def clock(phase):
+            clocks = result["clocks"][phase]
+            return f"{clocks['avg']/1000:.2f} GHz" if clocks else "-"
+
+        self.cpu_bench_label.setText(lang.t("cpubench_result").format(
+            single=result["single_score"],
+            multi=result["multi_score"],
+            workers=result["workers"],
+            scaling=round(result["scaling"]),
+            single_clock=clock("single"),
+            multi_clock=clock("multi"),
+        ))
+
+    def cpu_bench_failed(self, error):
+        print("cpu benchmark error:", error)
+        if self.cpu_bench is not None:
+            self.cpu_bench.cancel()
+        self.cpu_bench = None
+        self.cpu_bench_btn.setEnabled(True)
+        self.cpu_bench_label.setText(lang.t("cpubench_failed").format(error=error))
+        self.update_fixed_interval()
+        self.apply_language()
+
+    # ---------------- BENCHMARK DE DISCO ----------------
+    def toggle_disk_bench(self):
+        if self.disk_bench is not None:
+            # as threads de E/S param no próximo lote e o arquivo temporário é apagado
+            self.disk_bench.cancel()
+            self.disk_bench_btn.setEnabled(False)
+            return
+        name = self.current_device
+        folder = QFileDialog.getExistingDirectory(
+            self, lang.t("diskbench_folder"), diskbench.disk_folder(self.disk_keys.get(name))
+        )
+        if not folder:
+            return
+        try:
+            bench = diskbench.DiskBenchmark(folder)
+        except OSError as e:
+            print("disk benchmark error:", e)
+            self.disk_bench_label.setText(lang.t("diskbench_failed").format(error=e))
+            self.disk_bench_label.show()
+            return
+        self.disk_bench = bench
+        # o resultado vai para o disco onde a pasta está, não para o card selecionado
+        self.disk_bench_warning = None
+        if bench.disk is not None and bench.disk != self.disk_keys.get(name):
+            other = next((card for card, key in self.disk_keys.items() if key == bench.disk), bench.disk)
+            self.disk_bench_warning = lang.t("diskbench_other_disk").format(
+                folder=folder, disk=other, card=name
+            )
+            name = other
+        self.disk_bench_card = name
+        self.disk_bench_label.setText(self.disk_bench_status())
+        self.disk_bench_label.show()
+        threads.start(
+            bench.run,
+            on_done=self.disk_bench_done,
+            on_error=self.disk_bench_failed,
+            cancel=bench.cancel
+        )
+        self.update_fixed_interval()
+        self.apply_language()
+
+    def disk_bench_status(self):
+        bench = self.disk_bench
+        phase, _, depth = (bench.phase or "seq_write").partition(":")
+        rate = f"{bench.rate:,.0f} IOPS" if depth else format_rate(bench.rate)
+        text = lang.t("diskbench_running").format(
+            card=f"{self.disk_bench_card} ({bench.device})",
+            phase=lang.t("diskbench_" + phase).format(depth=depth),
+            percent=round(bench.progress() * 100),
+            rate=rate
+        )
+        if self.disk_bench_warning:
+            text = self.disk_bench_warning + "\n" + text
+        return text
+
+    def disk_bench_text(self, result):
+        def iops(values):
+            return " / ".join(f"QD{depth} {value:,.0f}" for depth, value in values.items())
+        text = lang.t("diskbench_result").format(
+            seq_read=format_rate(result["seq_read"]),
+            seq_write=format_rate(result["seq_write"]),
+            random_read=iops(result["random_read"]),
+            random_write=iops(result["random_write"])
+        )
+        if not result.get("direct"):
+            text += " " + lang.t("diskbench_cached")
+        return text
+
+    def disk_bench_done(self, result):
+        name = self.disk_bench_card
+        self.disk_bench = None
+        self.disk_bench_btn.setEnabled(True)
+        self.disk_bench_btn.setVisible(self.current_device in self.disk_keys)
+        self.update_fixed_interval()
+        self.apply_language()
+        if result is None:
+            self.disk_bench_label.setText(lang.t("diskbench_cancelled"))
+            return
+
+        # comparado com as execuções anteriores na mesma partição
+        result["disk"] = name
+        path = resource_path("files/diskbench.jsonl")
+        previous = diskbench.previous_result(path, result["device"], result["mountpoint"])
+        try:
+            diskbench.save_result(path, result)
+        except OSError as e:
+            print("disk benchmark error:", e)
+
+        text = f"{name} ({result['device']}): {self.disk_bench_text(result)}"
+        if self.disk_bench_warning:
+            text = self.disk_bench_warning + "\n" + text
+        if previous is not None:
+            text += "\n" + lang.t("diskbench_previous").format(
+                date=time.strftime("%Y-%m-%d %H:%M", time.localtime(previous.get("time", 0))),
+                result=self.disk_bench_text(previous)
+            )
+        self.disk_bench_label.setText(text)
+
+    def disk_bench_failed(self, error):
+        print("disk benchmark error:", error)
+        if self.disk_bench is not None:
+            self.disk_bench.cancel()
+        self.disk_bench = None
+        self.disk_bench_btn.setEnabled(True)
+        self.disk_bench_btn.setVisible(self.current_device in self.disk_keys)
+        self.disk_bench_label.setText(lang.t("diskbench_failed").format(error=error))
+        self.update_fixed_interval()
+        self.apply_language()
+
+    # ---------------- REPLAY ----------------
+    def toggle_replay(self):
+        if self.replay is not None:
+            self.stop_replay()
+            return
+        path, _ = QFileDialog.getOpenFileName(
+            self, lang.t("bench_replay"), resource_path("files/recordings"),
+            f"PC Health recordings (*{recording.EXTENSION})"
+        )
+        if path:
+            self.start_replay(path)
+
+    def start_replay(self, path):
+        try:
+            replay = recording.Recording(path)
+        except (OSError, ValueError) as e:
+            print("replay error:", e)
+            return
+
+        # discos e placas de rede de outra máquina ganham um card só durante o replay
+        for name in replay.channels:
+            if name in BENCH_CHANNELS or ":" in name:
+                continue
+            if name not in self.cards:
+                self.add_card(name, "#ff6ec7" if f"{name}:sent" in replay.channels else "#ffa500")
+                self.replay_cards.append(name)
+
+        for name, card in self.cards.items():
+            self.live_histories[name] = card.swap_history(History())
+        self.graph.set_history(self.cards[self.current_device].history)
+
+        self.replay = replay
+        self.replay_pos = 0.0
+        self.replay_index = 0
+        self.replay_clock = time.monotonic()
+        self.replay_timer.start()
+        self.apply_language()
+
+    def replay_tick(self):
+        now = time.monotonic()
+        speed = self.speed_combo.currentData()
+        self.replay_pos += (now - self.replay_clock) * 1000 * speed
+        self.replay_clock = now
+
+        replay = self.replay
+        end = replay.index_at(self.replay_pos)
+        if end > self.replay_index:
+            # só o último registro do tick atualiza os textos,
+            # os anteriores vão direto para o histórico
+            for i in range(self.replay_index, end):
+                values = {k: v for k, v in replay.row(i).items() if not math.isnan(v)}
+                at = replay.times[i] / 1000
+                if i < end - 1:
+                    for name, value in self.graph_values(values).items():
+                        if name in self.cards:
+                            self.cards[name].history.append(value, at)
+                else:
+                    self.show_values(values, at)
+            self.replay_index = end
+            if self.graph.isVisible():
+                self.graph.update()
+
+        position = min(self.replay_pos / 1000, replay.duration())
+        self.status_label.setText(
+            f"{lang.t('bench_replaying')} {speed}x  "
+            f"{format_duration(position)} / {format_duration(replay.duration())}"
+        )
+        if self.replay_index >= len(replay):
+            # fim da gravação: fica parado no último ponto até o usuário sair
+            self.replay_timer.stop()
+
+    def stop_replay(self):
+        self.replay_timer.stop()
+        self.replay.close()
+        self.replay = None
+
+        for name, history in self.live_histories.items():
+            if name in self.cards:
+                self.cards[name].swap_history(history)
+        self.live_histories = {}
+
+        for name in self.replay_cards:
+            card = self.cards.pop(name)
+            card.setParent(None)
+            card.deleteLater()
+        self.replay_cards = []
+        # placa que só tinha card do replay ganha um card ao vivo no próximo tick
+        self.net_cards = [name for name in self.net_cards if name in self.cards]
+        if self.current_device not in self.cards:
+            self.select_device("CPU")
+        self.graph.set_history(self.cards[self.current_device].history)
+        self.status_label.setText("")
+        self.apply_language()
+
+    def apply_language(self):
+        self.heatmap_title.setText(lang.t("heat_title"))
+        self.heatmap_mode.setItemText(0, lang.t("heat_usage"))
+        self.heatmap_mode.setItemText(1, lang.t("heat_freq"))
+        self.process_table.setHorizontalHeaderLabels([lang.t(key) for key in PROCESS_COLUMNS])
+        self.process_sort_label.setText(lang.t("proc_sort"))
+        for i, key in enumerate(("proc_cpu", "proc_memory", "proc_io")):
+            self.process_sort.setItemText(i, lang.t(key))
+        if not self.process_title.text():
+            self.process_title.setText(lang.t("proc_title").format(count="-"))
+        self.record_btn.setText(lang.t("bench_stop_record" if self.recorder else "bench_record"))
+        self.replay_btn.setText(lang.t("bench_stop_replay" if self.replay else "bench_replay"))
+        self.cpu_bench_btn.setText(lang.t("cpubench_stop" if self.cpu_bench else "cpubench_run"))
+        self.disk_bench_btn.setText(lang.t("diskbench_stop" if self.disk_bench else "diskbench_run"))
+
+    def update_gpu(self, gpus):
+        self.gpu_pending = False
+        if self.replay is not None:
+            return
+        if not gpus:
+            self.cards["GPU"].update_value("-", 0)
+            return
+
+        # com várias GPUs o card mostra a mais carregada
+        gpu = max(gpus, key=lambda g: g.load or 0)
+        load = gpu.load or 0
+        temp = f" ({gpu.temperature}°C)" if gpu.temperature is not None else ""
+        prefix = f"GPU {gpu.index}: " if len(gpus) > 1 else ""
+        self.cards["GPU"].update_value(f"{prefix}{load:.0f}%{temp}", load)
+
+        if self.current_device == "GPU":
+            def show(value, unit):
+                return "-" if value is None else f"{value:.0f}{unit}"
+            self.info_labels["Usage"].setText(show(gpu.load, "%"))
+            self.info_labels["Speed"].setText(show(gpu.clock_graphics, " MHz"))
+            if gpu.memory_used is not None and gpu.memory_total:
+                self.info_labels["Processes"].setText(f"{gpu.memory_used:.0f} / {gpu.memory_total:.0f} MB")
+            else:
+                self.info_labels["Processes"].setText("-")
+            self.info_labels["Threads"].setText(show(gpu.power, " W"))
+            self.info_labels["Cores"].setText(show(gpu.temperature, "°C"))
+            self.info_labels["Logical"].setText(show(gpu.fan, "%"))
+            self.graph.update()
 
 class SettingsTab(QWidget):
 	def __init__(self, app_reference):
@@ -1491,7 +3056,6 @@ class SettingsTab(QWidget):
 		layout = QVBoxLayout()
 
 		# LANGUAGE
-		lang = LanguageManager()
 		lang_group = QGroupBox("Language")
 		lang_layout = QVBoxLayout()
 
@@ -1505,7 +3069,12 @@ class SettingsTab(QWidget):
 
 		self.lang_combo.currentIndexChanged.connect(self.change_language)
 
+		self.io_label = QLabel()
+		self.io_label.setStyleSheet("color:gray;font-size:11px;")
+		self.update_io_label()
+
 		lang_layout.addWidget(self.lang_combo)
+		lang_layout.addWidget(self.io_label)
 		lang_group.setLayout(lang_layout)
 
 		layout.addWidget(lang_group)
@@ -1515,16 +3084,19 @@ class SettingsTab(QWidget):
 		self.setLayout(layout)
 
 	def change_language(self):
-		lang = LanguageManager()
-		lang.load_language(self.lang_combo.currentData())
+		lang.set_language(self.lang_combo.currentData())
 		self.app_reference.refresh_ui()
+		self.update_io_label()
+
+	def update_io_label(self):
+		self.io_label.setText(f"{lang.t('lang_disk_io')} {lang.reads} / {lang.writes}")
 
 	def change_color(self, text):
 	    raw = config_file.COLOR_MAP['Orange']
 	    theme.accent = QColor(raw).name()
 	    theme.save()
 
-	    QApplication.instance().setStyleSheet(build_stylesheet())
+	    set_stylesheet(QApplication.instance())
 	    self.app_reference.refresh_ui()
 
 	def update_accent_labels(self, widget):
@@ -1535,7 +3107,7 @@ class SettingsTab(QWidget):
 		theme.theme = self.theme_combo.currentData()
 		theme.save()
 
-		QApplication.instance().setStyleSheet(build_stylesheet())
+		set_stylesheet(QApplication.instance())
 
 class AboutTab(QWidget):
 	def __init__(self, app_reference):
@@ -1557,7 +3129,6 @@ class AboutTab(QWidget):
 		left_card.setProperty("profile", True)
 
 		left_layout = QVBoxLayout()
-		lang = LanguageManager()
 		title = QLabel(lang.t("contribuitors"))
 		title.setStyleSheet(
 			"color:white;font-size:18px;font-weight:bold;border:none;"
@@ -1743,11 +3314,99 @@ class AboutTab(QWidget):
 	def open_coffee(self):
 		if hasattr(self, "coffee_link") and self.coffee_link:
 			webbrowser.open(self.coffee_link)
+# Aba ainda não construída
+class TabPlaceholder(QLabel):
+	def __init__(self):
+		super().__init__()
+		self.setAlignment(Qt.AlignmentFlag.AlignCenter)
+		self.setStyleSheet("color:gray;")
+		self.apply_language()
+
+	def apply_language(self):
+		self.setText(lang.t("loading"))
+
+def print_startup_report(times):
+	print("startup report:")
+	for name, seconds in times.items():
+		print(f"  {name:<20} {seconds * 1000:8.1f} ms")
+
+# DEBUG (--trace): custo por tick e histogramas do instrument.py, com Ctrl+Shift+D
+DEBUG_COLUMNS = (
+	"debug_name", "debug_category", "debug_tick_cost", "debug_calls",
+	"debug_p50", "debug_p99", "debug_max", "debug_total",
+)
+
+def trace_path():
+	return resource_path(f"files/traces/trace-{time.strftime('%Y%m%d-%H%M%S')}.json")
+
+def save_trace():
+	path = trace_path()
+	try:
+		instrument.dump(path)
+		print("trace saved:", path)
+	except OSError as e:
+		print("trace error:", e)
+	return path
+
+class DebugPanel(QWidget):
+	def __init__(self, parent=None):
+		# janela própria, mas filha da principal: fecha junto com ela
+		super().__init__(parent, Qt.WindowType.Window)
+		self.setWindowTitle(lang.t("debug_title"))
+		self.resize(820, 460)
+		layout = QVBoxLayout(self)
+
+		header = QHBoxLayout()
+		self.tick_label = QLabel()
+		self.save_btn = QPushButton(lang.t("debug_save"))
+		self.save_btn.clicked.connect(self.save)
+		header.addWidget(self.tick_label)
+		header.addStretch()
+		header.addWidget(self.save_btn)
+
+		self.table = QTableWidget(0, len(DEBUG_COLUMNS))
+		self.table.setHorizontalHeaderLabels([lang.t(key) for key in DEBUG_COLUMNS])
+		self.table.verticalHeader().setVisible(False)
+		self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+		self.table.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+		self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+		self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+
+		layout.addLayout(header)
+		layout.addWidget(self.table)
+		sampler.subscribe(self.refresh, self)
+
+	def refresh(self, snap=None):
+		tracer = instrument.tracer
+
+		def ms(ns):
+			return f"{ns / 1e6:.3f}"
+
+		self.tick_label.setText(lang.t("debug_tick").format(
+			ticks=tracer.ticks, interval=f"{tracer.last_tick_ns / 1e6:.0f}"
+		))
+		# ordenado pelo tempo total: o que mais pesa no app fica em cima
+		rows = tracer.summary()
+		self.table.setRowCount(len(rows))
+		for r, row in enumerate(rows):
+			values = (
+				row["name"], row["category"], ms(row["tick"]), str(row["count"]),
+				ms(row["p50"]), ms(row["p99"]), ms(row["max"]), ms(row["total"]),
+			)
+			for c, text in enumerate(values):
+				item = self.table.item(r, c)
+				if item is None:
+					item = QTableWidgetItem()
+					self.table.setItem(r, c, item)
+				item.setText(text)
+
+	def save(self):
+		self.save_btn.setText(lang.t("debug_saved").format(path=os.path.basename(save_trace())))
+
 # APP
 class PCHApp(QWidget):
 	def __init__(self):
 		super().__init__()
-		lang = LanguageManager()
 		self.setWindowTitle(config_file.name + " | " + config_file.version)
 		self.setGeometry(100, 100, 750, 550)
 		self.setObjectName("root")
@@ -1777,25 +3436,67 @@ class PCHApp(QWidget):
 
 		layout = QVBoxLayout()
 
+		# Abas são criadas só quando aparecem pela primeira vez
+		self.tab_factories = [
+			CPUTab,
+			MainboardTab,
+			MemoryTab,
+			SPDTab,
+			GraphicsTab,
+			BenchTab,
+			lambda: SettingsTab(self),
+			lambda: AboutTab(self),
+		]
+		self.tab_built = [False] * len(self.tab_factories)
+		self.tab_times = {}
+
 		# 🔥 IMPORTANTE: salvar tabs como atributo
 		self.tabs = QTabWidget()
-		self.tabs.addTab(CPUTab(), "")
-		self.tabs.addTab(MainboardTab(), "")
-		self.tabs.addTab(MemoryTab(), "")
-		self.tabs.addTab(SPDTab(), "")
-		self.tabs.addTab(GraphicsTab(), "")
-		self.tabs.addTab(BenchTab(), "")
-		self.tabs.addTab(SettingsTab(self), "")
-		self.tabs.addTab(AboutTab(self), "")
+		for _ in self.tab_factories:
+			self.tabs.addTab(TabPlaceholder(), "")
+		self.tabs.currentChanged.connect(self.build_tab)
 
 		layout.addWidget(self.tabs)
 		self.setLayout(layout)
 
+		self.build_tab(0)
+
 		# Atualiza nomes das abas
 		self.refresh_ui()
 
+		# painel de depuração, só existe com --trace
+		self.debug_panel = None
+		if instrument.tracer is not None:
+			shortcut = QShortcut(QKeySequence("Ctrl+Shift+D"), self)
+			shortcut.activated.connect(self.toggle_debug_panel)
+
+	def toggle_debug_panel(self):
+		if self.debug_panel is None:
+			self.debug_panel = DebugPanel(self)
+		self.debug_panel.setVisible(not self.debug_panel.isVisible())
+		if self.debug_panel.isVisible():
+			self.debug_panel.refresh()
+
+	def build_tab(self, index):
+		if index < 0 or self.tab_built[index]:
+			return
+		self.tab_built[index] = True
+
+		started = time.perf_counter()
+		widget = self.tab_factories[index]()
+		self.tab_times[type(widget).__name__] = time.perf_counter() - started
+
+		# trocar o placeholder sem disparar currentChanged de novo
+		text = self.tabs.tabText(index)
+		self.tabs.blockSignals(True)
+		placeholder = self.tabs.widget(index)
+		self.tabs.removeTab(index)
+		self.tabs.insertTab(index, widget, text)
+		self.tabs.setCurrentIndex(index)
+		self.tabs.blockSignals(False)
+		placeholder.deleteLater()
+
 	def refresh_ui(self):
-		lang = LanguageManager()
 		tab_keys = [
 			"tab_processor",
 			"tab_mainboard",
@@ -1817,7 +3518,7 @@ class PCHApp(QWidget):
 			if widget and hasattr(widget, "apply_language"):
 				widget.apply_language()
 
-		QApplication.instance().setStyleSheet(build_stylesheet())
+		set_stylesheet(QApplication.instance())
 
 		# atualiza botões accent
 		for w in self.findChildren(AccentButton):
@@ -1825,23 +3526,92 @@ class PCHApp(QWidget):
 		self.tabs.update()
 		self.update()
 
+	def changeEvent(self, event):
+		if event.type() == QEvent.Type.WindowStateChange:
+			sampler.set_minimized(self.isMinimized())
+		super().changeEvent(event)
+
 	def apply_theme(self):
-		QApplication.instance().setStyleSheet(build_stylesheet())
+		set_stylesheet(QApplication.instance())
 
 		# atualiza botões accent
 		for w in self.findChildren(AccentButton):
 			w.update_style()
 
-if __name__ == "__main__":
-    import multiprocessing
-    multiprocessing.freeze_support()
+def parse_args(argv):
+    import argparse
+    parser = argparse.ArgumentParser(prog="main.py")
+    parser.add_argument("--startup-report", action="store_true",
+        help="print how long each startup step took")
+    parser.add_argument("--refresh-hardware", action="store_true",
+        help="ignore the cached hardware inventory and cpuinfo results")
+    parser.add_argument("--provider", choices=("auto",) + tuple(PROVIDERS), default="auto",
+        help="hardware inventory backend (default: wmi on Windows, linux elsewhere)")
+    parser.add_argument("--render-stats", action="store_true",
+        help="print graph painting times on exit")
+    parser.add_argument("--trace", action="store_true",
+        help="time the app's own collectors, painting and stylesheets; "
+             "Ctrl+Shift+D shows the breakdown, a Chrome trace is saved to files/traces on exit")
+    parser.add_argument("--metrics-port", type=int,
+        help="serve OpenMetrics on this port")
+    parser.add_argument("--metrics-host", default="127.0.0.1",
+        help="address for --metrics-port (default: 127.0.0.1)")
+    return parser.parse_known_args(argv)
 
-    # criar objetos DEPOIS do freeze_support
-    c = wmi.WMI()
+if __name__ == "__main__":
+    started = time.perf_counter()
+    args, qt_args = parse_args(sys.argv[1:])
+
+    provider = select_provider(args.provider)
+    inventory = Inventory(
+        provider,
+        resource_path("files/inventory.json"),
+        refresh=args.refresh_hardware
+    )
+    cpu_cache = CpuInfoCache(
+        resource_path("files/cpuinfo.json"),
+        cpu_fingerprint(provider),
+        refresh=args.refresh_hardware
+    )
     theme = ThemeManager()
-    app = QApplication(sys.argv)
+    app = QApplication(sys.argv[:1] + qt_args)
     app.setWindowIcon(QtGui.QIcon(resource_path("files/icon.ico")))
-    app.setStyleSheet(build_stylesheet())
+    set_stylesheet(app)
+    sampler = Sampler()
+    workers = WorkerPool()
+    threads = TaskThreads()
+    gpu_sampler = GPUSampler()
+    app.aboutToQuit.connect(sampler.stop)
+    # os benchmarks são cancelados antes da espera do WorkerPool
+    app.aboutToQuit.connect(threads.shutdown)
+    app.aboutToQuit.connect(workers.shutdown)
+    app.aboutToQuit.connect(gpu_sampler.close)
     window = PCHApp()
+
+    if args.metrics_port is not None:
+        import metrics
+        try:
+            exporter = metrics.MetricsExporter(args.metrics_port, args.metrics_host, gpu_sampler)
+            # recebe toda amostra, com qualquer aba visível
+            sampler.subscribe(exporter.update, background=sampler.interval, keep_alive=True)
+            app.aboutToQuit.connect(exporter.close)
+        except OSError as e:
+            print("metrics error:", e)
+
+    sampler.start()
     window.show()
+
+    if args.startup_report:
+        def first_window():
+            times = {"first window": time.perf_counter() - started}
+            times.update(window.tab_times)
+            print_startup_report(times)
+        QTimer.singleShot(0, first_window)
+
+    if args.render_stats:
+        app.aboutToQuit.connect(print_render_stats)
+
+    if args.trace:
+        app.aboutToQuit.connect(save_trace)
+
     sys.exit(app.exec())
\ No newline at end of file
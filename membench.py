@@ -0,0 +1,178 @@
+import time
+import ctypes
+import random
+import threading
+import psutil
+from array import array
+
+try:
+	import numpy
+except ImportError:
+	numpy = None
+
+# Benchmark de memória do MemoryTab.
+#
+# Banda: leitura, escrita e cópia sequenciais num buffer bem maior que o L3
+# (NumPy quando instalado; sem ele bytearray/memoryview + memset/memmove).
+# A cópia conta leitura + escrita (2x o tamanho), como no STREAM.
+#
+# Latência: pointer chasing numa permutação aleatória de linhas de cache,
+# com tamanhos de 4 KiB (L1) a 256 MiB (DRAM). Cada acesso depende do
+# anterior, então o prefetcher não ajuda. O laço é Python: o custo do
+# interpretador é medido num buffer de um elemento e descontado.
+
+LINE = 64
+LATENCY_SIZES = tuple(4096 * 4**k for k in range(9))
+
+def memset(buffer, value):
+	address = ctypes.addressof((ctypes.c_char * len(buffer)).from_buffer(buffer))
+	ctypes.memset(address, value, len(buffer))
+
+class MemoryBenchmark:
+	def __init__(self, size=256 * 1024**2, repeats=5, steps=1_000_000, sizes=LATENCY_SIZES):
+		# dois buffers de banda + o maior da latência não podem apertar o sistema
+		limit = psutil.virtual_memory().available // 8
+		self.size = max(16 * 1024**2, min(size, limit))
+		self.sizes = [s for s in sizes if s <= max(limit, sizes[0])]
+		self.repeats = repeats
+		self.steps = steps
+		self.backend = "numpy" if numpy is not None else "memoryview"
+		self.phase = None
+		self.done = 0
+		self.total = 3 + len(self.sizes)
+		self.cancelled = threading.Event()
+
+	def progress(self):
+		return self.done / self.total
+
+	def cancel(self):
+		self.cancelled.set()
+
+	def check(self):
+		if self.cancelled.is_set():
+			raise Cancelled()
+
+	def best(self, fn):
+		times = []
+		for _ in range(self.repeats):
+			self.check()
+			started = time.perf_counter()
+			fn()
+			times.append(time.perf_counter() - started)
+		self.done += 1
+		return min(times)
+
+	def bandwidth(self):
+		n = self.size
+		# as páginas são tocadas antes: a primeira escrita mede page fault, não memória
+		if numpy is not None:
+			src = numpy.ones(n // 8, dtype=numpy.uint64)
+			dst = numpy.zeros(n // 8, dtype=numpy.uint64)
+			read = self.best(src.sum)
+			write = self.best(lambda: dst.fill(7))
+			copy = self.best(lambda: numpy.copyto(dst, src))
+		else:
+			src = bytearray(n)
+			dst = bytearray(n)
+			memset(src, 1)
+			memset(dst, 0)
+			view = memoryview(dst)
+			# find() de um byte que não existe varre o buffer inteiro (memchr)
+			read = self.best(lambda: src.find(b"\x02"))
+			write = self.best(lambda: memset(dst, 7))
+			copy = self.best(lambda: view.__setitem__(slice(None), src))
+			view.release()
+		return {"read": n / read, "write": n / write, "copy": 2 * n / copy}
+
+	def chain(self, size):
+		# cada linha de cache guarda o índice da próxima, numa volta só (Sattolo)
+		lines = max(1, size // LINE)
+		step = LINE // 8
+		if numpy is not None:
+			order = numpy.random.default_rng(1).permutation(lines).astype(numpy.uint64)
+			data = numpy.zeros(lines * step, dtype=numpy.uint64)
+			data[order * step] = numpy.roll(order, -1) * step
+			return array("Q", data.tobytes()), int(order[0]) * step
+		order = list(range(lines))
+		rnd = random.Random(1)
+		for i in range(lines - 1, 0, -1):
+			j = rnd.randrange(i)
+			order[i], order[j] = order[j], order[i]
+		data = array("Q", bytes(lines * LINE))
+		for k in range(lines):
+			data[order[k] * step] = order[(k + 1) % lines] * step
+		return data, order[0] * step
+
+	def chase(self, data, start):
+		best = None
+		for _ in range(3):
+			self.check()
+			i = start
+			started = time.perf_counter()
+			for _ in range(self.steps):
+				i = data[i]
+			elapsed = time.perf_counter() - started
+			best = elapsed if best is None else min(best, elapsed)
+		return best / self.steps * 1e9
+
+	def latency(self):
+		# laço sobre um elemento que aponta para si mesmo: só o custo do interpretador.
+		# O índice passa de 256 para não cair no cache de ints pequenos do Python.
+		# Medido de novo antes de cada tamanho; vale o menor, como nos acessos
+		spin = array("Q", bytes(4096))
+		spin[300] = 300
+		overhead = None
+		raw = []
+		for size in self.sizes:
+			self.check()
+			spun = self.chase(spin, 300)
+			overhead = spun if overhead is None else min(overhead, spun)
+			data, start = self.chain(size)
+			raw.append((size, self.chase(data, start)))
+			del data
+			self.done += 1
+		results = [{"size": size, "ns": max(0.0, ns - overhead)} for size, ns in raw]
+		return results, overhead
+
+	def run(self):
+		started = time.perf_counter()
+		try:
+			self.phase = "bandwidth"
+			bandwidth = self.bandwidth()
+			self.phase = "latency"
+			latency, overhead = self.latency()
+		except Cancelled:
+			return None
+		finally:
+			self.phase = None
+		return {
+			"backend": self.backend,
+			"buffer": self.size,
+			"bandwidth": bandwidth,
+			"latency": latency,
+			"loop_overhead_ns": overhead,
+			"seconds": time.perf_counter() - started,
+		}
+
+class Cancelled(Exception):
+	pass
+
+def theoretical_bandwidth(modules, ddr_map):
+	# MT/s x 8 bytes por transferência x canais. O barramento roda na velocidade
+	# configurada do módulo mais lento; sem ela, na nominal (Speed)
+	speeds = []
+	for mem in modules:
+		speed = getattr(mem, "ConfiguredClockSpeed", None) or getattr(mem, "Speed", None)
+		if speed:
+			speeds.append(int(speed))
+	if not speeds:
+		return None
+	# desktops e notebooks: 2 canais com 2 ou mais módulos
+	channels = 2 if len(modules) >= 2 else 1
+	speed = min(speeds)
+	return {
+		"type": ddr_map.get(getattr(modules[0], "SMBIOSMemoryType", None)),
+		"speed": speed,
+		"channels": channels,
+		"bandwidth": speed * 1e6 * 8 * channels,
+	}
@@ -0,0 +1,142 @@
+import time
+import threading
+import psutil
+from gpu import GPUSampler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# Endpoint OpenMetrics/Prometheus (--metrics-port).
+# O texto é montado uma vez por amostra; cada scrape só devolve os bytes
+# prontos, sem chamar psutil/WMI, então vários scrapers não atrasam a coleta.
+# Uso de disco muda devagar e vem de uma thread própria, a cada poucos segundos.
+# As GPUs vêm da última leitura do GPUSampler: a interface lê a cada tick
+# e a thread lenta garante uma leitura mesmo com a aba Bench fechada.
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+def escape(value):
+	return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+def family(lines, name, kind, help_text, samples):
+	# samples: [(rótulos, valor)]; contadores ganham o sufixo _total
+	lines.append(f"# TYPE {name} {kind}")
+	lines.append(f"# HELP {name} {help_text}")
+	sample_name = name + "_total" if kind == "counter" else name
+	for labels, value in samples:
+		if labels:
+			text = ",".join(f'{key}="{escape(val)}"' for key, val in labels.items())
+			lines.append(f"{sample_name}{{{text}}} {value}")
+		else:
+			lines.append(f"{sample_name} {value}")
+
+def render(snap, slow, gpus):
+	freq = snap["cpu_freq"]
+	mem = snap["memory"]
+	net = snap["net"]
+	lines = []
+
+	family(lines, "pchealth_cpu_usage_percent", "gauge", "CPU usage.",
+		[({}, snap["cpu_percent"])])
+	if freq:
+		family(lines, "pchealth_cpu_frequency_hertz", "gauge", "Current CPU frequency.",
+			[({}, freq.current * 1e6)])
+	family(lines, "pchealth_memory_used_bytes", "gauge", "Memory in use.",
+		[({}, mem.used)])
+	family(lines, "pchealth_memory_available_bytes", "gauge", "Memory available.",
+		[({}, mem.available)])
+	family(lines, "pchealth_memory_total_bytes", "gauge", "Installed memory.",
+		[({}, mem.total)])
+	if net:
+		family(lines, "pchealth_network_sent_bytes", "counter", "Bytes sent on all interfaces.",
+			[({}, net.bytes_sent)])
+		family(lines, "pchealth_network_received_bytes", "counter", "Bytes received on all interfaces.",
+			[({}, net.bytes_recv)])
+	family(lines, "pchealth_processes", "gauge", "Running processes.",
+		[({}, snap["processes"])])
+
+	disks = slow.get("disks", {})
+	if disks:
+		family(lines, "pchealth_disk_usage_percent", "gauge", "Used space per mount point.",
+			[({"mountpoint": mount}, percent) for mount, percent in disks.items()])
+
+	def gpu_family(name, help_text, field, scale=1):
+		samples = [
+			({"gpu": str(gpu.index), "name": gpu.name}, getattr(gpu, field) * scale)
+			for gpu in gpus if getattr(gpu, field) is not None
+		]
+		if samples:
+			family(lines, name, "gauge", help_text, samples)
+
+	gpu_family("pchealth_gpu_load_percent", "GPU load.", "load")
+	gpu_family("pchealth_gpu_memory_used_bytes", "GPU memory in use.", "memory_used", 1024**2)
+	gpu_family("pchealth_gpu_temperature_celsius", "GPU temperature.", "temperature")
+	gpu_family("pchealth_gpu_power_watts", "GPU power draw.", "power")
+
+	family(lines, "pchealth_sample_timestamp_seconds", "gauge", "When the sample was taken.",
+		[({}, round(snap["time"], 3))])
+	lines.append("# EOF")
+	return "\n".join(lines) + "\n"
+
+def read_disks():
+	disks = {}
+	for part in psutil.disk_partitions():
+		try:
+			disks[part.mountpoint] = psutil.disk_usage(part.mountpoint).percent
+		except (OSError, PermissionError):
+			# leitor de CD vazio, unidade de rede fora do ar...
+			continue
+	return disks
+
+class MetricsHandler(BaseHTTPRequestHandler):
+	def do_GET(self):
+		if self.path.split("?")[0] not in ("/", "/metrics"):
+			self.send_error(404)
+			return
+		body = self.server.exporter.body
+		if body is None:
+			# ainda não houve amostra
+			self.send_error(503)
+			return
+		self.send_response(200)
+		self.send_header("Content-Type", CONTENT_TYPE)
+		self.send_header("Content-Length", str(len(body)))
+		self.end_headers()
+		self.wfile.write(body)
+
+	def log_message(self, format, *args):
+		pass
+
+class MetricsExporter:
+	def __init__(self, port, host="127.0.0.1", gpus=None, slow_interval=15.0):
+		self.body = None
+		# sem GPUSampler de fora (modo headless) abre o próprio
+		self.own_gpus = gpus is None
+		self.gpus = GPUSampler() if gpus is None else gpus
+		self.slow = {}
+		self.slow_interval = slow_interval
+		self.stopped = threading.Event()
+
+		self.server = ThreadingHTTPServer((host, port), MetricsHandler)
+		self.server.daemon_threads = True
+		self.server.exporter = self
+		self.port = self.server.server_address[1]
+
+		threading.Thread(target=self.server.serve_forever, name="metrics-http", daemon=True).start()
+		threading.Thread(target=self.refresh_slow, name="metrics-slow", daemon=True).start()
+
+	def update(self, snap):
+		# troca a referência inteira: quem está no meio de um scrape usa a anterior
+		self.body = render(snap, self.slow, self.gpus.last).encode("utf-8")
+
+	def refresh_slow(self):
+		while not self.stopped.is_set():
+			started = time.monotonic()
+			self.slow = {"disks": read_disks()}
+			self.gpus.sample()
+			self.stopped.wait(max(0.0, self.slow_interval - (time.monotonic() - started)))
+
+	def close(self):
+		self.stopped.set()
+		self.server.shutdown()
+		self.server.server_close()
+		if self.own_gpus:
+			self.gpus.close()
@@ -0,0 +1,79 @@
+import time
+import heapq
+import psutil
+from collections import namedtuple
+
+# Top N processos por CPU, memória ou I/O.
+# psutil.process_iter() reaproveita os objetos Process entre as chamadas,
+# então cpu_percent() é só a diferença desde a última passada. Os atributos
+# de cada processo são lidos juntos (oneshot), I/O sempre, porque a coluna
+# aparece em qualquer ordenação. I/O fica None sem permissão ou na primeira
+# passada de um processo. Roda no WorkerPool: com milhares de processos leva
+# dezenas de ms.
+
+ProcessRow = namedtuple("ProcessRow", "pid name cpu memory io")
+
+SORT_KEYS = ("cpu", "memory", "io")
+
+class ProcessTracker:
+	def __init__(self, top=15):
+		self.top = top
+		self.cpus = psutil.cpu_count() or 1
+		# chave é o próprio Process (pid + hora de criação): pid reaproveitado não herda nada
+		self.names = {}
+		# Process -> (bytes lidos + escritos, instante)
+		self.last_io = {}
+		self.count = 0
+		# duração da última passada, para quem agenda espaçar em hosts grandes
+		self.elapsed = 0.0
+
+	# o nome só é lido quando o pid aparece pela primeira vez;
+	# o psutil não tem io_counters no macOS
+	ATTRS = ("cpu_percent", "memory_info") + (
+		("io_counters",) if hasattr(psutil.Process, "io_counters") else ()
+	)
+
+	def sample(self, key="cpu"):
+		now = time.monotonic()
+		rows = []
+		names = {}
+		last_io = {}
+
+		# process_iter(attrs) lê cada processo dentro de oneshot();
+		# sem permissão o atributo vem como None
+		for proc in psutil.process_iter(self.ATTRS, ad_value=None):
+			info = proc.info
+			pid = proc.pid
+			name = self.names.get(proc)
+			if name is None:
+				try:
+					name = proc.name() or str(pid)
+				except psutil.Error:
+					name = str(pid)
+			names[proc] = name
+
+			memory = info["memory_info"].rss if info["memory_info"] else 0
+			# cpu_percent soma os núcleos (até 100 * núcleos);
+			# dividido dá a fatia da CPU toda, como no Gerenciador de Tarefas
+			cpu = min(100.0, (info["cpu_percent"] or 0.0) / self.cpus)
+
+			io = None
+			counters = info.get("io_counters")
+			if counters is not None:
+				total = counters.read_bytes + counters.write_bytes
+				previous = self.last_io.get(proc)
+				if previous is not None and now > previous[1]:
+					io = max(0.0, (total - previous[0]) / (now - previous[1]))
+				last_io[proc] = (total, now)
+
+			rows.append(ProcessRow(pid, name, cpu, memory, io))
+
+		# processos que terminaram saem dos caches
+		self.names = names
+		self.last_io = last_io
+		self.count = len(rows)
+		self.elapsed = time.monotonic() - now
+
+		index = SORT_KEYS.index(key) + 2
+		# sem I/O conhecido vai para o fim da ordenação
+		return self.count, heapq.nlargest(self.top, rows, key=lambda row: -1.0 if row[index] is None else row[index])
@@ -0,0 +1,416 @@
+import os
+import sys
+import struct
+import threading
+import psutil
+from types import SimpleNamespace
+
+# Fontes do inventário de hardware estático.
+# As abas só falam com o Inventory, que pergunta ao provider escolhido na
+# inicialização (select_provider). Os registros usam os nomes de propriedade
+# do WMI (Name, Manufacturer, Capacity...), então o mesmo código de tela serve
+# para o Windows e para o Linux; o que o sistema não informa fica None.
+#
+#   WmiProvider:   WMI + registro do Windows
+#   LinuxProvider: /proc/cpuinfo, /sys/class/dmi/id, /sys/block,
+#                  /sys/devices/system/memory e as tabelas SMBIOS em /sys/firmware
+
+# tipo -> classe WMI equivalente
+KINDS = {
+	"processor": "Win32_Processor",
+	"baseboard": "Win32_BaseBoard",
+	"bios": "Win32_BIOS",
+	"memory": "Win32_PhysicalMemory",
+	"memory_arrays": "Win32_PhysicalMemoryArray",
+	"disks": "Win32_DiskDrive",
+	"video": "Win32_VideoController",
+}
+
+# propriedades que as abas leem direto (obj.Prop); as outras vão por getattr
+PROPERTIES = {
+	"processor": (
+		"Name", "Manufacturer", "MaxClockSpeed", "ExtClock",
+		"NumberOfCores", "NumberOfLogicalProcessors", "SocketDesignation",
+	),
+	"baseboard": ("Manufacturer", "Product", "Version", "SerialNumber"),
+	"bios": ("Manufacturer", "SMBIOSBIOSVersion", "ReleaseDate"),
+	"memory": (
+		"Capacity", "Speed", "ConfiguredClockSpeed", "SMBIOSMemoryType", "MemoryType",
+		"Manufacturer", "PartNumber", "SerialNumber", "DeviceLocator", "BankLabel",
+		"FormFactor", "DataWidth", "TotalWidth", "ConfiguredVoltage", "Status", "Tag",
+	),
+	"memory_arrays": ("MemoryDevices", "MaxCapacity"),
+	"disks": ("Index", "DeviceID", "Model", "Size", "InterfaceType", "MediaType", "SerialNumber"),
+	"video": ("Name", "AdapterRAM", "DriverVersion", "PNPDeviceID", "VideoProcessor"),
+}
+
+def record(kind, **values):
+	fields = dict.fromkeys(PROPERTIES[kind])
+	fields.update(values)
+	return SimpleNamespace(**fields)
+
+def to_record(obj):
+	# objetos WMI não podem ser serializados, guardamos só as propriedades
+	props = getattr(obj, "properties", None)
+	if props is None:
+		return SimpleNamespace(**vars(obj))
+	return SimpleNamespace(**{name: getattr(obj, name, None) for name in props})
+
+class WmiProvider:
+	name = "wmi"
+
+	def __init__(self):
+		import wmi
+		self.wmi = wmi
+		# conexões COM/WMI não podem ser compartilhadas entre threads:
+		# cada thread do WorkerPool abre a sua
+		self.local = threading.local()
+
+	def connection(self):
+		if not hasattr(self.local, "connection"):
+			import pythoncom
+			pythoncom.CoInitialize()
+			self.local.connection = self.wmi.WMI()
+		return self.local.connection
+
+	def query(self, kind):
+		items = getattr(self.connection(), KINDS[kind])()
+		return [to_record(item) for item in items]
+
+	def invalidate(self):
+		pass
+
+	def read_registry(self, value_name):
+		import winreg
+		key = winreg.OpenKey(
+			winreg.HKEY_LOCAL_MACHINE,
+			r"HARDWARE\DESCRIPTION\System\\CentralProcessor\0"
+		)
+		value, _ = winreg.QueryValueEx(key, value_name)
+		return value
+
+	def cpu_name(self):
+		try:
+			return self.read_registry("ProcessorNameString").strip()
+		except Exception:
+			return None
+
+	def microcode(self):
+		# REG_BINARY de 8 bytes: a revisão fica na metade de cima
+		try:
+			value = self.read_registry("Update Revision")
+		except Exception:
+			return None
+		if isinstance(value, bytes):
+			return int.from_bytes(value, "little") >> 32
+		return value
+
+	def disk_io_key(self, disk):
+		# Win32_DiskDrive -> chave do psutil.disk_io_counters(perdisk=True)
+		index = getattr(disk, "Index", None)
+		if index is None:
+			device = str(getattr(disk, "DeviceID", "") or "").upper()
+			digits = device.rpartition("PHYSICALDRIVE")[2]
+			index = digits if digits.isdigit() else None
+		return f"PhysicalDrive{int(index)}" if index is not None else None
+
+# SMBIOS (tipos 16 e 17) como o WMI mostra; só o root lê as tabelas
+SMBIOS_ENTRIES = "/sys/firmware/dmi/entries"
+
+def smbios_strings(raw):
+	# strings logo depois da área formatada, numeradas a partir de 1
+	length = raw[1]
+	return [s.decode("latin-1").strip() for s in raw[length:].split(b"\0")]
+
+def smbios_string(raw, strings, offset):
+	if offset >= raw[1] or not raw[offset]:
+		return None
+	index = raw[offset] - 1
+	return strings[index] if index < len(strings) else None
+
+def smbios_word(raw, offset):
+	if offset + 2 > raw[1]:
+		return None
+	return struct.unpack_from("<H", raw, offset)[0]
+
+def smbios_dword(raw, offset):
+	if offset + 4 > raw[1]:
+		return None
+	return struct.unpack_from("<I", raw, offset)[0]
+
+def smbios_memory_device(raw):
+	# tipo 17; tamanho 0 é slot vazio (o WMI não lista)
+	size = smbios_word(raw, 0x0C)
+	if not size or size == 0xFFFF:
+		return None
+	if size == 0x7FFF:
+		capacity = (smbios_dword(raw, 0x1C) or 0) * 1024**2
+	elif size & 0x8000:
+		capacity = (size & 0x7FFF) * 1024
+	else:
+		capacity = size * 1024**2
+
+	strings = smbios_strings(raw)
+	speed = smbios_word(raw, 0x15)
+	configured = smbios_word(raw, 0x20)
+	# a partir do SMBIOS 3.3 velocidades acima de 65534 MT/s vão no campo estendido
+	if speed == 0xFFFF:
+		speed = smbios_dword(raw, 0x54)
+	if configured == 0xFFFF:
+		configured = smbios_dword(raw, 0x58)
+	voltage = smbios_word(raw, 0x26)
+	return dict(
+		Capacity=str(capacity),
+		Speed=speed or None,
+		ConfiguredClockSpeed=configured or None,
+		SMBIOSMemoryType=raw[0x12] if raw[1] > 0x12 else None,
+		MemoryType=0,
+		Manufacturer=smbios_string(raw, strings, 0x17),
+		SerialNumber=smbios_string(raw, strings, 0x18),
+		PartNumber=smbios_string(raw, strings, 0x1A),
+		DeviceLocator=smbios_string(raw, strings, 0x10),
+		BankLabel=smbios_string(raw, strings, 0x11),
+		FormFactor=raw[0x0E],
+		TotalWidth=smbios_word(raw, 0x08),
+		DataWidth=smbios_word(raw, 0x0A),
+		ConfiguredVoltage=voltage or None,
+		Status="OK",
+	)
+
+# fabricantes PCI mais comuns (o nome completo exigiria o pci.ids)
+PCI_VENDORS = {0x10de: "NVIDIA", 0x1002: "AMD", 0x8086: "Intel", 0x1af4: "Virtio", 0x1234: "QEMU"}
+
+class LinuxProvider:
+	name = "linux"
+
+	def __init__(self, root="/"):
+		# root permite apontar para uma cópia do /proc e /sys (testes, benchmarks)
+		self.root = root
+		self.files = {}
+		self.cpuinfo = None
+
+	def path(self, *parts):
+		return os.path.join(self.root, *(part.lstrip("/") for part in parts))
+
+	def read(self, path, binary=False):
+		# arquivos estáticos: lidos uma vez por execução
+		key = (path, binary)
+		if key not in self.files:
+			try:
+				with open(self.path(path), "rb" if binary else "r") as f:
+					value = f.read()
+				self.files[key] = value if binary else value.strip()
+			except (OSError, UnicodeDecodeError):
+				self.files[key] = None
+		return self.files[key]
+
+	def invalidate(self):
+		# botão de recarregar: memória pode ter sido adicionada a quente
+		self.files = {}
+		self.cpuinfo = None
+
+	def listdir(self, path):
+		try:
+			return sorted(os.listdir(self.path(path)))
+		except OSError:
+			return []
+
+	def processors(self):
+		# /proc/cpuinfo: um bloco por processador lógico
+		if self.cpuinfo is None:
+			blocks = []
+			for block in (self.read("/proc/cpuinfo") or "").split("\n\n"):
+				fields = {}
+				for line in block.splitlines():
+					key, _, value = line.partition(":")
+					fields[key.strip()] = value.strip()
+				if fields:
+					blocks.append(fields)
+			self.cpuinfo = blocks
+		return self.cpuinfo
+
+	def cpu_name(self):
+		for cpu in self.processors():
+			if "model name" in cpu:
+				return cpu["model name"]
+		return None
+
+	def microcode(self):
+		for cpu in self.processors():
+			if "microcode" in cpu:
+				try:
+					return int(cpu["microcode"], 0)
+				except ValueError:
+					return None
+		return None
+
+	def max_clock(self):
+		khz = self.read("/sys/devices/system/cpu/cpu0/cpufreq/cpuinfo_max_freq")
+		if khz and khz.isdigit():
+			return int(khz) // 1000
+		for cpu in self.processors():
+			if "cpu MHz" in cpu:
+				return round(float(cpu["cpu MHz"]))
+		return None
+
+	def query(self, kind):
+		return getattr(self, "query_" + kind)()
+
+	def query_processor(self):
+		# como o Win32_Processor: um registro por soquete
+		sockets = {}
+		for cpu in self.processors():
+			socket = sockets.setdefault(cpu.get("physical id", "0"), {"cpu": cpu, "cores": set(), "threads": 0})
+			socket["cores"].add(cpu.get("core id", cpu.get("processor")))
+			socket["threads"] += 1
+		return [
+			record(
+				"processor",
+				Name=socket["cpu"].get("model name"),
+				Manufacturer=socket["cpu"].get("vendor_id"),
+				MaxClockSpeed=self.max_clock(),
+				NumberOfCores=len(socket["cores"]),
+				NumberOfLogicalProcessors=socket["threads"],
+				SocketDesignation=f"CPU {physical_id}",
+			)
+			for physical_id, socket in sorted(sockets.items())
+		]
+
+	def dmi(self, name):
+		value = self.read(f"/sys/class/dmi/id/{name}")
+		return value or None
+
+	def query_baseboard(self):
+		if self.dmi("board_vendor") is None and self.dmi("board_name") is None:
+			return []
+		return [record(
+			"baseboard",
+			Manufacturer=self.dmi("board_vendor"),
+			Product=self.dmi("board_name"),
+			Version=self.dmi("board_version"),
+			SerialNumber=self.dmi("board_serial"),
+		)]
+
+	def query_bios(self):
+		if self.dmi("bios_vendor") is None and self.dmi("bios_version") is None:
+			return []
+		# bios_date vem MM/DD/YYYY; o WMI usa YYYYMMDD000000.000000+000
+		date = self.dmi("bios_date") or ""
+		month, _, rest = date.partition("/")
+		day, _, year = rest.partition("/")
+		release = f"{year}{month}{day}000000.000000+000" if len(year) == 4 else None
+		return [record(
+			"bios",
+			Manufacturer=self.dmi("bios_vendor"),
+			SMBIOSBIOSVersion=self.dmi("bios_version"),
+			ReleaseDate=release,
+		)]
+
+	def smbios(self, kind):
+		entries = []
+		for name in self.listdir(SMBIOS_ENTRIES):
+			if name.split("-")[0] == str(kind):
+				raw = self.read(f"{SMBIOS_ENTRIES}/{name}/raw", binary=True)
+				if raw and len(raw) > 4:
+					entries.append(raw)
+		return entries
+
+	def online_memory(self):
+		# blocos de memória online * tamanho do bloco (em hexadecimal)
+		size = self.read("/sys/devices/system/memory/block_size_bytes")
+		if not size:
+			return None
+		blocks = 0
+		for name in self.listdir("/sys/devices/system/memory"):
+			if name.startswith("memory") and self.read(f"/sys/devices/system/memory/{name}/online") == "1":
+				blocks += 1
+		return blocks * int(size, 16) or None
+
+	def query_memory(self):
+		modules = []
+		for raw in self.smbios(17):
+			module = smbios_memory_device(raw)
+			if module is not None:
+				modules.append(record("memory", Tag=f"Physical Memory {len(modules)}", **module))
+		if modules:
+			return modules
+		# sem acesso às tabelas SMBIOS (usuário comum): um módulo com o total
+		capacity = self.online_memory() or psutil.virtual_memory().total
+		return [record("memory", Capacity=str(capacity), Tag="Physical Memory 0")]
+
+	def query_memory_arrays(self):
+		arrays = []
+		for raw in self.smbios(16):
+			max_capacity = smbios_dword(raw, 0x07)
+			arrays.append(record(
+				"memory_arrays",
+				MemoryDevices=smbios_word(raw, 0x0D),
+				MaxCapacity=max_capacity if max_capacity != 0x80000000 else None,
+			))
+		return arrays
+
+	def query_disks(self):
+		# só dispositivos de verdade (com device/): sem loop, zram, dm, md
+		disks = []
+		for name in self.listdir("/sys/block"):
+			if not os.path.exists(self.path(f"/sys/block/{name}/device")):
+				continue
+			sectors = self.read(f"/sys/block/{name}/size")
+			rotational = self.read(f"/sys/block/{name}/queue/rotational")
+			model = self.read(f"/sys/block/{name}/device/model")
+			vendor = self.read(f"/sys/block/{name}/device/vendor")
+			# virtio e afins só têm o id PCI do fabricante
+			if vendor and vendor.startswith("0x"):
+				vendor = f"{PCI_VENDORS.get(int(vendor, 16), vendor)} {name}"
+			disks.append(record(
+				"disks",
+				Index=len(disks),
+				DeviceID=name,
+				Model=model or vendor or name,
+				Size=str(int(sectors) * 512) if sectors and sectors.isdigit() else None,
+				InterfaceType="NVMe" if name.startswith("nvme") else "SCSI",
+				MediaType="Fixed hard disk media" if rotational == "1" else "Solid state drive",
+				SerialNumber=self.read(f"/sys/block/{name}/device/serial"),
+			))
+		return disks
+
+	def query_video(self):
+		controllers = []
+		for name in self.listdir("/sys/class/drm"):
+			# card0, card1...; conectores (card0-HDMI-A-1) ficam de fora
+			if not name.startswith("card") or not name[4:].isdigit():
+				continue
+			device = f"/sys/class/drm/{name}/device"
+			if self.read(f"{device}/class") is None:
+				continue
+			vendor = self.read(f"{device}/vendor") or "0"
+			product = self.read(f"{device}/device") or "0"
+			vendor_name = PCI_VENDORS.get(int(vendor, 16), vendor)
+			driver = os.path.realpath(self.path(f"{device}/driver"))
+			vram = self.read(f"{device}/mem_info_vram_total")
+			controllers.append(record(
+				"video",
+				Name=f"{vendor_name} [{vendor[2:]}:{product[2:]}]",
+				AdapterRAM=int(vram) if vram and vram.isdigit() else None,
+				DriverVersion=self.read(f"/sys/module/{os.path.basename(driver)}/version"),
+				PNPDeviceID=os.path.basename(os.path.realpath(self.path(device))),
+				VideoProcessor=os.path.basename(driver),
+			))
+		return controllers
+
+	def disk_io_key(self, disk):
+		# o psutil usa o mesmo nome do /sys/block (sda, nvme0n1...)
+		return getattr(disk, "DeviceID", None)
+
+PROVIDERS = {"wmi": WmiProvider, "linux": LinuxProvider}
+
+def select_provider(name="auto"):
+	if name == "auto":
+		name = "wmi" if sys.platform == "win32" else "linux"
+	try:
+		return PROVIDERS[name]()
+	except ImportError as e:
+		# Windows sem o pacote wmi/pywin32: sem /proc e /sys o LinuxProvider
+		# só devolve o total de memória do psutil, mas o resto do app funciona
+		print("hardware provider error:", e)
+		return LinuxProvider()
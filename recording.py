@@ -0,0 +1,127 @@
+import os
+import sys
+import mmap
+import math
+import time
+import struct
+import bisect
+
+# Gravação das amostras do BenchTab em registros de tamanho fixo:
+#
+#   cabeçalho: MAGIC, versão, nº de canais, início (epoch), tamanho do cabeçalho,
+#              nomes dos canais em UTF-8 separados por \0 (alinhado em 8 bytes)
+#   registro:  uint32 ms desde o início + float32 por canal
+#
+# Com 10 canais a 1 Hz são ~3.8 MB por dia. A leitura usa mmap e memoryview,
+# então abrir um arquivo de vários dias não lê nada além do cabeçalho.
+
+MAGIC = b"PCHREC\0\0"
+VERSION = 1
+HEADER = struct.Struct("<8sHHdI")
+EXTENSION = ".pchrec"
+
+class Recorder:
+	def __init__(self, path, channels, flush_interval=5.0):
+		self.path = path
+		self.channels = tuple(channels)
+		self.record = struct.Struct(f"<I{len(self.channels)}f")
+		self.flush_interval = flush_interval
+		self.count = 0
+
+		names = b"\0".join(name.encode("utf-8") for name in self.channels)
+		size = HEADER.size + len(names)
+		size += -size % 8
+		self.file = open(path, "wb")
+		self.file.write(HEADER.pack(MAGIC, VERSION, len(self.channels), time.time(), size))
+		self.file.write(names.ljust(size - HEADER.size, b"\0"))
+		self.start = time.monotonic()
+		self.last_flush = self.start
+
+	def append(self, values, now=None):
+		# values: dict canal -> número; o que faltar vira NaN
+		if now is None:
+			now = time.monotonic()
+		ms = max(0, int((now - self.start) * 1000))
+		self.file.write(self.record.pack(ms, *(values.get(name, math.nan) for name in self.channels)))
+		self.count += 1
+
+		if now - self.last_flush >= self.flush_interval:
+			self.file.flush()
+			self.last_flush = now
+
+	def close(self):
+		self.file.close()
+
+class Recording:
+	def __init__(self, path):
+		self.path = path
+		self.file = open(path, "rb")
+		try:
+			self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+		except ValueError:
+			self.file.close()
+			raise ValueError("empty recording")
+
+		try:
+			magic, version, count, started, size = HEADER.unpack_from(self.map, 0)
+		except struct.error:
+			self.close()
+			raise ValueError("not a recording")
+		if magic != MAGIC or version != VERSION:
+			self.close()
+			raise ValueError("not a recording")
+
+		names = self.map[HEADER.size:size].rstrip(b"\0")
+		self.channels = tuple(name.decode("utf-8") for name in names.split(b"\0")) if count else ()
+		self.started = started
+		self.width = count + 1
+
+		# registro incompleto no final (gravação interrompida) é ignorado
+		record = 4 * self.width
+		self.count = (len(self.map) - size) // record
+		self.view = memoryview(self.map)[size:size + self.count * record]
+
+		if sys.byteorder != "little":
+			self.close()
+			raise ValueError("recordings are little-endian")
+
+		# colunas sem cópia: a mesma memória vista como uint32 e float32,
+		# cada coluna é uma fatia com passo = largura do registro
+		self.ints = self.view.cast("I")
+		self.floats = self.view.cast("f")
+		self.times = self.ints[0::self.width]
+		self.columns = {
+			name: self.floats[i + 1::self.width]
+			for i, name in enumerate(self.channels)
+		}
+
+	def __len__(self):
+		return self.count
+
+	def duration(self):
+		if not self.count:
+			return 0.0
+		return self.times[-1] / 1000
+
+	def row(self, i):
+		return {name: column[i] for name, column in self.columns.items()}
+
+	def index_at(self, ms):
+		# primeiro registro depois de ms
+		return bisect.bisect_right(self.times, ms)
+
+	def close(self):
+		# as views precisam ser liberadas antes do mmap, das fatias para a base
+		views = list(getattr(self, "columns", {}).values())
+		views += [getattr(self, name, None) for name in ("times", "ints", "floats", "view")]
+		for view in views:
+			if view is not None:
+				view.release()
+		self.columns = {}
+		self.map.close()
+		self.file.close()
+
+def new_path(folder):
+	os.makedirs(folder, exist_ok=True)
+	name = time.strftime("bench-%Y%m%d-%H%M%S") + EXTENSION
+	return os.path.join(folder, name)
@@ -0,0 +1,65 @@
+from collections import namedtuple
+
+from collector import COUNTER_WRAP, NetRates, counter_delta
+
+# contadores e estado das placas no formato do psutil (snetio, snicstats)
+
+netio = namedtuple("netio", "bytes_sent bytes_recv packets_sent packets_recv errin errout dropin dropout")
+nicstats = namedtuple("nicstats", "isup duplex speed mtu flags")
+
+UP = nicstats(True, 2, 1000, 1500, "up,broadcast,running,multicast")
+
+def counters(sent, recv, packets=0):
+	return netio(sent, recv, packets, packets, 0, 0, 0, 0)
+
+def test_delta_counts_up():
+	assert counter_delta(1500, 1000) == 500
+
+def test_delta_wraps_at_32_bits():
+	assert counter_delta(500, COUNTER_WRAP - 1000) == 1500
+
+def test_delta_after_reset_starts_from_zero():
+	# placa reiniciada: o salto de volta seria quase 4 GiB, não é uma volta
+	assert counter_delta(100, 10_000_000) == 100
+	# contador de 64 bits não dá a volta em 2^32
+	assert counter_delta(100, COUNTER_WRAP + 5000) == 100
+
+def test_net_rates_across_a_wrap():
+	rates = NetRates()
+	rates.update({"eth0": counters(COUNTER_WRAP - 1000, 5000)}, {"eth0": UP}, 10.0)
+	rate = rates.update({"eth0": counters(1000, 7000)}, {"eth0": UP}, 12.0)["eth0"]
+	assert rate.sent == 1000
+	assert rate.recv == 1000
+
+def test_net_rates_after_a_reset():
+	rates = NetRates()
+	rates.update({"eth0": counters(50_000_000, 50_000_000)}, {"eth0": UP}, 10.0)
+	rate = rates.update({"eth0": counters(2000, 4000)}, {"eth0": UP}, 11.0)["eth0"]
+	assert rate.sent == 2000
+	assert rate.recv == 4000
+
+def test_interface_that_appears_needs_two_samples():
+	rates = NetRates()
+	stats = {"eth0": UP, "wlan0": UP}
+	rates.update({"eth0": counters(1000, 1000)}, stats, 10.0)
+	second = rates.update({"eth0": counters(2000, 2000), "wlan0": counters(500, 500)}, stats, 11.0)
+	assert set(second) == {"eth0"}
+	third = rates.update({"eth0": counters(3000, 3000), "wlan0": counters(1500, 2500)}, stats, 12.0)
+	assert third["wlan0"].sent == 1000
+	assert third["wlan0"].recv == 2000
+
+def test_interface_that_disappears_is_dropped():
+	rates = NetRates()
+	stats = {"eth0": UP, "usb0": UP}
+	rates.update({"eth0": counters(1000, 1000), "usb0": counters(1000, 1000)}, stats, 10.0)
+	second = rates.update({"eth0": counters(2000, 2000)}, {"eth0": UP}, 11.0)
+	assert set(second) == {"eth0"}
+	# volta com o contador zerado: sem taxa até a próxima amostra
+	third = rates.update({"eth0": counters(3000, 3000), "usb0": counters(10, 10)}, stats, 12.0)
+	assert set(third) == {"eth0"}
+
+def test_down_and_loopback_interfaces_are_skipped():
+	rates = NetRates()
+	stats = {"lo": UP._replace(flags="up,loopback,running"), "eth1": UP._replace(isup=False)}
+	rates.update({"lo": counters(1000, 1000), "eth1": counters(1000, 1000)}, stats, 10.0)
+	assert rates.update({"lo": counters(2000, 2000), "eth1": counters(2000, 2000)}, stats, 11.0) == {}
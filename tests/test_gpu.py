@@ -0,0 +1,125 @@
+from collections import Counter, namedtuple
+from types import SimpleNamespace
+
+import gpu
+from gpu import GPUSampler
+
+# pynvml falso: o CI não tem placa de vídeo. Conta cada chamada por (função, handle)
+
+class NVMLError(Exception):
+	pass
+
+class NVMLError_NotSupported(NVMLError):
+	pass
+
+utilization = namedtuple("utilization", "gpu memory")
+memory = namedtuple("memory", "total used free")
+
+def fake_nvml(count=2, unsupported=(), init_error=None):
+	calls = Counter()
+
+	def metric(name, value):
+		def read(handle, *args):
+			calls[name, handle] += 1
+			if name in unsupported:
+				raise NVMLError_NotSupported()
+			return value
+		return read
+
+	def init():
+		calls["init"] += 1
+		if init_error is not None:
+			raise init_error
+
+	nvml = SimpleNamespace(
+		calls=calls,
+		NVML_TEMPERATURE_GPU=0,
+		NVML_CLOCK_GRAPHICS=0,
+		NVML_CLOCK_MEM=2,
+		nvmlInit=init,
+		nvmlShutdown=lambda: None,
+		nvmlSystemGetDriverVersion=lambda: b"550.54",
+		nvmlDeviceGetCount=lambda: count,
+		nvmlDeviceGetHandleByIndex=lambda i: i,
+		nvmlDeviceGetName=lambda h: f"Fake GPU {h}",
+		nvmlDeviceGetUUID=lambda h: f"GPU-{h}",
+		nvmlDeviceGetEnforcedPowerLimit=lambda h: 300000,
+		nvmlDeviceGetDisplayActive=lambda h: h == 0,
+		nvmlDeviceGetUtilizationRates=metric("utilization", utilization(50, 20)),
+		nvmlDeviceGetMemoryInfo=metric("memory", memory(8 * 1024**3, 2 * 1024**3, 6 * 1024**3)),
+		nvmlDeviceGetTemperature=metric("temperature", 65),
+		nvmlDeviceGetPowerUsage=metric("power", 150000),
+		nvmlDeviceGetFanSpeed=metric("fan", 40),
+		nvmlDeviceGetClockInfo=metric("clock", 1800),
+	)
+	return nvml
+
+class FakeGPUtil:
+	def __init__(self):
+		self.calls = 0
+
+	def getGPUs(self):
+		self.calls += 1
+		return [SimpleNamespace(name="Radeon", uuid="r0", load=0.5, memoryUsed=1024, memoryTotal=8192, temperature=55)]
+
+def test_sample_reads_every_gpu_in_one_pass():
+	nvml = fake_nvml(count=3)
+	sampler = GPUSampler(nvml=nvml)
+	assert sampler.available()
+	assert nvml.calls["init"] == 1
+
+	samples = sampler.sample()
+
+	assert [s.index for s in samples] == [0, 1, 2]
+	assert [s.name for s in samples] == ["Fake GPU 0", "Fake GPU 1", "Fake GPU 2"]
+	assert samples[0].driver == "550.54"
+	assert samples[1].load == 50
+	assert samples[1].memory_used == 2048
+	assert samples[2].power == 150
+	assert samples[0].display_active and not samples[1].display_active
+	# uma leitura de cada métrica por placa (o clock é lido duas vezes: núcleo e memória)
+	for handle in range(3):
+		for name in ("utilization", "memory", "temperature", "power", "fan"):
+			assert nvml.calls[name, handle] == 1
+		assert nvml.calls["clock", handle] == 2
+	# sem nvmlInit de novo a cada amostra
+	sampler.sample()
+	assert nvml.calls["init"] == 1
+
+def test_unsupported_metric_is_not_queried_again():
+	nvml = fake_nvml(count=2, unsupported=("fan",))
+	sampler = GPUSampler(nvml=nvml)
+
+	first = sampler.sample()
+	for _ in range(4):
+		later = sampler.sample()
+
+	assert first[0].fan is None and later[1].fan is None
+	assert nvml.calls["fan", 0] == 1
+	assert nvml.calls["fan", 1] == 1
+	# as outras métricas continuam sendo lidas a cada amostra
+	assert nvml.calls["temperature", 0] == 5
+	assert later[0].temperature == 65
+
+def test_gputil_fallback_runs_at_the_low_rate(monkeypatch):
+	clock = {"now": 1000.0}
+	monkeypatch.setattr(gpu.time, "monotonic", lambda: clock["now"])
+	nvml = fake_nvml(init_error=NVMLError("Driver Not Loaded"))
+	gputil = FakeGPUtil()
+	sampler = GPUSampler(nvml=nvml, gputil=gputil)
+	assert not sampler.available()
+
+	samples = sampler.sample()
+	assert gputil.calls == 1
+	assert samples[0].name == "Radeon" and samples[0].load == 50
+
+	# ticks de 1 s dentro dos 10 s: devolve a última leitura sem chamar o GPUtil
+	for _ in range(9):
+		clock["now"] += 1.0
+		assert sampler.sample() == samples
+	assert gputil.calls == 1
+
+	clock["now"] += 1.0
+	sampler.sample()
+	assert gputil.calls == 2
+	assert sampler.fallback_interval == 10.0
@@ -0,0 +1,60 @@
+import threading
+import time
+from types import SimpleNamespace
+
+from inventory import Inventory
+
+# provider falso: cada consulta demora, para as threads se sobreporem
+
+class SlowProvider:
+	name = "slow"
+
+	def __init__(self, delay=0.2):
+		self.delay = delay
+		self.calls = []
+		self.active = 0
+		self.overlap = 0
+		self.lock = threading.Lock()
+
+	def query(self, kind):
+		with self.lock:
+			self.calls.append(kind)
+			self.active += 1
+			self.overlap = max(self.overlap, self.active)
+		time.sleep(self.delay)
+		with self.lock:
+			self.active -= 1
+		return [SimpleNamespace(Name=kind)]
+
+	def invalidate(self):
+		pass
+
+def run_threads(fn, args):
+	threads = [threading.Thread(target=fn, args=(arg,)) for arg in args]
+	for thread in threads:
+		thread.start()
+	for thread in threads:
+		thread.join()
+
+def test_different_kinds_are_queried_in_parallel(tmp_path):
+	provider = SlowProvider()
+	inventory = Inventory(provider, str(tmp_path / "inventory.json"))
+	run_threads(inventory.query, ["processor", "memory", "disks"])
+	assert provider.overlap == 3
+	assert sorted(inventory.classes) == ["disks", "memory", "processor"]
+
+def test_same_kind_is_queried_once(tmp_path):
+	provider = SlowProvider()
+	inventory = Inventory(provider, str(tmp_path / "inventory.json"))
+	run_threads(inventory.query, ["memory"] * 4)
+	assert provider.calls == ["memory"]
+	assert inventory.query("memory")[0].Name == "memory"
+
+def test_saved_classes_are_loaded(tmp_path):
+	path = str(tmp_path / "inventory.json")
+	run_threads(Inventory(SlowProvider(0), path).query, ["processor", "memory"])
+	provider = SlowProvider(0)
+	inventory = Inventory(provider, path)
+	assert inventory.query("processor")[0].Name == "processor"
+	assert inventory.query("memory")[0].Name == "memory"
+	assert provider.calls == []
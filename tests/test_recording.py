@@ -0,0 +1,85 @@
+import math
+import struct
+
+import pytest
+
+from recording import HEADER, MAGIC, VERSION, Recorder, Recording
+
+# arquivos gravados pelo próprio Recorder e relidos pelo Recording
+
+CHANNELS = ("cpu", "mem", "disk:sda:read")
+
+def record(path, rows, channels=CHANNELS):
+	recorder = Recorder(str(path), channels)
+	for now, values in rows:
+		recorder.append(values, recorder.start + now)
+	recorder.close()
+	return str(path)
+
+def test_round_trip(tmp_path):
+	path = record(tmp_path / "a.pchrec", [
+		(0.0, {"cpu": 12.5, "mem": 40.0, "disk:sda:read": 1024.0}),
+		(1.0, {"cpu": 50.0, "mem": 41.0, "disk:sda:read": 0.0}),
+		(2.5, {"cpu": 99.0, "mem": 42.0, "disk:sda:read": 2048.0}),
+	])
+	rec = Recording(path)
+	try:
+		assert rec.channels == CHANNELS
+		assert len(rec) == 3
+		assert list(rec.times) == [0, 1000, 2500]
+		assert rec.duration() == 2.5
+		assert list(rec.columns["cpu"]) == [12.5, 50.0, 99.0]
+		assert rec.row(2) == {"cpu": 99.0, "mem": 42.0, "disk:sda:read": 2048.0}
+		assert rec.index_at(1000) == 2
+	finally:
+		rec.close()
+
+def test_missing_channels_are_nan(tmp_path):
+	path = record(tmp_path / "a.pchrec", [(0.0, {"cpu": 1.0}), (1.0, {"mem": 2.0})])
+	rec = Recording(path)
+	try:
+		assert math.isnan(rec.row(0)["mem"])
+		assert math.isnan(rec.row(0)["disk:sda:read"])
+		assert math.isnan(rec.row(1)["cpu"])
+		assert rec.row(1)["mem"] == 2.0
+	finally:
+		rec.close()
+
+def test_recording_without_samples(tmp_path):
+	rec = Recording(record(tmp_path / "a.pchrec", []))
+	try:
+		assert rec.channels == CHANNELS
+		assert len(rec) == 0
+		assert rec.duration() == 0.0
+		assert rec.index_at(0) == 0
+	finally:
+		rec.close()
+
+def test_interrupted_record_is_ignored(tmp_path):
+	path = record(tmp_path / "a.pchrec", [(0.0, {"cpu": 1.0}), (1.0, {"cpu": 2.0})])
+	with open(path, "ab") as f:
+		f.write(b"\1\2\3")
+	rec = Recording(path)
+	try:
+		assert len(rec) == 2
+	finally:
+		rec.close()
+
+def test_empty_file(tmp_path):
+	path = tmp_path / "a.pchrec"
+	path.write_bytes(b"")
+	with pytest.raises(ValueError):
+		Recording(str(path))
+
+@pytest.mark.parametrize("magic, version", [(b"NOTREC\0\0", VERSION), (MAGIC, VERSION + 1)])
+def test_bad_magic_or_version(tmp_path, magic, version):
+	path = tmp_path / "a.pchrec"
+	path.write_bytes(HEADER.pack(magic, version, 0, 0.0, HEADER.size))
+	with pytest.raises(ValueError):
+		Recording(str(path))
+
+def test_truncated_header(tmp_path):
+	path = tmp_path / "a.pchrec"
+	path.write_bytes(MAGIC + struct.pack("<H", VERSION))
+	with pytest.raises(ValueError):
+		Recording(str(path))